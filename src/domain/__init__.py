@@ -3,26 +3,45 @@
 このモジュールは純粋なドメインロジックを提供し、外部依存を持たない。
 """
 
-from .capture import CaptureRecord
+from .capture import CaptureRecord, CaptureRow, from_jsonl_lines
 from .features import (
+    AppAccumulator,
     AppRank,
     AppSummary,
     AppUsage,
+    EncodedFeatures,
     Features,
+    FeaturesAccumulator,
     FeaturesMeta,
+    FirstSeenCounter,
     GlobalKeywords,
+    KeywordCounter,
     TimeBlock,
+    TimeBlockAccumulator,
 )
+from .session import Session, SessionBuilder, SessionState
 
 __all__ = [
     # capture.py
     "CaptureRecord",
+    "CaptureRow",
+    "from_jsonl_lines",
     # features.py
     "AppRank",
     "AppSummary",
     "AppUsage",
+    "EncodedFeatures",
     "Features",
     "FeaturesMeta",
     "GlobalKeywords",
     "TimeBlock",
+    "FeaturesAccumulator",
+    "TimeBlockAccumulator",
+    "AppAccumulator",
+    "FirstSeenCounter",
+    "KeywordCounter",
+    # session.py
+    "Session",
+    "SessionBuilder",
+    "SessionState",
 ]
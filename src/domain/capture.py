@@ -1,12 +1,17 @@
 """CaptureRecord エンティティ - raw.jsonl用のドメインモデル.
 
 キャプチャログの不変性を保証し、ビジネスルールを実装する。
+
+大量のレコードを扱う集計処理向けに、検証を行わない軽量な CaptureRow と
+JSONL の一括変換 from_jsonl_lines() も提供する。検証は取り込み時
+（validate=True / CaptureRow.to_record()）にのみ行う。
 """
 
 from __future__ import annotations
 
+import json
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any, Iterable, Iterator, NamedTuple
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -167,3 +172,112 @@ class CaptureRecord(BaseModel):
             f"window_title={self.window_title!r}, "
             f"process_name={self.process_name!r})"
         )
+
+    def to_row(self) -> CaptureRow:
+        """検証済みの内容を軽量な CaptureRow に変換."""
+        return CaptureRow(
+            self.ts,
+            self.window_title,
+            self.process_name,
+            self.keywords,
+            self.urls,
+            self.files,
+            self.numbers,
+        )
+
+
+class CaptureRow(NamedTuple):
+    """検証を行わない軽量なキャプチャログレコード（集計のホットパス用）.
+
+    CaptureRecord と同じフィールドを持つ名前付きタプル。生成時に検証・
+    正規化を行わないため、1行ごとに作っても dict とほぼ同じコストで済む。
+    dict と同じ get() を持つので、レコードの dict を受け取る集計処理
+    （FeaturesAccumulator など）にそのまま渡せる。
+
+    Attributes:
+        ts: ISO 8601形式のタイムスタンプ（未検証、欠損時はNone）
+        window_title: ウィンドウタイトル
+        process_name: プロセス名
+        keywords: 抽出されたキーワードリスト
+        urls: 抽出されたURL/ドメインリスト
+        files: 抽出されたファイルパスリスト
+        numbers: 抽出された数値リスト
+    """
+
+    ts: str | None
+    window_title: str | None
+    process_name: str | None
+    keywords: list[str]
+    urls: list[str]
+    files: list[str]
+    numbers: list[str]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CaptureRow:
+        """raw.jsonl の1行分のdictから検証せずに生成（リスト以外の値は空リスト）.
+
+        Args:
+            data: レコードのdict
+
+        Returns:
+            CaptureRow
+        """
+        get = data.get
+        keywords = get("keywords")
+        urls = get("urls")
+        files = get("files")
+        numbers = get("numbers")
+        return cls(
+            get("ts"),
+            get("window_title"),
+            get("process_name"),
+            keywords if isinstance(keywords, list) else [],
+            urls if isinstance(urls, list) else [],
+            files if isinstance(files, list) else [],
+            numbers if isinstance(numbers, list) else [],
+        )
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """dict.get() と同じ形でフィールドを取得."""
+        return getattr(self, field, default)
+
+    def to_record(self) -> CaptureRecord:
+        """検証・正規化して CaptureRecord に変換.
+
+        Raises:
+            pydantic.ValidationError: 検証エラー
+        """
+        return CaptureRecord.model_validate(self._asdict())
+
+
+def from_jsonl_lines(
+    lines: Iterable[str | bytes], validate: bool = False
+) -> Iterator[CaptureRow]:
+    """JSONLの行を CaptureRow に一括変換（空行は読み飛ばす）.
+
+    Args:
+        lines: JSONLの行（改行の有無は問わない）
+        validate: Trueの場合は CaptureRecord として検証・正規化してから変換する
+            （取り込み時用）。Falseの場合は検証しない（集計時用）
+
+    Yields:
+        CaptureRow
+
+    Raises:
+        ValueError: JSONとして解析できない・オブジェクトでない行、
+            または validate=True で検証エラー（pydantic.ValidationError）
+    """
+    from_dict = CaptureRow.from_dict
+    for line_num, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+
+        data = json.loads(line)
+        if not isinstance(data, dict):
+            raise ValueError(f"Line {line_num} is not a JSON object: {line[:100]!r}")
+
+        if validate:
+            yield CaptureRecord.model_validate(data).to_row()
+        else:
+            yield from_dict(data)
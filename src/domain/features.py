@@ -5,11 +5,18 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
+import sys
 from datetime import date, datetime
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Any, TypeVar
 
 from pydantic import BaseModel, Field, field_validator
+from pydantic_core import to_json
+
+from .session import Session, SessionBuilder
 
 
 class AppRank(str, Enum):
@@ -335,6 +342,7 @@ class Features(BaseModel):
         time_blocks: 時間ブロック別サマリ
         app_summary: アプリケーション別サマリ
         global_keywords: グローバル頻出特徴量
+        sessions: セッション（連続する同一ウィンドウの作業、開始時刻順）
     """
 
     meta: Annotated[
@@ -362,6 +370,13 @@ class Features(BaseModel):
             description="グローバル頻出特徴量",
         ),
     ]
+    sessions: Annotated[
+        list[Session],
+        Field(
+            default_factory=list,
+            description="セッション（開始時刻順）",
+        ),
+    ]
 
     model_config = {
         "frozen": True,  # 集計後は変更不可
@@ -389,6 +404,19 @@ class Features(BaseModel):
         """アクティブ時間（時間単位）を計算."""
         return round(self.meta.total_duration_min / 60.0, 1)
 
+    def encode(self, compact: bool = False) -> EncodedFeatures:
+        """JSONのバイト列に1回だけエンコードする.
+
+        保存・LLM入力・キャッシュキーはこの結果を共有し、再エンコードしない。
+
+        Args:
+            compact: Trueの場合はインデントなし（デフォルト: インデント2スペース）
+
+        Returns:
+            EncodedFeatures
+        """
+        return EncodedFeatures(self, compact=compact)
+
     def get_apps_by_rank(self, rank: AppRank) -> list[AppSummary]:
         """指定ランクのアプリをフィルタリング.
 
@@ -415,3 +443,683 @@ class Features(BaseModel):
             f"time_blocks={len(self.time_blocks)}, "
             f"app_summary={len(self.app_summary)})"
         )
+
+
+class EncodedFeatures:
+    """JSONにエンコード済みの Features（features.json の内容）.
+
+    中間のdictを作らずに pydantic-core で直接バイト列に変換する。
+    同じバイト列を features.json の保存・LLM入力・キャッシュキーに使う。
+
+    Attributes:
+        features: エンコード元の Features
+        compact: インデントなしでエンコードしたか
+        data: UTF-8のJSONバイト列（非ASCII文字はエスケープしない）
+    """
+
+    __slots__ = ("features", "compact", "data", "_cache_key")
+
+    def __init__(self, features: Features, compact: bool = False) -> None:
+        self.features = features
+        self.compact = compact
+        self.data: bytes = to_json(features, indent=None if compact else 2)
+        self._cache_key: str | None = None
+
+    @property
+    def cache_key(self) -> str:
+        """エンコード結果のSHA-256（同じ内容・同じ形式なら同じキー）.
+
+        集計のたびに変わる生成時刻（meta.generated_at）は除いてハッシュするため、
+        同じログを集計し直しても同じキーになる。
+        """
+        if self._cache_key is None:
+            # meta は先頭のフィールドなので、最初に現れる生成時刻の値がそれにあたる
+            generated_at = to_json(self.features.meta.generated_at)
+            start = self.data.find(generated_at)
+            digest = hashlib.sha256()
+            if start < 0:
+                digest.update(self.data)
+            else:
+                view = memoryview(self.data)
+                digest.update(view[:start])
+                digest.update(view[start + len(generated_at) :])
+            self._cache_key = digest.hexdigest()
+        return self._cache_key
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON互換のdictに変換（呼び出しごとに新しいdict）."""
+        data: dict[str, Any] = json.loads(self.data)
+        return data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+# ---------------------------------------------------------------------------
+# 集計の中間状態（Features を確定する前の結合可能な生カウンタ）
+# ---------------------------------------------------------------------------
+
+# 解析済みタイムスタンプ: (UNIX時刻, UTCオフセット秒)
+EpochTs = tuple[float, int]
+
+_CounterT = TypeVar("_CounterT", bound="FirstSeenCounter")
+
+
+# 値のリストを集計キー付きにしたもの: [(レコード内の位置, 集計キー, 表記), ...]
+KeyedValues = list[tuple[int, str, str]]
+
+# 表記 -> 小文字化・intern 済みの集計キー（上限に達したら作り直す）
+_LOWER_KEY_CACHE: dict[str, str] = {}
+_LOWER_KEY_CACHE_MAX = 65536
+
+
+def _lower_key(value: str) -> str:
+    """大文字小文字を無視する集計キー（異なる表記ごとに1回だけ小文字化する）."""
+    key = _LOWER_KEY_CACHE.get(value)
+    if key is None:
+        if len(_LOWER_KEY_CACHE) >= _LOWER_KEY_CACHE_MAX:
+            _LOWER_KEY_CACHE.clear()
+        key = _LOWER_KEY_CACHE[value] = sys.intern(value.lower())
+    return key
+
+
+def _rank_key(entry: list[Any]) -> tuple[Any, ...]:
+    """順位の比較キー: 出現回数の降順、同数は (初出時刻, レコード番号, 位置, 表記) の昇順."""
+    return (-entry[0], entry[1], entry[2], entry[3], entry[4])
+
+
+class FirstSeenCounter:
+    """出現回数と初出位置を保持するカウンタ.
+
+    同数の値は初出位置（時刻, レコード番号, レコード内の位置）の早い順に並ぶ。
+    レコード番号はレコードの読み込み順の番号で、同じ時刻のレコードはファイル内の
+    順序で比べる（merge_keywords と同じく先に書かれた表記・値が優先される）。
+    カウントは和、初出位置（と表記）は最小値で結合するため merge() は結合的かつ
+    可換で、時間・日・PC単位のどの分割で集計しても結合結果は同じになる
+    （ただし別々に集計した状態の間ではレコード番号に順序の意味はない）。
+
+    seen_at を省略した場合は add()/update() の呼び出し順を初出時刻として扱う
+    （時刻付きの取り込みと混在させない）。
+
+    capacity を指定すると上位K件の近似集計（Misra-Gries）になる。異なる値が
+    capacity の2倍を超えるまでは正確に数え、超えたら (capacity+1) 番目の出現回数を
+    全件から差し引いて0以下の値を捨てる。保持する値は高々 capacity の2倍で、
+    出現回数が全体の 1/(capacity+1) を超える値は必ず残る。出現回数は最大で
+    「総出現回数/(capacity+1)」だけ少なく数えられるが、残った値同士の順位は保たれる。
+    この場合 merge() の結果は結合順によって変わりうる。
+
+    Attributes:
+        capacity: 近似集計で保持する上位件数（Noneの場合は全件を正確に集計）
+    """
+
+    __slots__ = ("_entries", "_seq", "capacity")
+
+    def __init__(self, capacity: int | None = None) -> None:
+        """
+        Args:
+            capacity: 近似集計で保持する上位件数（Noneの場合は全件を正確に集計）
+
+        Raises:
+            ValueError: capacity が1未満
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"capacity must be at least 1: {capacity}")
+        # キー -> [出現回数, 初出時刻, 初出レコード番号, 初出位置, 表記]
+        self._entries: dict[str, list[Any]] = {}
+        self._seq = 0
+        self.capacity = capacity
+
+    @staticmethod
+    def _key(value: str) -> str:
+        """集計キー（同一視する値は同じキーになる）."""
+        return value
+
+    def add(
+        self,
+        value: str,
+        seen_at: float | None = None,
+        order: int = 0,
+        position: int = 0,
+        count: int = 1,
+    ) -> None:
+        """値を1件（count件）取り込む.
+
+        Args:
+            value: 値
+            seen_at: 出現時刻（UNIX時刻）。Noneの場合は呼び出し順
+            order: レコード番号（読み込み順）
+            position: レコード内の位置
+            count: 加算する回数
+        """
+        if seen_at is None:
+            seen_at = self._seq
+            self._seq += 1
+        self._add(self._key(value), value, seen_at, order, position, count)
+
+    def update(self, values: Any, seen_at: float | None = None, order: int = 0) -> None:
+        """値のリストを取り込む（リスト以外・空の値は無視）.
+
+        Args:
+            values: 値のリスト
+            seen_at: 出現時刻（UNIX時刻）。Noneの場合は呼び出し順
+            order: レコード番号（読み込み順）
+        """
+        self.update_keyed(self.keyed(values), seen_at, order)
+
+    @classmethod
+    def keyed(cls, values: Any) -> KeyedValues:
+        """値のリストに集計キーを付ける（リスト以外・空の値は除く）.
+
+        同じレコードの値を複数のカウンタ（時間ブロック別・アプリ別・全体）に
+        取り込む場合に、集計キーの計算を1回で済ませるために使う。
+
+        Args:
+            values: 値のリスト
+
+        Returns:
+            [(レコード内の位置, 集計キー, 表記), ...]
+        """
+        if not isinstance(values, list):
+            return []
+        key_of = cls._key
+        return [
+            (position, key_of(value), value)
+            for position, value in enumerate(values)
+            if value
+        ]
+
+    def update_keyed(
+        self, keyed: KeyedValues, seen_at: float | None = None, order: int = 0
+    ) -> None:
+        """keyed() で集計キーを付けた値のリストを取り込む.
+
+        Args:
+            keyed: keyed() の出力（同じ集計キーの規則のカウンタで作ったもの）
+            seen_at: 出現時刻（UNIX時刻）。Noneの場合は呼び出し順
+            order: レコード番号（読み込み順）
+        """
+        if seen_at is None:
+            seen_at = self._seq
+            self._seq += 1
+
+        if self.capacity is not None:
+            for position, key, value in keyed:
+                self._add(key, value, seen_at, order, position, 1)
+            return
+
+        # 正確な集計ではホットパスのため _add() を展開する
+        entries = self._entries
+        for position, key, value in keyed:
+            entry = entries.get(key)
+            if entry is None:
+                entries[key] = [1, seen_at, order, position, value]
+                continue
+            entry[0] += 1
+            if seen_at <= entry[1] and (seen_at, order, position, value) < (
+                entry[1],
+                entry[2],
+                entry[3],
+                entry[4],
+            ):
+                entry[1:] = seen_at, order, position, value
+
+    def _add(
+        self,
+        key: str,
+        value: str,
+        seen_at: float,
+        order: int,
+        position: int,
+        count: int,
+    ) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = [count, seen_at, order, position, value]
+            if self.capacity is not None and len(self._entries) > 2 * self.capacity:
+                self._compact()
+            return
+        entry[0] += count
+        # 時刻順に取り込む場合は比較の大半が1つ目の条件で終わる
+        if seen_at <= entry[1] and (seen_at, order, position, value) < (
+            entry[1],
+            entry[2],
+            entry[3],
+            entry[4],
+        ):
+            entry[1:] = seen_at, order, position, value
+
+    def _compact(self) -> None:
+        """(capacity+1) 番目の出現回数を全件から差し引き、0以下の値を捨てる."""
+        assert self.capacity is not None
+        counts = heapq.nlargest(
+            self.capacity + 1, (entry[0] for entry in self._entries.values())
+        )
+        threshold = counts[-1]
+        entries = {}
+        for key, entry in self._entries.items():
+            if entry[0] > threshold:
+                entry[0] -= threshold
+                entries[key] = entry
+        self._entries = entries
+
+    def merge(self, other: FirstSeenCounter) -> None:
+        """別のカウンタを加算する（other は変更しない）.
+
+        Args:
+            other: 加算するカウンタ
+        """
+        for key, (count, seen_at, order, position, value) in other._entries.items():
+            self._add(key, value, seen_at, order, position, count)
+
+    def ranked(self, limit: int | None = None) -> list[tuple[str, int]]:
+        """(表記, 出現回数) を出現回数の降順（同数は初出順）で取得.
+
+        Args:
+            limit: 取得する上位件数（Noneの場合は全件）。指定時は全件をソートせず
+                ヒープで上位のみを選ぶ（結果は全件ソートの先頭と同じ）
+        """
+        key = _rank_key
+        if limit is None:
+            entries = sorted(self._entries.values(), key=key)
+        else:
+            entries = heapq.nsmallest(limit, self._entries.values(), key=key)
+        return [(entry[4], entry[0]) for entry in entries]
+
+    def most_common(self, limit: int | None = None) -> list[str]:
+        """出現回数の降順（同数は初出順）のユニークな表記リストを取得.
+
+        Args:
+            limit: 取得する上位件数（Noneの場合は全件）
+        """
+        return [value for value, _ in self.ranked(limit)]
+
+    def total(self) -> int:
+        """出現回数の合計（近似集計では差し引いた分だけ少ない）."""
+        return sum(entry[0] for entry in self._entries.values())
+
+    def to_pairs(self) -> list[list[Any]]:
+        """集計状態を [表記, 出現回数, 初出時刻, 初出レコード番号, 初出位置] のリストとして取得."""
+        return [
+            [value, count, seen_at, order, position]
+            for count, seen_at, order, position, value in self._entries.values()
+        ]
+
+    @classmethod
+    def from_pairs(
+        cls: type[_CounterT], pairs: list[list[Any]], capacity: int | None = None
+    ) -> _CounterT:
+        """to_pairs() の出力から集計状態を復元.
+
+        Args:
+            pairs: to_pairs() の出力
+            capacity: 近似集計で保持する上位件数（Noneの場合は全件を正確に集計）
+        """
+        counter = cls(capacity)
+        for value, count, seen_at, order, position in pairs:
+            counter._add(cls._key(value), value, seen_at, order, position, count)
+        return counter
+
+    def __contains__(self, value: object) -> bool:
+        """値（と同じ集計キーの値）を集計済みか."""
+        return isinstance(value, str) and self._key(value) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class KeywordCounter(FirstSeenCounter):
+    """大文字小文字を無視してキーワードを集計するカウンタ.
+
+    小文字化してカウントし、最初に出現した表記を保持する。
+    小文字化したキーは表記ごとにキャッシュ・intern するため、同じ表記が
+    何度出現しても小文字化は1回で、辞書の比較も同一オブジェクトで済む。
+
+    Examples:
+        >>> counter = KeywordCounter()
+        >>> counter.update(["Python", "API"])
+        >>> counter.update(["python", "Testing"])
+        >>> counter.most_common()
+        ['Python', 'API', 'Testing']
+    """
+
+    __slots__ = ()
+
+    _key = staticmethod(_lower_key)
+
+    @classmethod
+    def keyed(cls, values: Any) -> KeyedValues:
+        """値のリストに集計キーを付ける（キャッシュを直接引く版）."""
+        if not isinstance(values, list):
+            return []
+        cache = _LOWER_KEY_CACHE
+        return [
+            (position, cache.get(value) or _lower_key(value), value)
+            for position, value in enumerate(values)
+            if value
+        ]
+
+
+class TimeBlockAccumulator:
+    """時間ブロック単位の集計状態.
+
+    Attributes:
+        apps: プロセス名ごとのキャプチャ数
+        keywords: キーワード
+        files: ファイル
+    """
+
+    __slots__ = ("apps", "keywords", "files")
+
+    def __init__(self, keyword_capacity: int | None = None) -> None:
+        self.apps = FirstSeenCounter()
+        self.keywords = KeywordCounter(keyword_capacity)
+        self.files = KeywordCounter(keyword_capacity)
+
+    def add(
+        self, record: dict[str, Any], seen_at: float | None = None, order: int = 0
+    ) -> None:
+        """レコードを1件取り込む."""
+        self.add_keyed(
+            record.get("process_name") or "Unknown",
+            KeywordCounter.keyed(record.get("keywords", [])),
+            KeywordCounter.keyed(record.get("files", [])),
+            seen_at,
+            order,
+        )
+
+    def add_keyed(
+        self,
+        process_name: str,
+        keywords: KeyedValues,
+        files: KeyedValues,
+        seen_at: float | None = None,
+        order: int = 0,
+    ) -> None:
+        """集計キー付きの値でレコードを1件取り込む."""
+        self.apps.add(process_name, seen_at, order)
+        self.keywords.update_keyed(keywords, seen_at, order)
+        self.files.update_keyed(files, seen_at, order)
+
+    def merge(self, other: TimeBlockAccumulator) -> None:
+        """別の集計状態を加算する（other は変更しない）."""
+        self.apps.merge(other.apps)
+        self.keywords.merge(other.keywords)
+        self.files.merge(other.files)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSONシリアライズ可能なdictに変換."""
+        return {
+            "apps": self.apps.to_pairs(),
+            "keywords": self.keywords.to_pairs(),
+            "files": self.files.to_pairs(),
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], keyword_capacity: int | None = None
+    ) -> TimeBlockAccumulator:
+        """to_dict() の出力から復元."""
+        block = cls(keyword_capacity)
+        block.apps = FirstSeenCounter.from_pairs(data["apps"])
+        block.keywords = KeywordCounter.from_pairs(data["keywords"], keyword_capacity)
+        block.files = KeywordCounter.from_pairs(data["files"], keyword_capacity)
+        return block
+
+
+class AppAccumulator:
+    """アプリ（プロセス）単位の集計状態.
+
+    キャプチャ数は FeaturesAccumulator.app_counts が保持する。
+
+    Attributes:
+        keywords: キーワード
+        files: ファイル
+        urls: URL
+    """
+
+    __slots__ = ("keywords", "files", "urls")
+
+    def __init__(self, keyword_capacity: int | None = None) -> None:
+        self.keywords = KeywordCounter(keyword_capacity)
+        self.files = KeywordCounter(keyword_capacity)
+        self.urls = KeywordCounter(keyword_capacity)
+
+    def add(
+        self, record: dict[str, Any], seen_at: float | None = None, order: int = 0
+    ) -> None:
+        """レコードを1件取り込む."""
+        self.add_keyed(
+            KeywordCounter.keyed(record.get("keywords", [])),
+            KeywordCounter.keyed(record.get("files", [])),
+            KeywordCounter.keyed(record.get("urls", [])),
+            seen_at,
+            order,
+        )
+
+    def add_keyed(
+        self,
+        keywords: KeyedValues,
+        files: KeyedValues,
+        urls: KeyedValues,
+        seen_at: float | None = None,
+        order: int = 0,
+    ) -> None:
+        """集計キー付きの値でレコードを1件取り込む."""
+        self.keywords.update_keyed(keywords, seen_at, order)
+        self.files.update_keyed(files, seen_at, order)
+        self.urls.update_keyed(urls, seen_at, order)
+
+    def merge(self, other: AppAccumulator) -> None:
+        """別の集計状態を加算する（other は変更しない）."""
+        self.keywords.merge(other.keywords)
+        self.files.merge(other.files)
+        self.urls.merge(other.urls)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSONシリアライズ可能なdictに変換."""
+        return {
+            "keywords": self.keywords.to_pairs(),
+            "files": self.files.to_pairs(),
+            "urls": self.urls.to_pairs(),
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], keyword_capacity: int | None = None
+    ) -> AppAccumulator:
+        """to_dict() の出力から復元."""
+        app = cls(keyword_capacity)
+        app.keywords = KeywordCounter.from_pairs(data["keywords"], keyword_capacity)
+        app.files = KeywordCounter.from_pairs(data["files"], keyword_capacity)
+        app.urls = KeywordCounter.from_pairs(data["urls"], keyword_capacity)
+        return app
+
+
+class FeaturesAccumulator:
+    """Features を確定する前の結合可能な集計状態.
+
+    時間ブロック別・アプリ別のカウント、キーワード（初出の表記つき）、
+    最初/最後のキャプチャ時刻を生のまま保持する。merge() は結合的かつ可換なので、
+    時間・日・PC単位で分割して集計した状態を、生ログを読み直さずに結合できる。
+    Features への変換（アプリ名の正規化・ランク付け・上位N件の切り出し）は
+    全ての結合が終わった後に集計サービスで行う。
+
+    keyword_capacity を指定すると、キーワード・URL・ファイルのカウンタを上位K件の
+    近似集計（FirstSeenCounter の capacity）にして、高カーディナリティなOCRキーワードを
+    長期間（月次など）集計してもメモリを一定に抑える。session_capacity を指定すると
+    セッション数も同様に制限する（SessionBuilder の capacity）。
+
+    Attributes:
+        block_min: 時間ブロックの長さ（分）
+        keyword_capacity: キーワード類の近似集計で保持する上位件数（Noneの場合は正確に集計）
+        blocks: (開始, 終了) -> 時間ブロックの集計状態
+        app_counts: プロセス名ごとのキャプチャ数
+        apps: プロセス名 -> アプリの集計状態
+        keywords: キーワード
+        urls: URL
+        files: ファイル
+        sessions: セッション（FR-5）
+        capture_count: キャプチャ数
+        first_ts: 最初のキャプチャ時刻（UNIX時刻, UTCオフセット秒）
+        last_ts: 最後のキャプチャ時刻（UNIX時刻, UTCオフセット秒）
+    """
+
+    def __init__(
+        self,
+        block_min: int = 30,
+        keyword_capacity: int | None = None,
+        session_max_gap_sec: float = 300,
+        session_capacity: int | None = None,
+    ) -> None:
+        self.block_min = block_min
+        self.keyword_capacity = keyword_capacity
+        self.blocks: dict[tuple[str, str], TimeBlockAccumulator] = {}
+        self.app_counts = FirstSeenCounter()
+        self.apps: dict[str, AppAccumulator] = {}
+        self.keywords = KeywordCounter(keyword_capacity)
+        self.urls = KeywordCounter(keyword_capacity)
+        self.files = KeywordCounter(keyword_capacity)
+        self.sessions = SessionBuilder(session_max_gap_sec, session_capacity)
+        self.capture_count = 0
+        self.first_ts: EpochTs | None = None
+        self.last_ts: EpochTs | None = None
+
+    def add(self, record: dict[str, Any], ts: EpochTs, block: tuple[str, str]) -> None:
+        """タイムスタンプ解析済みのレコードを1件取り込む.
+
+        Args:
+            record: レコード
+            ts: レコードのタイムスタンプ（UNIX時刻, UTCオフセット秒）
+            block: レコードが属する時間ブロック（開始, 終了）
+        """
+        seen_at = ts[0]
+        # 同時刻のレコードの初出はファイル内の順序で決める
+        order = self.capture_count
+        process_name = record.get("process_name") or "Unknown"
+        # 集計キーは1レコードにつき1回だけ求め、3種類のカウンタで共有する
+        keywords = KeywordCounter.keyed(record.get("keywords", []))
+        urls = KeywordCounter.keyed(record.get("urls", []))
+        files = KeywordCounter.keyed(record.get("files", []))
+
+        block_state = self.blocks.get(block)
+        if block_state is None:
+            block_state = self.blocks[block] = TimeBlockAccumulator(
+                self.keyword_capacity
+            )
+        block_state.add_keyed(process_name, keywords, files, seen_at, order)
+
+        self.app_counts.add(process_name, seen_at, order)
+        app = self.apps.get(process_name)
+        if app is None:
+            app = self.apps[process_name] = AppAccumulator(self.keyword_capacity)
+        app.add_keyed(keywords, files, urls, seen_at, order)
+
+        self.keywords.update_keyed(keywords, seen_at, order)
+        self.urls.update_keyed(urls, seen_at, order)
+        self.files.update_keyed(files, seen_at, order)
+
+        self.sessions.add(record, ts)
+
+        self.capture_count += 1
+        if self.first_ts is None or ts < self.first_ts:
+            self.first_ts = ts
+        if self.last_ts is None or ts > self.last_ts:
+            self.last_ts = ts
+
+    def merge(self, other: FeaturesAccumulator) -> None:
+        """別の集計状態を加算する（other は変更しない）.
+
+        Args:
+            other: 加算する集計状態
+
+        Raises:
+            ValueError: 時間ブロックの長さが異なる
+        """
+        if other.block_min != self.block_min:
+            raise ValueError(
+                f"Cannot merge aggregation states with different block sizes: "
+                f"{self.block_min} != {other.block_min}"
+            )
+
+        for block, other_block in other.blocks.items():
+            block_state = self.blocks.get(block)
+            if block_state is None:
+                block_state = self.blocks[block] = TimeBlockAccumulator(
+                    self.keyword_capacity
+                )
+            block_state.merge(other_block)
+
+        self.app_counts.merge(other.app_counts)
+        for process_name, other_app in other.apps.items():
+            app = self.apps.get(process_name)
+            if app is None:
+                app = self.apps[process_name] = AppAccumulator(self.keyword_capacity)
+            app.merge(other_app)
+
+        self.keywords.merge(other.keywords)
+        self.urls.merge(other.urls)
+        self.files.merge(other.files)
+
+        self.sessions.merge(other.sessions)
+
+        self.capture_count += other.capture_count
+        if other.first_ts is not None and (
+            self.first_ts is None or other.first_ts < self.first_ts
+        ):
+            self.first_ts = other.first_ts
+        if other.last_ts is not None and (
+            self.last_ts is None or other.last_ts > self.last_ts
+        ):
+            self.last_ts = other.last_ts
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSONシリアライズ可能なdictに変換（チェックポイント・プロセス間転送用）."""
+        return {
+            "block_min": self.block_min,
+            "keyword_capacity": self.keyword_capacity,
+            "blocks": [
+                {"start": start, "end": end, **block.to_dict()}
+                for (start, end), block in self.blocks.items()
+            ],
+            "app_counts": self.app_counts.to_pairs(),
+            "apps": [
+                {"process": process_name, **app.to_dict()}
+                for process_name, app in self.apps.items()
+            ],
+            "keywords": self.keywords.to_pairs(),
+            "urls": self.urls.to_pairs(),
+            "files": self.files.to_pairs(),
+            "sessions": self.sessions.to_dict(),
+            "capture_count": self.capture_count,
+            "first_ts": list(self.first_ts) if self.first_ts else None,
+            "last_ts": list(self.last_ts) if self.last_ts else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FeaturesAccumulator:
+        """to_dict() の出力から復元."""
+        capacity = data.get("keyword_capacity")
+        sessions = SessionBuilder.from_dict(data["sessions"])
+        accumulator = cls(
+            block_min=data["block_min"],
+            keyword_capacity=capacity,
+            session_max_gap_sec=sessions.max_gap_sec,
+            session_capacity=sessions.capacity,
+        )
+        accumulator.sessions = sessions
+        for block in data["blocks"]:
+            accumulator.blocks[(block["start"], block["end"])] = (
+                TimeBlockAccumulator.from_dict(block, capacity)
+            )
+        accumulator.app_counts = FirstSeenCounter.from_pairs(data["app_counts"])
+        for app in data["apps"]:
+            accumulator.apps[app["process"]] = AppAccumulator.from_dict(app, capacity)
+        accumulator.keywords = KeywordCounter.from_pairs(data["keywords"], capacity)
+        accumulator.urls = KeywordCounter.from_pairs(data["urls"], capacity)
+        accumulator.files = KeywordCounter.from_pairs(data["files"], capacity)
+        accumulator.capture_count = data["capture_count"]
+        if data["first_ts"] is not None:
+            accumulator.first_ts = tuple(data["first_ts"])
+        if data["last_ts"] is not None:
+            accumulator.last_ts = tuple(data["last_ts"])
+        return accumulator
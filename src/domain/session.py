@@ -0,0 +1,355 @@
+"""Session エンティティ - 連続する同一作業のまとまり（FR-5 セッション化）.
+
+連続する同一 (window_title, process_name) のキャプチャを1つのセッションにまとめる。
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from .features import EpochTs
+
+_TIME_PATTERN = r"^([0-1][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]$"
+
+
+class Session(BaseModel):
+    """features.json に出力するセッション.
+
+    Attributes:
+        app: アプリ表示名
+        process: プロセス名
+        window_title: ウィンドウタイトル（取得不可の場合はNone）
+        start: 開始時刻（最初のキャプチャ時刻）
+        end: 終了時刻（最後のキャプチャ時刻）
+        duration_min: 継続時間（分）。次のセッションの開始まで、
+            最後のセッション・中断の直前は1サンプリング間隔分
+        capture_count: キャプチャ数
+        keywords: キーワード（出現順、上位N件）
+        files: ファイルパス（出現順、上位N件）
+        urls: URL（出現順、上位N件）
+    """
+
+    app: Annotated[
+        str,
+        Field(
+            description="アプリ表示名",
+            examples=["Visual Studio Code"],
+        ),
+    ]
+    process: Annotated[
+        str,
+        Field(
+            description="プロセス名",
+            examples=["Code.exe"],
+        ),
+    ]
+    window_title: Annotated[
+        str | None,
+        Field(
+            default=None,
+            description="ウィンドウタイトル",
+            examples=["main.py - project - Visual Studio Code"],
+        ),
+    ]
+    start: Annotated[
+        str,
+        Field(
+            description="開始時刻（HH:MM:SS）",
+            pattern=_TIME_PATTERN,
+            examples=["09:00:00"],
+        ),
+    ]
+    end: Annotated[
+        str,
+        Field(
+            description="終了時刻（HH:MM:SS）",
+            pattern=_TIME_PATTERN,
+            examples=["09:14:00"],
+        ),
+    ]
+    duration_min: Annotated[
+        float,
+        Field(
+            description="継続時間（分）",
+            ge=0.0,
+            examples=[16.0],
+        ),
+    ]
+    capture_count: Annotated[
+        int,
+        Field(
+            description="キャプチャ数",
+            ge=1,
+            examples=[8],
+        ),
+    ]
+    keywords: Annotated[
+        list[str],
+        Field(
+            default_factory=list,
+            description="キーワード（出現順）",
+        ),
+    ]
+    files: Annotated[
+        list[str],
+        Field(
+            default_factory=list,
+            description="ファイルパス（出現順）",
+        ),
+    ]
+    urls: Annotated[
+        list[str],
+        Field(
+            default_factory=list,
+            description="URL（出現順）",
+        ),
+    ]
+
+    model_config = {
+        "frozen": True,
+    }
+
+    def __str__(self) -> str:
+        """人間が読みやすい文字列表現."""
+        return f"[{self.start}-{self.end}] {self.app} ({self.duration_min}分)"
+
+
+class SessionState:
+    """確定前のセッション（集計の中間状態）.
+
+    キーワード等は CaptureRecord.merge_features と同じく、出現順を保って
+    重複を除いた和集合として保持する。
+
+    Attributes:
+        process_name: プロセス名（Noneの場合は "Unknown"）
+        window_title: ウィンドウタイトル（空の場合はNone）
+        first_ts: 最初のキャプチャ時刻（UNIX時刻, UTCオフセット秒）
+        last_ts: 最後のキャプチャ時刻（UNIX時刻, UTCオフセット秒）
+        capture_count: キャプチャ数
+        keywords: キーワード（出現順の重複なし集合）
+        files: ファイルパス（出現順の重複なし集合）
+        urls: URL（出現順の重複なし集合）
+    """
+
+    __slots__ = (
+        "process_name",
+        "window_title",
+        "first_ts",
+        "last_ts",
+        "capture_count",
+        "keywords",
+        "files",
+        "urls",
+    )
+
+    def __init__(
+        self, process_name: str, window_title: str | None, ts: EpochTs
+    ) -> None:
+        self.process_name = process_name
+        self.window_title = window_title
+        self.first_ts = ts
+        self.last_ts = ts
+        self.capture_count = 0
+        self.keywords: dict[str, None] = {}
+        self.files: dict[str, None] = {}
+        self.urls: dict[str, None] = {}
+
+    @property
+    def key(self) -> tuple[str, str | None]:
+        """セッションの同一性を判定するキー (process_name, window_title)."""
+        return self.process_name, self.window_title
+
+    def add(self, record: dict[str, Any], ts: EpochTs) -> None:
+        """レコードの特徴量を取り込む（リスト以外・空の値は無視）."""
+        self.last_ts = ts
+        self.capture_count += 1
+        for field, values in (
+            (self.keywords, record.get("keywords")),
+            (self.files, record.get("files")),
+            (self.urls, record.get("urls")),
+        ):
+            if isinstance(values, list):
+                for value in values:
+                    if value:
+                        field[value] = None
+
+    def extend(self, other: SessionState) -> None:
+        """直後に続く同一セッションを連結する（other は変更しない）."""
+        self.last_ts = other.last_ts
+        self.capture_count += other.capture_count
+        self.keywords.update(other.keywords)
+        self.files.update(other.files)
+        self.urls.update(other.urls)
+
+    def copy(self) -> SessionState:
+        """複製を作成."""
+        session = SessionState(self.process_name, self.window_title, self.first_ts)
+        session.extend(self)
+        return session
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSONシリアライズ可能なdictに変換."""
+        return {
+            "process": self.process_name,
+            "window_title": self.window_title,
+            "first_ts": list(self.first_ts),
+            "last_ts": list(self.last_ts),
+            "capture_count": self.capture_count,
+            "keywords": list(self.keywords),
+            "files": list(self.files),
+            "urls": list(self.urls),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SessionState:
+        """to_dict() の出力から復元."""
+        session = cls(data["process"], data["window_title"], tuple(data["first_ts"]))
+        session.last_ts = tuple(data["last_ts"])
+        session.capture_count = data["capture_count"]
+        session.keywords = dict.fromkeys(data["keywords"])
+        session.files = dict.fromkeys(data["files"])
+        session.urls = dict.fromkeys(data["urls"])
+        return session
+
+
+class SessionBuilder:
+    """キャプチャを1件ずつ受け取ってセッションを組み立てる（1パス・O(n)）.
+
+    直前のセッションと (process_name, window_title) が同じで、前回のキャプチャから
+    max_gap_sec 以内のキャプチャは直前のセッションに連結する。それ以外
+    （アプリ/ウィンドウの変更、スリープ等による中断、時刻の逆行）は新しい
+    セッションを開始する。
+
+    merge() は開始時刻順に並べてから境界をまたぐ同一セッションを連結するため、
+    時間・日単位に分割して組み立てたセッションを結合できる。
+
+    capacity を指定するとセッション数を制限する。セッションが capacity の2倍を
+    超えたら compact() で capacity 件まで減らし、キャプチャ数の少ない
+    セッションから捨てる（同数なら開始時刻の遅い方）。最初と最後のセッションは
+    後続・先行する分割と連結しうるため常に残す。捨てる対象は確定済みの
+    セッションだけなので、1つのビルダーで組み立てる限り、途中で何度 compact()
+    しても最後に1回だけ compact() した場合と同じセッションが残る。この場合
+    merge() の結果は結合順によって変わりうる。
+
+    Attributes:
+        max_gap_sec: 同一セッションとみなすキャプチャ間隔の上限（秒）
+        capacity: 保持するセッション数の上限（Noneの場合は無制限）
+        sessions: セッション（開始時刻順、最後は連結可能な進行中のセッション）
+    """
+
+    def __init__(self, max_gap_sec: float = 300, capacity: int | None = None) -> None:
+        """
+        Args:
+            max_gap_sec: 同一セッションとみなすキャプチャ間隔の上限（秒）
+            capacity: 保持するセッション数の上限（Noneの場合は無制限）
+
+        Raises:
+            ValueError: capacity が2未満
+        """
+        if capacity is not None and capacity < 2:
+            raise ValueError(f"capacity must be at least 2: {capacity}")
+        self.max_gap_sec = max_gap_sec
+        self.capacity = capacity
+        self.sessions: list[SessionState] = []
+        # 時刻差の比較はマイクロ秒の整数で行う（小数秒の丸め誤差を避ける）
+        self._max_gap_us = round(max_gap_sec * 1_000_000)
+
+    def _continues(self, last_ts: EpochTs, ts: EpochTs) -> bool:
+        """last_ts の次のキャプチャとして ts が同じセッションに続くか."""
+        gap_us = round((ts[0] - last_ts[0]) * 1_000_000)
+        return 0 <= gap_us <= self._max_gap_us
+
+    def add(self, record: dict[str, Any], ts: EpochTs) -> None:
+        """タイムスタンプ解析済みのレコードを1件取り込む.
+
+        Args:
+            record: レコード
+            ts: レコードのタイムスタンプ（UNIX時刻, UTCオフセット秒）
+        """
+        process_name = record.get("process_name") or "Unknown"
+        window_title = record.get("window_title") or None
+
+        current = self.sessions[-1] if self.sessions else None
+        if (
+            current is None
+            or current.process_name != process_name
+            or current.window_title != window_title
+            or not self._continues(current.last_ts, ts)
+        ):
+            current = SessionState(process_name, window_title, ts)
+            self.sessions.append(current)
+            self._compact_if_full()
+        current.add(record, ts)
+
+    def merge(self, other: SessionBuilder) -> None:
+        """別のビルダーのセッションを結合する（other は変更しない）.
+
+        Args:
+            other: 結合するビルダー
+        """
+        combined = sorted(
+            self.sessions + [session.copy() for session in other.sessions],
+            key=lambda session: session.first_ts,
+        )
+        sessions: list[SessionState] = []
+        for session in combined:
+            if (
+                sessions
+                and sessions[-1].key == session.key
+                and self._continues(sessions[-1].last_ts, session.first_ts)
+            ):
+                sessions[-1].extend(session)
+            else:
+                sessions.append(session)
+        self.sessions = sessions
+        self._compact_if_full()
+
+    def _compact_if_full(self) -> None:
+        """セッションが capacity の2倍を超えたら compact() する."""
+        if self.capacity is not None and len(self.sessions) > 2 * self.capacity:
+            self.compact()
+
+    def compact(self) -> None:
+        """セッションを capacity 件まで減らす（capacity が None なら何もしない）.
+
+        最初と最後のセッションを残し、それ以外はキャプチャ数の多い順
+        （同数なら開始時刻の早い順）に残して開始時刻順を保つ。
+        """
+        if self.capacity is None or len(self.sessions) <= self.capacity:
+            return
+        inner = self.sessions[1:-1]
+        kept = {
+            id(session)
+            for session in heapq.nsmallest(
+                self.capacity - 2,
+                inner,
+                key=lambda session: (-session.capture_count, session.first_ts),
+            )
+        }
+        self.sessions = [
+            self.sessions[0],
+            *(session for session in inner if id(session) in kept),
+            self.sessions[-1],
+        ]
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSONシリアライズ可能なdictに変換."""
+        return {
+            "max_gap_sec": self.max_gap_sec,
+            "capacity": self.capacity,
+            "sessions": [session.to_dict() for session in self.sessions],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SessionBuilder:
+        """to_dict() の出力から復元."""
+        builder = cls(max_gap_sec=data["max_gap_sec"], capacity=data["capacity"])
+        builder.sessions = [SessionState.from_dict(s) for s in data["sessions"]]
+        return builder
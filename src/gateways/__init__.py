@@ -1,14 +1,30 @@
 # gateways layer - external API integrations
 
-from .gemini import GeminiGateway, generate_summary_with_fallback
-from .notion import NotionGateway, publish_report
+from .gemini import (
+    AsyncGeminiGateway,
+    GeminiGateway,
+    generate_summary_with_fallback,
+    generate_summary_with_fallback_async,
+)
+from .notion import (
+    AsyncNotionGateway,
+    NotionGateway,
+    publish_report,
+    publish_report_async,
+    publish_reports,
+)
 from .toast import ToastGateway, notify_with_fallback
 
 __all__ = [
+    "AsyncGeminiGateway",
     "GeminiGateway",
     "generate_summary_with_fallback",
+    "generate_summary_with_fallback_async",
+    "AsyncNotionGateway",
     "NotionGateway",
     "publish_report",
+    "publish_report_async",
+    "publish_reports",
     "ToastGateway",
     "notify_with_fallback",
 ]
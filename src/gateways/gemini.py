@@ -6,6 +6,7 @@ features.jsonをLLMで要約し、構造化JSONとして日報を生成。
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import time
@@ -14,6 +15,7 @@ from typing import Any
 
 from google import genai
 from google.genai import types
+from google.genai.client import AsyncClient
 
 from src.domain.report import LLMSummary, MainTask, Insight
 
@@ -42,6 +44,23 @@ SYSTEM_PROMPT = """あなたはPC作業ログから日報を生成するアシ
 """
 
 
+def _generate_config(schema: dict[str, Any]) -> types.GenerateContentConfig:
+    """構造化JSON出力の生成設定
+
+    Args:
+        schema: JSONスキーマ
+
+    Returns:
+        生成設定
+    """
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_json_schema=schema,
+        temperature=0.3,
+        max_output_tokens=1000,
+    )
+
+
 class GeminiGateway:
     """Gemini API連携ゲートウェイ
 
@@ -144,12 +163,7 @@ class GeminiGateway:
                 response = self.client.models.generate_content(
                     model=self.model,
                     contents=prompt,
-                    config=types.GenerateContentConfig(
-                        response_mime_type="application/json",
-                        response_json_schema=schema,
-                        temperature=0.3,
-                        max_output_tokens=1000,
-                    ),
+                    config=_generate_config(schema),
                 )
                 result[0] = response
             except Exception as e:
@@ -178,34 +192,154 @@ class GeminiGateway:
         Returns:
             プロンプト文字列
         """
-        meta = features.get("meta", {})
+        return _build_user_prompt(features)
+
+
+class AsyncGeminiGateway:
+    """Gemini API連携ゲートウェイ（asyncio版）
+
+    google.genai の非同期クライアントを1つ使い回す。タイムアウトした呼び出しは
+    asyncio.wait_for でキャンセルされるため、リトライのたびにスレッドや
+    接続が残ることはない。
+
+    使用後は aclose() でクライアントを閉じる（async with でも可）。
+
+    Attributes:
+        model: 使用モデル名
+        timeout_sec: タイムアウト秒数
+        retry_count: リトライ回数
+        retry_delay_sec: リトライ間隔秒数
+        client: google.genai の AsyncClient
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = "gemini-2.5-flash",
+        timeout_sec: int = 30,
+        retry_count: int = 2,
+        retry_delay_sec: int = 5,
+        client: AsyncClient | None = None,
+    ):
+        """初期化
+
+        Args:
+            api_key: Gemini APIキー（Noneの場合は環境変数から取得）
+            model: 使用モデル名
+            timeout_sec: タイムアウト秒数
+            retry_count: リトライ回数
+            retry_delay_sec: リトライ間隔秒数
+            client: AsyncClientインスタンス（依存性注入。Noneの場合は作成）
+
+        Raises:
+            ValueError: APIキーが設定されていない場合
+        """
+        if client is None:
+            api_key = api_key or os.environ.get("GEMINI_API_KEY")
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY environment variable is required")
+            client = genai.Client(api_key=api_key).aio
+
+        self.model = model
+        self.timeout_sec = timeout_sec
+        self.retry_count = retry_count
+        self.retry_delay_sec = retry_delay_sec
+        self.client = client
+
+    async def __aenter__(self) -> AsyncGeminiGateway:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """クライアントを閉じる"""
+        await self.client.aclose()
+
+    async def generate_summary(self, features: dict[str, Any]) -> LLMSummary:
+        """作業ログから日報サマリーを生成
+
+        各試行は timeout_sec でキャンセルし、前の試行が終わってから次を送る
+        （同時に送信中のリクエストは常に1つ）。
 
-        # 時間帯別作業（上位8件）
-        time_blocks = features.get("time_blocks", [])[:8]
-        time_blocks_text = "\n".join([
+        Args:
+            features: 集計済み作業ログデータ (features.json)
+
+        Returns:
+            LLM生成サマリー
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        full_prompt = f"{SYSTEM_PROMPT}\n\n{_build_user_prompt(features)}"
+        config = _generate_config(LLMSummary.model_json_schema())
+
+        last_error: Exception | None = None
+        for attempt in range(self.retry_count + 1):
+            try:
+                response = await asyncio.wait_for(
+                    self.client.models.generate_content(
+                        model=self.model, contents=full_prompt, config=config
+                    ),
+                    timeout=self.timeout_sec,
+                )
+                return LLMSummary.model_validate_json(response.text)
+            except asyncio.TimeoutError:
+                last_error = TimeoutError(
+                    f"API call timed out after {self.timeout_sec} seconds"
+                )
+            except Exception as e:
+                last_error = e
+
+            if attempt < self.retry_count:
+                await asyncio.sleep(self.retry_delay_sec)
+
+        raise Exception(
+            f"Gemini API call failed after {self.retry_count + 1} attempts: {last_error}"
+        )
+
+
+def _build_user_prompt(features: dict[str, Any]) -> str:
+    """ユーザープロンプトを構築
+
+    Args:
+        features: 集計済み作業ログデータ
+
+    Returns:
+        プロンプト文字列
+    """
+    meta = features.get("meta", {})
+
+    # 時間帯別作業（上位8件）
+    time_blocks = features.get("time_blocks", [])[:8]
+    time_blocks_text = "\n".join(
+        [
             f"- {block['start']}〜{block['end']}: "
             f"{', '.join([app['name'] for app in block.get('apps', [])[:2]])}"
             for block in time_blocks
-        ])
+        ]
+    )
 
-        # アプリ使用状況（上位5件）
-        app_summary = features.get("app_summary", [])[:5]
-        app_text = "\n".join([
+    # アプリ使用状況（上位5件）
+    app_summary = features.get("app_summary", [])[:5]
+    app_text = "\n".join(
+        [
             f"- {app['name']}: {app['duration_min']}分 ({app['rank']})"
             for app in app_summary
-        ])
+        ]
+    )
 
-        # 主なキーワード（上位10件）
-        global_keywords = features.get("global_keywords", {})
-        keywords = global_keywords.get("top_keywords", [])[:10]
-        keywords_text = ", ".join(keywords)
+    # 主なキーワード（上位10件）
+    global_keywords = features.get("global_keywords", {})
+    keywords = global_keywords.get("top_keywords", [])[:10]
+    keywords_text = ", ".join(keywords)
 
-        # 主なファイル（上位10件）
-        global_files = features.get("global_files", {})
-        files = global_files.get("top_files", [])[:10]
-        files_text = "\n".join([f"- {f}" for f in files])
+    # 主なファイル（上位10件）
+    global_files = features.get("global_files", {})
+    files = global_files.get("top_files", [])[:10]
+    files_text = "\n".join([f"- {f}" for f in files])
 
-        return f"""以下は本日の作業ログの要約です。日報を作成してください。
+    return f"""以下は本日の作業ログの要約です。日報を作成してください。
 
 ## 基本情報
 - 日付: {meta.get('date', 'N/A')}
@@ -227,6 +361,21 @@ class GeminiGateway:
 """
 
 
+def _fallback_summary() -> LLMSummary:
+    """LLM呼び出しに失敗した場合のテンプレートサマリー"""
+    return LLMSummary(
+        main_tasks=[
+            MainTask(
+                title="作業記録",
+                description="本日の作業内容は自動要約できませんでした。"
+                "詳細はアプリ使用状況をご確認ください。",
+            )
+        ],
+        insights=[],
+        work_summary="（自動要約に失敗しました）",
+    )
+
+
 def generate_summary_with_fallback(
     features: dict[str, Any],
     api_key: str | None = None,
@@ -247,16 +396,33 @@ def generate_summary_with_fallback(
         summary = gateway.generate_summary(features)
         return summary, True, None
     except Exception as e:
-        error_msg = str(e)
-        fallback_summary = LLMSummary(
-            main_tasks=[
-                MainTask(
-                    title="作業記録",
-                    description="本日の作業内容は自動要約できませんでした。"
-                    "詳細はアプリ使用状況をご確認ください。",
-                )
-            ],
-            insights=[],
-            work_summary="（自動要約に失敗しました）",
-        )
-        return fallback_summary, False, error_msg
+        return _fallback_summary(), False, str(e)
+
+
+async def generate_summary_with_fallback_async(
+    features: dict[str, Any],
+    api_key: str | None = None,
+    gateway: AsyncGeminiGateway | None = None,
+) -> tuple[LLMSummary, bool, str | None]:
+    """フォールバック付きでサマリーを生成（asyncio版）
+
+    LLM呼び出しが失敗した場合、テンプレートサマリーを返す。
+
+    Args:
+        features: 集計済み作業ログデータ
+        api_key: Gemini APIキー（オプション。gateway 指定時は未使用）
+        gateway: AsyncGeminiGatewayインスタンス（複数日の再生成では1つを使い回す。
+            Noneの場合は作成して終了時に閉じる）
+
+    Returns:
+        (サマリー, 成功フラグ, エラーメッセージ)
+    """
+    try:
+        if gateway is not None:
+            summary = await gateway.generate_summary(features)
+        else:
+            async with AsyncGeminiGateway(api_key=api_key) as owned:
+                summary = await owned.generate_summary(features)
+        return summary, True, None
+    except Exception as e:
+        return _fallback_summary(), False, str(e)
@@ -6,21 +6,449 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterator, Mapping, Sequence, TypeVar
 
-from notion_client import Client
+import httpx
+from notion_client import AsyncClient, Client
 from notion_client.errors import APIResponseError
 
 from src.domain.report import Report
+from src.repositories.page_map import PageMapRepository, PageRef
+from src.utils.block_diff import BlockDiff, diff_blocks
+from src.utils.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-class NotionGateway:
+# Notion API の平均レート制限（リクエスト/秒）
+NOTION_REQUESTS_PER_SEC = 3
+
+# レート制限（HTTP 429）で Retry-After ヘッダーがない場合の待機秒数
+RATE_LIMIT_WAIT_SEC = 60
+
+# 全ゲートウェイ・全メソッドで共有するレート制限（rate_limiter 未指定時）
+_shared_rate_limiter = TokenBucket(rate=NOTION_REQUESTS_PER_SEC)
+
+# ブロック削除の同時実行数のデフォルト（Notionの平均レート制限は約3リクエスト/秒）
+DEFAULT_DELETE_CONCURRENCY = 3
+
+# publish_reports() で並行して出力する日報数のデフォルト
+DEFAULT_PUBLISH_WORKERS = 3
+
+# 1回のリクエストで送れる子ブロック数の上限（Notion API の制限）
+MAX_CHILDREN_PER_REQUEST = 100
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """レート制限（HTTP 429）によるエラーか"""
+    return isinstance(error, APIResponseError) and error.status == 429
+
+
+def _is_not_found(error: Exception) -> bool:
+    """ページ・ブロックが存在しない（削除済み・権限なし）エラーか"""
+    return isinstance(error, APIResponseError) and (
+        error.status == 404 or getattr(error, "code", None) == "object_not_found"
+    )
+
+
+def _is_archived(error: Exception) -> bool:
+    """アーカイブ済み（ゴミ箱）のページ・ブロックを編集しようとしたエラーか
+
+    Notion はアーカイブ済みのページの更新を 400 validation_error で拒否する。
+    """
+    return (
+        isinstance(error, APIResponseError)
+        and error.status == 400
+        and getattr(error, "code", None) == "validation_error"
+        and "archived" in str(error).lower()
+    )
+
+
+def _page_ref(page: dict[str, Any]) -> PageRef:
+    """APIのページデータから参照を作成"""
+    return PageRef(page["id"], page["url"])
+
+
+def _page_date(page: dict[str, Any]) -> str | None:
+    """APIのページデータから「日付」プロパティ (YYYY-MM-DD) を取得"""
+    date = page.get("properties", {}).get("日付", {}).get("date") or {}
+    start = date.get("start")
+    return start[:10] if isinstance(start, str) else None
+
+
+def _date_range_filter(start: str | None, end: str | None) -> dict[str, Any]:
+    """「日付」プロパティの範囲フィルタ（両方Noneの場合は日付のある全ページ）"""
+    conditions: list[dict[str, Any]] = []
+    if start is not None:
+        conditions.append({"property": "日付", "date": {"on_or_after": start}})
+    if end is not None:
+        conditions.append({"property": "日付", "date": {"on_or_before": end}})
+    if not conditions:
+        return {"property": "日付", "date": {"is_not_empty": True}}
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"and": conditions}
+
+
+def _chunk_blocks(
+    blocks: list[dict[str, Any]], size: int = MAX_CHILDREN_PER_REQUEST
+) -> list[list[dict[str, Any]]]:
+    """ブロックリストを1回のリクエストで送れる数ずつに分割（順序は保持）"""
+    return [blocks[i : i + size] for i in range(0, len(blocks), size)]
+
+
+def _next_cursor(response: dict[str, Any]) -> str | None:
+    """ページネーションの次のカーソル（最後のページの場合はNone）"""
+    if not response.get("has_more"):
+        return None
+    return response["next_cursor"]
+
+
+def _retry_after_sec(error: Exception) -> float:
+    """レート制限エラーの Retry-After ヘッダーから待機秒数を取得
+
+    Args:
+        error: レート制限エラー
+
+    Returns:
+        待機秒数（ヘッダーがない・解析できない場合は RATE_LIMIT_WAIT_SEC）
+    """
+    headers = getattr(error, "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return float(RATE_LIMIT_WAIT_SEC)
+
+
+class _AppendPlan:
+    """ブロック追加のチャンク分割と挿入位置の引き継ぎ
+
+    チャンクごとのリクエスト引数を順番に返し、応答を受け取るたびに次の
+    チャンクの挿入位置（after）を今回追加した最後のブロックにする。
+    """
+
+    def __init__(
+        self, page_id: str, blocks: list[dict[str, Any]], after: str | None
+    ) -> None:
+        self.page_id = page_id
+        self.blocks = blocks
+        self.after = after
+        self.chunks = _chunk_blocks(blocks)
+        self.results: list[dict[str, Any]] = []
+        self.sent = 0
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for chunk in self.chunks:
+            self.sent += 1
+            kwargs: dict[str, Any] = {"block_id": self.page_id, "children": chunk}
+            if self.after is not None:
+                kwargs["after"] = self.after
+            yield kwargs
+
+    def add(self, response: dict[str, Any]) -> None:
+        """追加したチャンクの応答を記録"""
+        added = response["results"]
+        self.results.extend(added)
+        # 途中への挿入は、次のチャンクを今回追加した最後のブロックの直後に続ける
+        if self.after is not None and added:
+            self.after = added[-1]["id"]
+
+    def log_failure(self) -> None:
+        logger.error(
+            f"Appended {len(self.results)}/{len(self.blocks)} blocks before "
+            f"chunk {self.sent}/{len(self.chunks)} failed"
+        )
+
+    def finish(self) -> list[dict[str, Any]]:
+        """追加されたブロックリスト"""
+        logger.info(
+            f"Appended {len(self.results)} new blocks in {len(self.chunks)} requests"
+        )
+        return self.results
+
+
+class _NotionGatewayBase:
+    """NotionGateway / AsyncNotionGateway の共通処理
+
+    リクエスト引数の組み立て、応答の解釈、リトライの判断、page_map の管理など
+    通信を伴わない処理をまとめる。API呼び出しと待機は各サブクラスが行う。
+
+    Attributes:
+        token: Notion Integration Token
+        database_id: 日報データベースID
+        retry_count: リトライ回数
+        retry_delay_sec: リトライ間隔秒数
+        delete_concurrency: ブロック削除の同時実行数
+        rate_limiter: API呼び出しのレート制限
+        page_map: 日付 → ページの対応表
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        database_id: str | None = None,
+        retry_count: int = 3,
+        retry_delay_sec: int = 5,
+        delete_concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        rate_limiter: TokenBucket | None = None,
+        page_map: PageMapRepository | None = None,
+    ):
+        """初期化
+
+        Args:
+            token: Notion Integration Token（Noneの場合は環境変数から取得）
+            database_id: データベースID（Noneの場合は環境変数から取得）
+            retry_count: リトライ回数
+            retry_delay_sec: リトライ間隔秒数
+            delete_concurrency: ブロック削除の同時実行数
+            rate_limiter: API呼び出しのレート制限（Noneの場合は全ゲートウェイで
+                共有する約3リクエスト/秒の制限）
+            page_map: 日付 → ページの対応表（Noneの場合は毎回データベースを検索）
+
+        Raises:
+            ValueError: トークンまたはデータベースIDが設定されていない場合、
+                delete_concurrency が1未満の場合
+        """
+        self.token = token or os.environ.get("NOTION_TOKEN")
+        if not self.token:
+            raise ValueError("NOTION_TOKEN environment variable is required")
+
+        self.database_id = database_id or os.environ.get("NOTION_DATABASE_ID")
+        if not self.database_id:
+            raise ValueError("NOTION_DATABASE_ID environment variable is required")
+
+        if delete_concurrency < 1:
+            raise ValueError(f"delete_concurrency must be >= 1: {delete_concurrency}")
+
+        self.retry_count = retry_count
+        self.retry_delay_sec = retry_delay_sec
+        self.delete_concurrency = delete_concurrency
+        self.rate_limiter = rate_limiter or _shared_rate_limiter
+        self.page_map = page_map
+
+    # リトライの判断
+
+    def _retry_wait(self, action: str, attempt: int, error: Exception) -> float | None:
+        """失敗したAPI呼び出しを再試行するまでの待機秒数を決める
+
+        レート制限（HTTP 429）の場合は共有のレート制限を Retry-After の間止める
+        （待機は次のトークン取得時に行うため0を返す）。
+
+        Args:
+            action: ログ用の処理名
+            attempt: 失敗した試行の番号（0始まり）
+            error: 発生したエラー
+
+        Returns:
+            待機秒数。再試行しても結果が変わらないエラー（存在しない・
+            アーカイブ済みのページ）の場合はNone
+        """
+        if _is_not_found(error) or _is_archived(error):
+            return None
+        if _is_rate_limited(error):
+            wait_sec = _retry_after_sec(error)
+            logger.warning(f"Rate limited, retrying after {wait_sec} seconds...")
+            self.rate_limiter.pause(wait_sec)
+            return 0.0
+        if attempt < self.retry_count:
+            logger.warning(
+                f"{action} failed "
+                f"(attempt {attempt + 1}/{self.retry_count + 1}): {error}"
+            )
+            return float(self.retry_delay_sec)
+        return 0.0
+
+    def _retry_exhausted(self, action: str, error: Exception | None) -> Exception:
+        """全てのリトライが失敗した場合の例外"""
+        return Exception(
+            f"Notion {action.lower()} failed after {self.retry_count + 1} attempts: "
+            f"{error}"
+        )
+
+    def _delete_retry_wait(
+        self, pending: list[str], failures: dict[str, Exception], attempt: int
+    ) -> float:
+        """削除に失敗したブロックを再度削除するまでの待機秒数を決める
+
+        レート制限を含む場合は共有のレート制限を Retry-After の最大値の間止め、
+        0を返す（待機は次のトークン取得時に行う）。
+
+        Args:
+            pending: 削除に失敗したブロックID
+            failures: ブロックID → エラー
+            attempt: 失敗したラウンドの番号（0始まり）
+
+        Returns:
+            待機秒数
+        """
+        rate_limits = [
+            _retry_after_sec(e) for e in failures.values() if _is_rate_limited(e)
+        ]
+        wait_sec = max(rate_limits) if rate_limits else self.retry_delay_sec
+        logger.warning(
+            f"Delete {len(pending)} blocks failed "
+            f"(attempt {attempt + 1}/{self.retry_count + 1}), "
+            f"retrying in {wait_sec} seconds..."
+        )
+        if rate_limits:
+            self.rate_limiter.pause(wait_sec)
+            return 0.0
+        return float(wait_sec)
+
+    @staticmethod
+    def _log_delete_failures(
+        pending: list[str], failures: dict[str, Exception]
+    ) -> None:
+        for block_id in pending:
+            logger.error(f"Failed to delete block {block_id}: {failures[block_id]}")
+
+    # リクエスト引数・応答
+
+    def _query_by_date_kwargs(self, date: str) -> dict[str, Any]:
+        return {
+            "database_id": self.database_id,
+            "filter": {"property": "日付", "date": {"equals": date}},
+        }
+
+    @staticmethod
+    def _first_page(date: str, response: dict[str, Any]) -> dict[str, Any] | None:
+        """日付検索の応答から最初のページを取得"""
+        if response["results"]:
+            logger.info(f"Found existing page for date: {date}")
+            return response["results"][0]
+
+        logger.info(f"No existing page found for date: {date}")
+        return None
+
+    def _query_pages_kwargs(
+        self, start: str | None, end: str | None, cursor: str | None
+    ) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {
+            "database_id": self.database_id,
+            "filter": _date_range_filter(start, end),
+            "page_size": 100,
+        }
+        if cursor is not None:
+            kwargs["start_cursor"] = cursor
+        return kwargs
+
+    @staticmethod
+    def _collect_pages(
+        pages: dict[str, dict[str, Any]], response: dict[str, Any]
+    ) -> str | None:
+        """範囲検索の応答のページを日付ごとに追加し、次のカーソルを返す
+
+        Returns:
+            次のカーソル（最後のページの場合はNone）
+        """
+        for page in response["results"]:
+            date = _page_date(page)
+            if date is not None:
+                pages.setdefault(date, page)
+        return _next_cursor(response)
+
+    @staticmethod
+    def _list_blocks_kwargs(page_id: str, cursor: str | None) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {"block_id": page_id}
+        if cursor is not None:
+            kwargs["start_cursor"] = cursor
+        return kwargs
+
+    def _create_page_kwargs(
+        self, properties: dict[str, Any], children: list[dict[str, Any]]
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """ページ作成の引数と、作成後に追加する残りのブロック
+
+        1回のリクエストで送れない分はページ作成後に追加する。
+        """
+        kwargs = {
+            "parent": {"database_id": self.database_id},
+            "properties": properties,
+            "children": children[:MAX_CHILDREN_PER_REQUEST],
+        }
+        return kwargs, children[MAX_CHILDREN_PER_REQUEST:]
+
+    @staticmethod
+    def _update_block_kwargs(block_id: str, block: dict[str, Any]) -> dict[str, Any]:
+        block_type = block["type"]
+        return {"block_id": block_id, block_type: block[block_type]}
+
+    # page_map
+
+    def _record_scan(
+        self, start: str | None, end: str | None, found: dict[str, dict[str, Any]]
+    ) -> dict[str, PageRef]:
+        """範囲検索の結果を page_map に反映
+
+        検索結果をその範囲の正とし、範囲内で見つからなかった日付の記録は削除する。
+        """
+        pages = {date: _page_ref(page) for date, page in found.items()}
+        if self.page_map is not None:
+            self.page_map.update(pages)
+            self.page_map.remove(
+                *(
+                    date
+                    for date in self.page_map.dates()
+                    if (start is None or date >= start)
+                    and (end is None or date <= end)
+                    and date not in pages
+                )
+            )
+        return pages
+
+    def _cached_page(self, date: str) -> PageRef | None:
+        if self.page_map is None:
+            return None
+        return self.page_map.get(date)
+
+    def _should_refind(self, date: str, cached: bool, error: Exception) -> bool:
+        """更新に失敗した記録済みのページを破棄して検索し直すか
+
+        記録したページが削除・アーカイブされていた場合は記録を破棄してTrue。
+        """
+        if not (cached and (_is_not_found(error) or _is_archived(error))):
+            return False
+        logger.warning(
+            f"Cached page for {date} was deleted or archived, searching database"
+        )
+        self.forget_page(date)
+        return True
+
+    def remember_page(self, date: str, page: dict[str, Any]) -> None:
+        """作成・検索したページを page_map に記録
+
+        Args:
+            date: 日付 (YYYY-MM-DD)
+            page: APIのページデータ
+        """
+        if self.page_map is not None:
+            self.page_map.set(date, page["id"], page["url"])
+
+    def forget_page(self, date: str) -> bool:
+        """page_map から日付の記録を削除
+
+        Args:
+            date: 日付 (YYYY-MM-DD)
+
+        Returns:
+            記録があった場合はTrue
+        """
+        if self.page_map is None or date not in self.page_map:
+            return False
+        self.page_map.remove(date)
+        return True
+
+
+class NotionGateway(_NotionGatewayBase):
     """Notion API連携ゲートウェイ
 
     Attributes:
@@ -28,14 +456,493 @@ class NotionGateway:
         database_id: 日報データベースID
         retry_count: リトライ回数
         retry_delay_sec: リトライ間隔秒数
+        delete_concurrency: ブロック削除の同時実行数（1の場合は逐次）
+        rate_limiter: API呼び出しのレート制限
+        page_map: 日付 → ページの対応表
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        database_id: str | None = None,
+        retry_count: int = 3,
+        retry_delay_sec: int = 5,
+        delete_concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        rate_limiter: TokenBucket | None = None,
+        page_map: PageMapRepository | None = None,
+    ):
+        """初期化
+
+        Args:
+            token: Notion Integration Token（Noneの場合は環境変数から取得）
+            database_id: データベースID（Noneの場合は環境変数から取得）
+            retry_count: リトライ回数
+            retry_delay_sec: リトライ間隔秒数
+            delete_concurrency: ブロック削除の同時実行数（1の場合は逐次）
+            rate_limiter: API呼び出しのレート制限（Noneの場合は全ゲートウェイで
+                共有する約3リクエスト/秒の制限）
+            page_map: 日付 → ページの対応表（Noneの場合は毎回データベースを検索）
+
+        Raises:
+            ValueError: トークンまたはデータベースIDが設定されていない場合、
+                delete_concurrency が1未満の場合
+        """
+        super().__init__(
+            token=token,
+            database_id=database_id,
+            retry_count=retry_count,
+            retry_delay_sec=retry_delay_sec,
+            delete_concurrency=delete_concurrency,
+            rate_limiter=rate_limiter,
+            page_map=page_map,
+        )
+        self.client = Client(auth=self.token)
+
+    def _request(self, action: str, call: Callable[[], T]) -> T:
+        """API呼び出しをリトライ付きで実行
+
+        Args:
+            action: ログ・エラーメッセージ用の処理名
+            call: API呼び出し
+
+        Returns:
+            API呼び出しの結果
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        last_error: Exception | None = None
+        for attempt in range(self.retry_count + 1):
+            try:
+                self.rate_limiter.acquire()
+                return call()
+            except Exception as e:
+                last_error = e
+                wait_sec = self._retry_wait(action, attempt, e)
+                if wait_sec is None:
+                    raise
+                if wait_sec:
+                    time.sleep(wait_sec)
+
+        raise self._retry_exhausted(action, last_error)
+
+    def query_page_by_date(self, date: str) -> dict[str, Any] | None:
+        """指定日付のページを検索
+
+        Args:
+            date: 検索対象日付 (YYYY-MM-DD)
+
+        Returns:
+            ページデータ（存在しない場合はNone）
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        response = self._request(
+            "Query",
+            functools.partial(
+                self.client.databases.query, **self._query_by_date_kwargs(date)
+            ),
+        )
+        return self._first_page(date, response)
+
+    def query_pages(
+        self, start: str | None = None, end: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """日付範囲のページをまとめて検索（ページネーション対応）
+
+        Args:
+            start: 開始日 (YYYY-MM-DD、Noneの場合は制限なし)
+            end: 終了日 (YYYY-MM-DD、Noneの場合は制限なし)
+
+        Returns:
+            日付 → ページデータ（同じ日付のページが複数ある場合は最初のページ）
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        pages: dict[str, dict[str, Any]] = {}
+        cursor: str | None = None
+        while True:
+            response = self._request(
+                "Query",
+                functools.partial(
+                    self.client.databases.query,
+                    **self._query_pages_kwargs(start, end, cursor),
+                ),
+            )
+            cursor = self._collect_pages(pages, response)
+            if cursor is None:
+                break
+
+        logger.info(f"Found {len(pages)} pages between {start} and {end}")
+        return pages
+
+    def scan_pages(
+        self, start: str | None = None, end: str | None = None
+    ) -> dict[str, PageRef]:
+        """日付範囲のページを検索して page_map に記録
+
+        検索結果をその範囲の正とし、範囲内で見つからなかった日付の記録は削除する。
+
+        Args:
+            start: 開始日 (YYYY-MM-DD、Noneの場合は制限なし)
+            end: 終了日 (YYYY-MM-DD、Noneの場合は制限なし)
+
+        Returns:
+            日付 → ページの参照
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        return self._record_scan(start, end, self.query_pages(start, end))
+
+    def find_page(self, date: str, lookup: bool = True) -> PageRef | None:
+        """日付のページを取得（page_map に記録があれば検索しない）
+
+        Args:
+            date: 日付 (YYYY-MM-DD)
+            lookup: page_map に記録がない場合にデータベースを検索するか
+
+        Returns:
+            ページの参照（存在しない場合はNone）
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        cached = self._cached_page(date)
+        if cached is not None or not lookup:
+            return cached
+
+        page = self.query_page_by_date(date)
+        if page is None:
+            return None
+        self.remember_page(date, page)
+        return _page_ref(page)
+
+    def create_page(
+        self, properties: dict[str, Any], children: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """新規ページ作成
+
+        Args:
+            properties: ページプロパティ
+            children: ページ本文ブロック
+
+        Returns:
+            作成されたページデータ
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        kwargs, rest = self._create_page_kwargs(properties, children)
+        response = self._request(
+            "Create", functools.partial(self.client.pages.create, **kwargs)
+        )
+        logger.info(f"Created new page: {response['id']}")
+        if rest:
+            self.append_blocks(response["id"], rest)
+        return response
+
+    def update_page(
+        self, page_id: str, properties: dict[str, Any]
+    ) -> dict[str, Any]:
+        """ページプロパティ更新
+
+        Args:
+            page_id: ページID
+            properties: 更新するプロパティ
+
+        Returns:
+            更新されたページデータ
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        response = self._request(
+            "Update",
+            functools.partial(
+                self.client.pages.update, page_id=page_id, properties=properties
+            ),
+        )
+        logger.info(f"Updated page properties: {page_id}")
+        return response
+
+    def list_blocks(self, page_id: str) -> list[dict[str, Any]]:
+        """ページの子ブロックを全件取得（ページネーション対応）
+
+        Args:
+            page_id: ページID
+
+        Returns:
+            子ブロックリスト
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        blocks: list[dict[str, Any]] = []
+        cursor: str | None = None
+        while True:
+            response = self._request(
+                "List blocks",
+                functools.partial(
+                    self.client.blocks.children.list,
+                    **self._list_blocks_kwargs(page_id, cursor),
+                ),
+            )
+            blocks.extend(response["results"])
+            cursor = _next_cursor(response)
+            if cursor is None:
+                return blocks
+
+    def append_blocks(
+        self,
+        page_id: str,
+        blocks: list[dict[str, Any]],
+        after: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """ページにブロックを追加
+
+        MAX_CHILDREN_PER_REQUEST 件ずつに分割し、順番に追加する。
+        リトライは失敗したチャンクだけを対象にする（追加済みのチャンクは再送しない）。
+
+        Args:
+            page_id: ページID
+            blocks: 追加するブロックリスト
+            after: このブロックの直後に挿入（Noneの場合は末尾に追加）
+
+        Returns:
+            追加されたブロックリスト
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        plan = _AppendPlan(page_id, blocks, after)
+        for kwargs in plan:
+            try:
+                response = self._request(
+                    "Append blocks",
+                    functools.partial(self.client.blocks.children.append, **kwargs),
+                )
+            except Exception:
+                plan.log_failure()
+                raise
+            plan.add(response)
+        return plan.finish()
+
+    def update_block(self, block_id: str, block: dict[str, Any]) -> dict[str, Any]:
+        """ブロックの内容を更新（同じ種別のブロックのみ）
+
+        Args:
+            block_id: ブロックID
+            block: 新しい内容のブロック
+
+        Returns:
+            更新されたブロック
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        return self._request(
+            "Update block",
+            functools.partial(
+                self.client.blocks.update, **self._update_block_kwargs(block_id, block)
+            ),
+        )
+
+    def _delete_round(self, block_ids: list[str]) -> dict[str, Exception]:
+        """ブロックを1回ずつ削除（最大 delete_concurrency 件を並行）
+
+        Args:
+            block_ids: 削除するブロックID
+
+        Returns:
+            削除に失敗したブロックID → エラー
+        """
+
+        def delete(block_id: str) -> Exception | None:
+            try:
+                self.rate_limiter.acquire()
+                self.client.blocks.delete(block_id=block_id)
+                return None
+            except Exception as e:
+                return e
+
+        workers = min(self.delete_concurrency, len(block_ids))
+        if workers <= 1:
+            results = [delete(block_id) for block_id in block_ids]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(delete, block_ids))
+
+        return {
+            block_id: error
+            for block_id, error in zip(block_ids, results)
+            if error is not None
+        }
+
+    def delete_blocks(self, block_ids: list[str]) -> list[str]:
+        """ブロックを削除（失敗したブロックはまとめてリトライ）
+
+        全ブロックを並行して削除し、失敗したブロックだけを次のラウンドで再度削除する。
+        待機はラウンドごとに1回（レート制限時は Retry-After の間レート制限ごと停止）。
+
+        Args:
+            block_ids: 削除するブロックID
+
+        Returns:
+            全てのリトライで削除できなかったブロックID
+        """
+        pending = list(block_ids)
+        failures: dict[str, Exception] = {}
+        for attempt in range(self.retry_count + 1):
+            if not pending:
+                break
+            failures = self._delete_round(pending)
+            pending = [block_id for block_id in pending if block_id in failures]
+            if pending and attempt < self.retry_count:
+                wait_sec = self._delete_retry_wait(pending, failures, attempt)
+                if wait_sec:
+                    time.sleep(wait_sec)
+
+        self._log_delete_failures(pending, failures)
+        return pending
+
+    def replace_blocks(
+        self, page_id: str, blocks: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """ページのブロックを置換
+
+        既存ブロックを削除してから新規ブロックを追加する。
+
+        Args:
+            page_id: ページID
+            blocks: 新規ブロックリスト
+
+        Returns:
+            追加されたブロックリスト
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        # 1. 既存ブロック取得
+        existing_blocks = self.list_blocks(page_id)
+
+        # 2. 既存ブロック削除（削除失敗は継続して新規ブロックを追加する）
+        block_ids = [block["id"] for block in existing_blocks]
+        failed = self.delete_blocks(block_ids)
+
+        logger.info(f"Deleted {len(block_ids) - len(failed)} existing blocks")
+
+        # 3. 新規ブロック追加
+        return self.append_blocks(page_id, blocks)
+
+    def update_blocks(self, page_id: str, blocks: list[dict[str, Any]]) -> BlockDiff:
+        """ページのブロックを差分更新
+
+        既存ブロックと比較し、変更があったブロックだけを更新・削除・挿入する。
+
+        Args:
+            page_id: ページID
+            blocks: 新規ブロックリスト
+
+        Returns:
+            適用した差分
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        diff = diff_blocks(self.list_blocks(page_id), blocks)
+
+        self.delete_blocks(diff.deletes)
+        for block_id, block in diff.updates:
+            self.update_block(block_id, block)
+        for after, children in diff.inserts:
+            self.append_blocks(page_id, children, after=after)
+
+        logger.info(f"Updated blocks of page {page_id}: {diff}")
+        return diff
+
+    def publish_page(
+        self,
+        date: str,
+        properties: dict[str, Any],
+        blocks: list[dict[str, Any]],
+        lookup: bool = True,
+    ) -> PageRef:
+        """日付のページを更新（存在しない場合は作成）
+
+        page_map に記録したページが削除・アーカイブされていた場合は、記録を
+        破棄してデータベースを検索し直す（見つからなければ作成）。
+
+        Args:
+            date: 日付 (YYYY-MM-DD)
+            properties: ページプロパティ
+            blocks: ページ本文ブロック
+            lookup: page_map に記録がない場合にデータベースを検索するか
+                （Falseの場合は作成。scan_pages() 済みの日付向け）
+
+        Returns:
+            ページの参照
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        cached = self._cached_page(date) is not None
+        page = self.find_page(date, lookup=lookup)
+        if page is not None:
+            try:
+                self.update_page(page.id, properties)
+            except APIResponseError as e:
+                if not self._should_refind(date, cached, e):
+                    raise
+                page = self.find_page(date)
+                if page is not None:
+                    self.update_page(page.id, properties)
+
+        if page is None:
+            created = self.create_page(properties, blocks)
+            self.remember_page(date, created)
+            logger.info(f"Created new page: {created['url']}")
+            return _page_ref(created)
+
+        self.update_blocks(page.id, blocks)
+        logger.info(f"Updated existing page: {page.url}")
+        return page
+
+
+class AsyncNotionGateway(_NotionGatewayBase):
+    """Notion API連携ゲートウェイ（asyncio版）
+
+    1つの httpx.AsyncClient の接続プールを全リクエストで共有する。
+    複数の日報を並行して出力する場合は、1つのインスタンスを使い回す。
+
+    使用後は aclose() で接続プールを閉じる（async with でも可）。
+
+    Attributes:
+        token: Notion Integration Token
+        database_id: 日報データベースID
+        retry_count: リトライ回数
+        retry_delay_sec: リトライ間隔秒数
+        delete_concurrency: ブロック削除の同時実行数（インスタンス全体で共有）
+        rate_limiter: API呼び出しのレート制限
+        page_map: 日付 → ページの対応表
+        client: notion_client.AsyncClient
     """
 
+    DEFAULT_MAX_CONNECTIONS = 10
+
     def __init__(
         self,
         token: str | None = None,
         database_id: str | None = None,
         retry_count: int = 3,
         retry_delay_sec: int = 5,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        delete_concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        rate_limiter: TokenBucket | None = None,
+        page_map: PageMapRepository | None = None,
+        client: AsyncClient | None = None,
     ):
         """初期化
 
@@ -44,79 +951,171 @@ class NotionGateway:
             database_id: データベースID（Noneの場合は環境変数から取得）
             retry_count: リトライ回数
             retry_delay_sec: リトライ間隔秒数
+            max_connections: 接続プールの最大接続数
+            delete_concurrency: ブロック削除の同時実行数
+            rate_limiter: API呼び出しのレート制限（Noneの場合は全ゲートウェイで
+                共有する約3リクエスト/秒の制限）
+            page_map: 日付 → ページの対応表（Noneの場合は毎回データベースを検索）
+            client: AsyncClientインスタンス（依存性注入。Noneの場合は作成）
 
         Raises:
-            ValueError: トークンまたはデータベースIDが設定されていない場合
+            ValueError: トークンまたはデータベースIDが設定されていない場合、
+                delete_concurrency が1未満の場合
         """
-        self.token = token or os.environ.get("NOTION_TOKEN")
-        if not self.token:
-            raise ValueError("NOTION_TOKEN environment variable is required")
+        super().__init__(
+            token=token,
+            database_id=database_id,
+            retry_count=retry_count,
+            retry_delay_sec=retry_delay_sec,
+            delete_concurrency=delete_concurrency,
+            rate_limiter=rate_limiter,
+            page_map=page_map,
+        )
+        # 並行する publish_report_async 全体で削除の同時実行数を制限する
+        self._delete_slots = asyncio.Semaphore(delete_concurrency)
+        if client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                )
+            )
+            client = AsyncClient(auth=self.token, client=http_client)
+        self.client = client
 
-        self.database_id = database_id or os.environ.get("NOTION_DATABASE_ID")
-        if not self.database_id:
-            raise ValueError("NOTION_DATABASE_ID environment variable is required")
+    async def __aenter__(self) -> AsyncNotionGateway:
+        return self
 
-        self.retry_count = retry_count
-        self.retry_delay_sec = retry_delay_sec
-        self.client = Client(auth=self.token)
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
-    def query_page_by_date(self, date: str) -> dict[str, Any] | None:
-        """指定日付のページを検索
+    async def aclose(self) -> None:
+        """接続プールを閉じる"""
+        await self.client.aclose()
+
+    async def _request(self, action: str, call: Callable[[], Awaitable[T]]) -> T:
+        """API呼び出しをリトライ付きで実行
 
         Args:
-            date: 検索対象日付 (YYYY-MM-DD)
+            action: ログ・エラーメッセージ用の処理名
+            call: API呼び出し（呼び出すたびに新しいコルーチンを返す）
 
         Returns:
-            ページデータ（存在しない場合はNone）
+            API呼び出しの結果
 
         Raises:
             Exception: API呼び出しが全てのリトライで失敗した場合
         """
-        last_error = None
+        last_error: Exception | None = None
         for attempt in range(self.retry_count + 1):
             try:
-                response = self.client.databases.query(
-                    database_id=self.database_id,
-                    filter={"property": "日付", "date": {"equals": date}},
-                )
+                await self.rate_limiter.acquire_async()
+                return await call()
+            except Exception as e:
+                last_error = e
+                wait_sec = self._retry_wait(action, attempt, e)
+                if wait_sec is None:
+                    raise
+                if wait_sec:
+                    await asyncio.sleep(wait_sec)
 
-                if response["results"]:
-                    logger.info(f"Found existing page for date: {date}")
-                    return response["results"][0]
+        raise self._retry_exhausted(action, last_error)
 
-                logger.info(f"No existing page found for date: {date}")
-                return None
+    async def query_page_by_date(self, date: str) -> dict[str, Any] | None:
+        """指定日付のページを検索
 
-            except APIResponseError as e:
-                last_error = e
-                # レート制限の場合は60秒待機
-                if e.status == 429:
-                    logger.warning(f"Rate limited, waiting 60 seconds...")
-                    time.sleep(60)
-                    continue
-                # その他のエラーは通常のリトライ
-                if attempt < self.retry_count:
-                    logger.warning(
-                        f"Query failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                    )
-                    time.sleep(self.retry_delay_sec)
-                    continue
+        Args:
+            date: 検索対象日付 (YYYY-MM-DD)
 
-            except Exception as e:
-                last_error = e
-                if attempt < self.retry_count:
-                    logger.warning(
-                        f"Query failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                    )
-                    time.sleep(self.retry_delay_sec)
-                    continue
-
-        # 全リトライ失敗
-        raise Exception(
-            f"Notion query failed after {self.retry_count + 1} attempts: {last_error}"
+        Returns:
+            ページデータ（存在しない場合はNone）
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        response = await self._request(
+            "Query",
+            functools.partial(
+                self.client.databases.query, **self._query_by_date_kwargs(date)
+            ),
         )
+        return self._first_page(date, response)
 
-    def create_page(
+    async def query_pages(
+        self, start: str | None = None, end: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """日付範囲のページをまとめて検索（ページネーション対応）
+
+        Args:
+            start: 開始日 (YYYY-MM-DD、Noneの場合は制限なし)
+            end: 終了日 (YYYY-MM-DD、Noneの場合は制限なし)
+
+        Returns:
+            日付 → ページデータ（同じ日付のページが複数ある場合は最初のページ）
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        pages: dict[str, dict[str, Any]] = {}
+        cursor: str | None = None
+        while True:
+            response = await self._request(
+                "Query",
+                functools.partial(
+                    self.client.databases.query,
+                    **self._query_pages_kwargs(start, end, cursor),
+                ),
+            )
+            cursor = self._collect_pages(pages, response)
+            if cursor is None:
+                break
+
+        logger.info(f"Found {len(pages)} pages between {start} and {end}")
+        return pages
+
+    async def scan_pages(
+        self, start: str | None = None, end: str | None = None
+    ) -> dict[str, PageRef]:
+        """日付範囲のページを検索して page_map に記録
+
+        検索結果をその範囲の正とし、範囲内で見つからなかった日付の記録は削除する。
+
+        Args:
+            start: 開始日 (YYYY-MM-DD、Noneの場合は制限なし)
+            end: 終了日 (YYYY-MM-DD、Noneの場合は制限なし)
+
+        Returns:
+            日付 → ページの参照
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        return self._record_scan(start, end, await self.query_pages(start, end))
+
+    async def find_page(self, date: str, lookup: bool = True) -> PageRef | None:
+        """日付のページを取得（page_map に記録があれば検索しない）
+
+        Args:
+            date: 日付 (YYYY-MM-DD)
+            lookup: page_map に記録がない場合にデータベースを検索するか
+
+        Returns:
+            ページの参照（存在しない場合はNone）
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        cached = self._cached_page(date)
+        if cached is not None or not lookup:
+            return cached
+
+        page = await self.query_page_by_date(date)
+        if page is None:
+            return None
+        self.remember_page(date, page)
+        return _page_ref(page)
+
+    async def create_page(
         self, properties: dict[str, Any], children: list[dict[str, Any]]
     ) -> dict[str, Any]:
         """新規ページ作成
@@ -131,47 +1130,16 @@ class NotionGateway:
         Raises:
             Exception: API呼び出しが全てのリトライで失敗した場合
         """
-        last_error = None
-        for attempt in range(self.retry_count + 1):
-            try:
-                response = self.client.pages.create(
-                    parent={"database_id": self.database_id},
-                    properties=properties,
-                    children=children,
-                )
-                logger.info(f"Created new page: {response['id']}")
-                return response
-
-            except APIResponseError as e:
-                last_error = e
-                # レート制限の場合は60秒待機
-                if e.status == 429:
-                    logger.warning(f"Rate limited, waiting 60 seconds...")
-                    time.sleep(60)
-                    continue
-                # その他のエラーは通常のリトライ
-                if attempt < self.retry_count:
-                    logger.warning(
-                        f"Create failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                    )
-                    time.sleep(self.retry_delay_sec)
-                    continue
-
-            except Exception as e:
-                last_error = e
-                if attempt < self.retry_count:
-                    logger.warning(
-                        f"Create failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                    )
-                    time.sleep(self.retry_delay_sec)
-                    continue
-
-        # 全リトライ失敗
-        raise Exception(
-            f"Notion create failed after {self.retry_count + 1} attempts: {last_error}"
+        kwargs, rest = self._create_page_kwargs(properties, children)
+        response = await self._request(
+            "Create", functools.partial(self.client.pages.create, **kwargs)
         )
+        logger.info(f"Created new page: {response['id']}")
+        if rest:
+            await self.append_blocks(response["id"], rest)
+        return response
 
-    def update_page(
+    async def update_page(
         self, page_id: str, properties: dict[str, Any]
     ) -> dict[str, Any]:
         """ページプロパティ更新
@@ -186,45 +1154,174 @@ class NotionGateway:
         Raises:
             Exception: API呼び出しが全てのリトライで失敗した場合
         """
-        last_error = None
+        response = await self._request(
+            "Update",
+            functools.partial(
+                self.client.pages.update, page_id=page_id, properties=properties
+            ),
+        )
+        logger.info(f"Updated page properties: {page_id}")
+        return response
+
+    async def list_blocks(self, page_id: str) -> list[dict[str, Any]]:
+        """ページの子ブロックを全件取得（ページネーション対応）
+
+        Args:
+            page_id: ページID
+
+        Returns:
+            子ブロックリスト
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        blocks: list[dict[str, Any]] = []
+        cursor: str | None = None
+        while True:
+            response = await self._request(
+                "List blocks",
+                functools.partial(
+                    self.client.blocks.children.list,
+                    **self._list_blocks_kwargs(page_id, cursor),
+                ),
+            )
+            blocks.extend(response["results"])
+            cursor = _next_cursor(response)
+            if cursor is None:
+                return blocks
+
+    async def _delete_round(self, block_ids: list[str]) -> dict[str, Exception]:
+        """ブロックを1回ずつ削除（最大 delete_concurrency 件を並行）
+
+        Args:
+            block_ids: 削除するブロックID
+
+        Returns:
+            削除に失敗したブロックID → エラー
+        """
+
+        async def delete(block_id: str) -> Exception | None:
+            async with self._delete_slots:
+                try:
+                    await self.rate_limiter.acquire_async()
+                    await self.client.blocks.delete(block_id=block_id)
+                    return None
+                except Exception as e:
+                    return e
+
+        results = await asyncio.gather(*(delete(block_id) for block_id in block_ids))
+        return {
+            block_id: error
+            for block_id, error in zip(block_ids, results)
+            if error is not None
+        }
+
+    async def delete_blocks(self, block_ids: list[str]) -> list[str]:
+        """ブロックを削除（失敗したブロックはまとめてリトライ）
+
+        全ブロックを並行して削除し、失敗したブロックだけを次のラウンドで再度削除する。
+        待機はラウンドごとに1回（レート制限時は Retry-After の間レート制限ごと停止）。
+
+        Args:
+            block_ids: 削除するブロックID
+
+        Returns:
+            全てのリトライで削除できなかったブロックID
+        """
+        pending = list(block_ids)
+        failures: dict[str, Exception] = {}
         for attempt in range(self.retry_count + 1):
+            if not pending:
+                break
+            failures = await self._delete_round(pending)
+            pending = [block_id for block_id in pending if block_id in failures]
+            if pending and attempt < self.retry_count:
+                wait_sec = self._delete_retry_wait(pending, failures, attempt)
+                if wait_sec:
+                    await asyncio.sleep(wait_sec)
+
+        self._log_delete_failures(pending, failures)
+        return pending
+
+    async def clear_blocks(self, page_id: str) -> int:
+        """ページの既存ブロックを全て削除
+
+        削除に失敗したブロックはログに記録して継続する。
+
+        Args:
+            page_id: ページID
+
+        Returns:
+            削除したブロック数
+
+        Raises:
+            Exception: ブロック一覧の取得が全てのリトライで失敗した場合
+        """
+        block_ids = [block["id"] for block in await self.list_blocks(page_id)]
+        failed = await self.delete_blocks(block_ids)
+
+        deleted = len(block_ids) - len(failed)
+        logger.info(f"Deleted {deleted} existing blocks")
+        return deleted
+
+    async def append_blocks(
+        self,
+        page_id: str,
+        blocks: list[dict[str, Any]],
+        after: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """ページにブロックを追加
+
+        MAX_CHILDREN_PER_REQUEST 件ずつに分割し、順番に追加する。
+        リトライは失敗したチャンクだけを対象にする（追加済みのチャンクは再送しない）。
+
+        Args:
+            page_id: ページID
+            blocks: 追加するブロックリスト
+            after: このブロックの直後に挿入（Noneの場合は末尾に追加）
+
+        Returns:
+            追加されたブロックリスト
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        plan = _AppendPlan(page_id, blocks, after)
+        for kwargs in plan:
             try:
-                response = self.client.pages.update(
-                    page_id=page_id, properties=properties
+                response = await self._request(
+                    "Append blocks",
+                    functools.partial(self.client.blocks.children.append, **kwargs),
                 )
-                logger.info(f"Updated page properties: {page_id}")
-                return response
+            except Exception:
+                plan.log_failure()
+                raise
+            plan.add(response)
+        return plan.finish()
+
+    async def update_block(
+        self, block_id: str, block: dict[str, Any]
+    ) -> dict[str, Any]:
+        """ブロックの内容を更新（同じ種別のブロックのみ）
 
-            except APIResponseError as e:
-                last_error = e
-                # レート制限の場合は60秒待機
-                if e.status == 429:
-                    logger.warning(f"Rate limited, waiting 60 seconds...")
-                    time.sleep(60)
-                    continue
-                # その他のエラーは通常のリトライ
-                if attempt < self.retry_count:
-                    logger.warning(
-                        f"Update failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                    )
-                    time.sleep(self.retry_delay_sec)
-                    continue
+        Args:
+            block_id: ブロックID
+            block: 新しい内容のブロック
 
-            except Exception as e:
-                last_error = e
-                if attempt < self.retry_count:
-                    logger.warning(
-                        f"Update failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                    )
-                    time.sleep(self.retry_delay_sec)
-                    continue
-
-        # 全リトライ失敗
-        raise Exception(
-            f"Notion update failed after {self.retry_count + 1} attempts: {last_error}"
+        Returns:
+            更新されたブロック
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        return await self._request(
+            "Update block",
+            functools.partial(
+                self.client.blocks.update, **self._update_block_kwargs(block_id, block)
+            ),
         )
 
-    def replace_blocks(
+    async def replace_blocks(
         self, page_id: str, blocks: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
         """ページのブロックを置換
@@ -241,81 +1338,96 @@ class NotionGateway:
         Raises:
             Exception: API呼び出しが全てのリトライで失敗した場合
         """
-        # 1. 既存ブロック取得
-        last_error = None
-        for attempt in range(self.retry_count + 1):
-            try:
-                existing_blocks = self.client.blocks.children.list(block_id=page_id)
-                break
-            except Exception as e:
-                last_error = e
-                if attempt < self.retry_count:
-                    logger.warning(
-                        f"List blocks failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                    )
-                    time.sleep(self.retry_delay_sec)
-                    continue
-                raise Exception(
-                    f"Failed to list blocks after {self.retry_count + 1} attempts: {last_error}"
-                )
+        await self.clear_blocks(page_id)
+        return await self.append_blocks(page_id, blocks)
 
-        # 2. 既存ブロック削除
-        for block in existing_blocks["results"]:
-            for attempt in range(self.retry_count + 1):
-                try:
-                    self.client.blocks.delete(block_id=block["id"])
-                    break
-                except Exception as e:
-                    last_error = e
-                    if attempt < self.retry_count:
-                        logger.warning(
-                            f"Delete block failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                        )
-                        time.sleep(self.retry_delay_sec)
-                        continue
-                    logger.error(f"Failed to delete block {block['id']}: {e}")
-                    # 削除失敗は継続（次のブロックを試す）
-                    break
-
-        logger.info(f"Deleted {len(existing_blocks['results'])} existing blocks")
+    async def update_blocks(
+        self, page_id: str, blocks: list[dict[str, Any]]
+    ) -> BlockDiff:
+        """ページのブロックを差分更新
 
-        # 3. 新規ブロック追加
-        for attempt in range(self.retry_count + 1):
-            try:
-                response = self.client.blocks.children.append(
-                    block_id=page_id, children=blocks
-                )
-                logger.info(f"Appended {len(blocks)} new blocks")
-                return response["results"]
+        既存ブロックと比較し、変更があったブロックだけを更新・削除・挿入する。
+        削除は delete_blocks() で並行して行う。
 
-            except APIResponseError as e:
-                last_error = e
-                # レート制限の場合は60秒待機
-                if e.status == 429:
-                    logger.warning(f"Rate limited, waiting 60 seconds...")
-                    time.sleep(60)
-                    continue
-                # その他のエラーは通常のリトライ
-                if attempt < self.retry_count:
-                    logger.warning(
-                        f"Append blocks failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                    )
-                    time.sleep(self.retry_delay_sec)
-                    continue
+        Args:
+            page_id: ページID
+            blocks: 新規ブロックリスト
 
-            except Exception as e:
-                last_error = e
-                if attempt < self.retry_count:
-                    logger.warning(
-                        f"Append blocks failed (attempt {attempt + 1}/{self.retry_count + 1}): {e}"
-                    )
-                    time.sleep(self.retry_delay_sec)
-                    continue
-
-        # 全リトライ失敗
-        raise Exception(
-            f"Failed to append blocks after {self.retry_count + 1} attempts: {last_error}"
+        Returns:
+            適用した差分
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        diff = diff_blocks(await self.list_blocks(page_id), blocks)
+
+        await self.delete_blocks(diff.deletes)
+        for block_id, block in diff.updates:
+            await self.update_block(block_id, block)
+        for after, children in diff.inserts:
+            await self.append_blocks(page_id, children, after=after)
+
+        logger.info(f"Updated blocks of page {page_id}: {diff}")
+        return diff
+
+    async def _update_existing(
+        self, page: PageRef, properties: dict[str, Any], blocks: list[dict[str, Any]]
+    ) -> None:
+        """プロパティ更新と本文の差分更新を並行して行う（互いに独立）"""
+        results = await asyncio.gather(
+            self.update_page(page.id, properties),
+            self.update_blocks(page.id, blocks),
+            return_exceptions=True,
         )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def publish_page(
+        self,
+        date: str,
+        properties: dict[str, Any],
+        blocks: list[dict[str, Any]],
+        lookup: bool = True,
+    ) -> PageRef:
+        """日付のページを更新（存在しない場合は作成）
+
+        page_map に記録したページが削除・アーカイブされていた場合は、記録を
+        破棄してデータベースを検索し直す（見つからなければ作成）。
+
+        Args:
+            date: 日付 (YYYY-MM-DD)
+            properties: ページプロパティ
+            blocks: ページ本文ブロック
+            lookup: page_map に記録がない場合にデータベースを検索するか
+                （Falseの場合は作成。scan_pages() 済みの日付向け）
+
+        Returns:
+            ページの参照
+
+        Raises:
+            Exception: API呼び出しが全てのリトライで失敗した場合
+        """
+        cached = self._cached_page(date) is not None
+        page = await self.find_page(date, lookup=lookup)
+        if page is not None:
+            try:
+                await self._update_existing(page, properties, blocks)
+            except APIResponseError as e:
+                if not self._should_refind(date, cached, e):
+                    raise
+                page = await self.find_page(date)
+                if page is not None:
+                    await self._update_existing(page, properties, blocks)
+
+        if page is None:
+            created = await self.create_page(properties, blocks)
+            self.remember_page(date, created)
+            logger.info(f"Created new page: {created['url']}")
+            return _page_ref(created)
+
+        logger.info(f"Updated existing page: {page.url}")
+        return page
 
 
 # ブロック生成ヘルパー関数
@@ -587,10 +1699,12 @@ def publish_report(
     total_duration_min: int = 0,
     token: str | None = None,
     database_id: str | None = None,
+    page_map: PageMapRepository | None = None,
 ) -> tuple[str, str]:
     """日報をNotionに出力
 
-    既存ページがある場合は更新、ない場合は新規作成。
+    既存ページがある場合は更新（本文は変更があったブロックだけを差分更新）、
+    ない場合は新規作成。
 
     Args:
         report: 日報レポート
@@ -598,6 +1712,8 @@ def publish_report(
         total_duration_min: 総作業時間（分）
         token: Notion Integration Token（オプション）
         database_id: データベースID（オプション）
+        page_map: 日付 → ページの対応表（Noneの場合はログ保存ディレクトリの
+            notion_pages.json）
 
     Returns:
         (ページID, ページURL)
@@ -606,26 +1722,138 @@ def publish_report(
         Exception: Notion API呼び出しが失敗した場合
     """
     gateway = NotionGateway(token=token, database_id=database_id)
+    if page_map is None:
+        page_map = PageMapRepository(gateway.database_id)
+    gateway.page_map = page_map
 
     # プロパティとブロック生成
     properties = build_page_properties(report, capture_count, total_duration_min)
     blocks = build_report_blocks(report)
 
-    # 既存ページ検索
-    existing_page = gateway.query_page_by_date(report.meta.date)
+    page = gateway.publish_page(report.meta.date, properties, blocks)
+    return page.id, page.url
 
-    if existing_page:
-        # 既存ページ更新
-        page_id = existing_page["id"]
-        gateway.update_page(page_id, properties)
-        gateway.replace_blocks(page_id, blocks)
-        page_url = existing_page["url"]
-        logger.info(f"Updated existing page: {page_url}")
-    else:
-        # 新規ページ作成
-        created_page = gateway.create_page(properties, blocks)
-        page_id = created_page["id"]
-        page_url = created_page["url"]
-        logger.info(f"Created new page: {page_url}")
 
-    return page_id, page_url
+def publish_reports(
+    reports: Sequence[Report],
+    stats: Mapping[str, tuple[int, int]] | None = None,
+    token: str | None = None,
+    database_id: str | None = None,
+    page_map: PageMapRepository | None = None,
+    max_workers: int = DEFAULT_PUBLISH_WORKERS,
+    gateway: NotionGateway | None = None,
+) -> tuple[dict[str, tuple[str, str]], dict[str, Exception]]:
+    """複数の日報をまとめてNotionに出力
+
+    対象期間の既存ページを1回のページネーション付き検索（100件/リクエスト）で
+    取得してから、作成・更新を最大 max_workers 件並行して行う。
+    全ての日報で1つのゲートウェイ（クライアント・レート制限）を共有する。
+
+    1件の失敗で残りの出力は中断しない。
+
+    Args:
+        reports: 日報レポート（同じ日付が複数ある場合は最後のもの）
+        stats: 日付 → (キャプチャ数, 総作業時間（分）)（ない日付は0）
+        token: Notion Integration Token（オプション）
+        database_id: データベースID（オプション）
+        page_map: 日付 → ページの対応表（Noneの場合はゲートウェイの対応表、
+            それもない場合はログ保存ディレクトリの notion_pages.json）
+        max_workers: 並行して出力する日報数
+        gateway: 共有するゲートウェイ（Noneの場合は作成）
+
+    Returns:
+        (日付 → (ページID, ページURL), 日付 → 出力に失敗したエラー)
+
+    Raises:
+        ValueError: max_workers が1未満の場合
+        Exception: 既存ページの検索が失敗した場合
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1: {max_workers}")
+
+    if gateway is None:
+        gateway = NotionGateway(token=token, database_id=database_id)
+    if page_map is not None:
+        gateway.page_map = page_map
+    elif gateway.page_map is None:
+        gateway.page_map = PageMapRepository(gateway.database_id)
+
+    by_date = {report.meta.date: report for report in reports}
+    if not by_date:
+        return {}, {}
+    stats = stats or {}
+
+    # 既存ページをまとめて検索（以降の find_page は page_map から取得）
+    existing = gateway.scan_pages(min(by_date), max(by_date))
+    creates = sum(1 for date in by_date if date not in existing)
+    logger.info(
+        f"Publishing {len(by_date)} reports: "
+        f"{len(by_date) - creates} updates, {creates} creates"
+    )
+
+    def publish(report: Report) -> PageRef:
+        capture_count, total_duration_min = stats.get(report.meta.date, (0, 0))
+        properties = build_page_properties(report, capture_count, total_duration_min)
+        blocks = build_report_blocks(report)
+        return gateway.publish_page(report.meta.date, properties, blocks, lookup=False)
+
+    published: dict[str, tuple[str, str]] = {}
+    failed: dict[str, Exception] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(by_date))) as executor:
+        futures = {
+            executor.submit(publish, report): date for date, report in by_date.items()
+        }
+        for future in as_completed(futures):
+            date = futures[future]
+            try:
+                page = future.result()
+                published[date] = (page.id, page.url)
+            except Exception as e:
+                logger.error(f"Failed to publish report for {date}: {e}")
+                failed[date] = e
+
+    logger.info(f"Published {len(published)} reports ({len(failed)} failed)")
+    return dict(sorted(published.items())), dict(sorted(failed.items()))
+
+
+async def publish_report_async(
+    report: Report,
+    capture_count: int = 0,
+    total_duration_min: int = 0,
+    token: str | None = None,
+    database_id: str | None = None,
+    gateway: AsyncNotionGateway | None = None,
+) -> tuple[str, str]:
+    """日報をNotionに出力（asyncio版）
+
+    既存ページがある場合は、プロパティ更新と本文の差分更新を並行して行う。
+    ない場合は新規作成。
+
+    Args:
+        report: 日報レポート
+        capture_count: キャプチャ数
+        total_duration_min: 総作業時間（分）
+        token: Notion Integration Token（オプション）
+        database_id: データベースID（オプション）
+        gateway: 共有するゲートウェイ（Noneの場合はログ保存ディレクトリの
+            notion_pages.json を使うゲートウェイを作成し、終了時に閉じる）
+
+    Returns:
+        (ページID, ページURL)
+
+    Raises:
+        Exception: Notion API呼び出しが失敗した場合
+    """
+    if gateway is None:
+        async with AsyncNotionGateway(token=token, database_id=database_id) as owned:
+            owned.page_map = PageMapRepository(owned.database_id)
+            return await publish_report_async(
+                report, capture_count, total_duration_min, gateway=owned
+            )
+
+    # プロパティとブロック生成
+    properties = build_page_properties(report, capture_count, total_duration_min)
+    blocks = build_report_blocks(report)
+
+    page = await gateway.publish_page(report.meta.date, properties, blocks)
+    return page.id, page.url
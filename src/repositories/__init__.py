@@ -1,15 +1,21 @@
 # repositories layer - data persistence
 
+from .columnar import ColumnarFormatError, ColumnarLog
 from .log_repository import (
     LogFileEmptyError,
     LogFileNotFoundError,
     LogParseError,
     LogRepository,
 )
+from .page_map import PageMapRepository, PageRef
 
 __all__ = [
     "LogRepository",
     "LogFileNotFoundError",
     "LogFileEmptyError",
     "LogParseError",
+    "ColumnarLog",
+    "ColumnarFormatError",
+    "PageMapRepository",
+    "PageRef",
 ]
@@ -0,0 +1,326 @@
+"""ColumnarLog - 確定済みキャプチャログの列指向バイナリ形式
+
+追記が終わった日の raw.jsonl を列ごとの配列に変換して保存し、
+JSONを1行ずつ解析せずに集計へ渡せるようにする。
+
+ファイル構成 (YYYY-MM-DD.col):
+    MAGIC (8バイト)
+    ヘッダ長 (uint32, リトルエンディアン)
+    ヘッダ (UTF-8 JSON: バージョン・件数・辞書・列定義)
+    列データ (リトルエンディアンの配列を列定義の順に連結)
+
+列:
+    ts_us: int64 UNIX時刻（マイクロ秒）
+    utc_offset: int32 UTCオフセット（秒）
+    process_name / window_title: int32 辞書コード（-1 は None）
+    keywords / urls / files: int32 オフセット配列（件数+1）と int32 辞書コード配列
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from src.utils.time_utils import parse_ts_epoch_offset
+
+MAGIC = b"DRBCOL\x00\x01"
+FORMAT_VERSION = 1
+
+# 辞書エンコードする単一値の列
+SCALAR_FIELDS = ("process_name", "window_title")
+# オフセット+値配列で保持するリスト列
+LIST_FIELDS = ("keywords", "urls", "files")
+
+_HEADER_LEN = struct.Struct("<I")
+
+
+class ColumnarFormatError(ValueError):
+    """列指向ファイルの形式が不正"""
+
+    def __init__(self, file_path: Path, reason: str) -> None:
+        super().__init__(f"Invalid columnar log file ({reason}): {file_path}")
+        self.file_path = file_path
+        self.reason = reason
+
+
+class _StringDictionary:
+    """文字列 -> 整数コードの辞書（出現順にコードを割り当てる）"""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class ColumnarLog:
+    """1日分のキャプチャログの列指向表現
+
+    Attributes:
+        ts_us: UNIX時刻（マイクロ秒）
+        utc_offsets: UTCオフセット（秒）
+        scalar_codes: 単一値列の辞書コード（-1 は None）
+        list_offsets: リスト列の各レコードの開始位置（件数+1）
+        list_values: リスト列の辞書コードを連結した配列
+        dictionaries: 列ごとのコード -> 文字列の辞書
+    """
+
+    def __init__(
+        self,
+        ts_us: array,
+        utc_offsets: array,
+        scalar_codes: dict[str, array],
+        list_offsets: dict[str, array],
+        list_values: dict[str, array],
+        dictionaries: dict[str, list[str]],
+    ) -> None:
+        self.ts_us = ts_us
+        self.utc_offsets = utc_offsets
+        self.scalar_codes = scalar_codes
+        self.list_offsets = list_offsets
+        self.list_values = list_values
+        self.dictionaries = dictionaries
+
+    def __len__(self) -> int:
+        return len(self.ts_us)
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> ColumnarLog:
+        """raw.jsonl のレコードから列指向表現を作成
+
+        タイムスタンプが欠損・解析不能・タイムゾーンなしのレコードは
+        集計対象にならないため格納しない。
+
+        Args:
+            records: レコードのイテラブル
+
+        Returns:
+            ColumnarLog
+        """
+        ts_us = array("q")
+        utc_offsets = array("i")
+        dictionaries = {
+            field: _StringDictionary() for field in SCALAR_FIELDS + LIST_FIELDS
+        }
+        scalar_codes = {field: array("i") for field in SCALAR_FIELDS}
+        list_offsets = {field: array("i", [0]) for field in LIST_FIELDS}
+        list_values = {field: array("i") for field in LIST_FIELDS}
+
+        for record in records:
+            ts_value = record.get("ts")
+            if not isinstance(ts_value, str):
+                continue
+            try:
+                epoch, offset = parse_ts_epoch_offset(ts_value)
+            except ValueError:
+                continue
+
+            ts_us.append(
+                epoch * 1_000_000
+                if isinstance(epoch, int)
+                else round(epoch * 1_000_000)
+            )
+            utc_offsets.append(offset)
+
+            for field in SCALAR_FIELDS:
+                value = record.get(field)
+                scalar_codes[field].append(
+                    dictionaries[field].encode(value) if isinstance(value, str) else -1
+                )
+
+            for field in LIST_FIELDS:
+                values = record.get(field)
+                if isinstance(values, list):
+                    encode = dictionaries[field].encode
+                    list_values[field].extend(
+                        encode(v) for v in values if isinstance(v, str)
+                    )
+                list_offsets[field].append(len(list_values[field]))
+
+        return cls(
+            ts_us=ts_us,
+            utc_offsets=utc_offsets,
+            scalar_codes=scalar_codes,
+            list_offsets=list_offsets,
+            list_values=list_values,
+            dictionaries={
+                field: dictionary.values for field, dictionary in dictionaries.items()
+            },
+        )
+
+    def iter_rows(self) -> Iterator[tuple[tuple[int | float, int], dict[str, Any]]]:
+        """((UNIX時刻, UTCオフセット秒), レコード) を順に返す
+
+        レコードは集計に使うフィールドのみを持つdict。
+        文字列は辞書から参照するため、デコードは辞書の読み込み時の1回のみ。
+        タイムスタンプは parse_ts_epoch_offset() と同じ表現で返す。
+
+        Yields:
+            ((UNIX時刻, UTCオフセット秒), レコード)
+        """
+        scalar_columns = [
+            (field, self.scalar_codes[field], self.dictionaries[field])
+            for field in SCALAR_FIELDS
+        ]
+        list_columns = [
+            (
+                field,
+                self.list_offsets[field],
+                self.list_values[field],
+                self.dictionaries[field],
+            )
+            for field in LIST_FIELDS
+        ]
+
+        for i, (us, offset_sec) in enumerate(zip(self.ts_us, self.utc_offsets)):
+            seconds, micros = divmod(us, 1_000_000)
+            epoch = us / 1_000_000 if micros else seconds
+
+            record: dict[str, Any] = {}
+            for field, codes, dictionary in scalar_columns:
+                code = codes[i]
+                record[field] = dictionary[code] if code >= 0 else None
+            for field, offsets, values, dictionary in list_columns:
+                record[field] = [
+                    dictionary[code] for code in values[offsets[i] : offsets[i + 1]]
+                ]
+
+            yield (epoch, offset_sec), record
+
+    def _columns(self) -> list[tuple[str, array]]:
+        """ファイルに書き出す列（名前, 配列）の一覧"""
+        columns = [("ts_us", self.ts_us), ("utc_offset", self.utc_offsets)]
+        columns += [(field, self.scalar_codes[field]) for field in SCALAR_FIELDS]
+        for field in LIST_FIELDS:
+            columns.append((f"{field}.offsets", self.list_offsets[field]))
+            columns.append((f"{field}.values", self.list_values[field]))
+        return columns
+
+    def to_bytes(self) -> bytes:
+        """列指向ファイルのバイト列に変換"""
+        columns = self._columns()
+        header = {
+            "version": FORMAT_VERSION,
+            "count": len(self),
+            "dictionaries": self.dictionaries,
+            "columns": [[name, data.typecode, len(data)] for name, data in columns],
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+        chunks = [MAGIC, _HEADER_LEN.pack(len(header_bytes)), header_bytes]
+        for _, data in columns:
+            if sys.byteorder == "big":
+                data = array(data.typecode, data)
+                data.byteswap()
+            chunks.append(data.tobytes())
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, file_path: Path) -> ColumnarLog:
+        """列指向ファイルのバイト列から復元
+
+        Args:
+            data: ファイル内容
+            file_path: エラーメッセージ用のファイルパス
+
+        Returns:
+            ColumnarLog
+
+        Raises:
+            ColumnarFormatError: 形式が不正
+        """
+        if not data.startswith(MAGIC):
+            raise ColumnarFormatError(file_path, "bad magic")
+
+        try:
+            pos = len(MAGIC)
+            (header_len,) = _HEADER_LEN.unpack_from(data, pos)
+            pos += _HEADER_LEN.size
+            header = json.loads(data[pos : pos + header_len])
+            pos += header_len
+        except (struct.error, ValueError) as e:
+            raise ColumnarFormatError(file_path, f"broken header: {e}") from e
+
+        if not isinstance(header, dict):
+            raise ColumnarFormatError(file_path, "broken header: not an object")
+        if header.get("version") != FORMAT_VERSION:
+            raise ColumnarFormatError(
+                file_path, f"unsupported version {header.get('version')}"
+            )
+
+        columns: dict[str, array] = {}
+        try:
+            for name, typecode, length in header["columns"]:
+                column = array(typecode)
+                size = column.itemsize * length
+                if pos + size > len(data):
+                    raise ColumnarFormatError(file_path, f"truncated column {name}")
+                column.frombytes(data[pos : pos + size])
+                if sys.byteorder == "big":
+                    column.byteswap()
+                columns[name] = column
+                pos += size
+
+            log = cls(
+                ts_us=columns["ts_us"],
+                utc_offsets=columns["utc_offset"],
+                scalar_codes={field: columns[field] for field in SCALAR_FIELDS},
+                list_offsets={
+                    field: columns[f"{field}.offsets"] for field in LIST_FIELDS
+                },
+                list_values={
+                    field: columns[f"{field}.values"] for field in LIST_FIELDS
+                },
+                dictionaries={
+                    field: header["dictionaries"][field]
+                    for field in SCALAR_FIELDS + LIST_FIELDS
+                },
+            )
+            count = header["count"]
+        except ColumnarFormatError:
+            raise
+        except KeyError as e:
+            raise ColumnarFormatError(file_path, f"missing {e.args[0]}") from e
+        except (TypeError, ValueError) as e:
+            raise ColumnarFormatError(file_path, f"broken header: {e}") from e
+
+        reason = log._inconsistency(count)
+        if reason is not None:
+            raise ColumnarFormatError(file_path, reason)
+        return log
+
+    def _inconsistency(self, count: Any) -> str | None:
+        """列の長さ・辞書コードの範囲が整合しない理由（整合していればNone）
+
+        iter_rows() が途中で IndexError にならないことを読み込み時に保証する。
+        """
+        if len(self.ts_us) != count or len(self.utc_offsets) != count:
+            return f"expected {count} rows"
+        for field in SCALAR_FIELDS:
+            codes = self.scalar_codes[field]
+            if len(codes) != count:
+                return f"column {field} has {len(codes)} rows"
+            if max(codes, default=-1) >= len(self.dictionaries[field]):
+                return f"column {field} refers past its dictionary"
+        for field in LIST_FIELDS:
+            offsets, values = self.list_offsets[field], self.list_values[field]
+            if len(offsets) != count + 1 or offsets[0] != 0:
+                return f"column {field}.offsets is inconsistent"
+            if offsets[-1] != len(values):
+                return f"column {field}.values has {len(values)} values"
+            if values and (
+                min(values) < 0 or max(values) >= len(self.dictionaries[field])
+            ):
+                return f"column {field} refers past its dictionary"
+        return None
@@ -8,14 +8,80 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
 import os
-from datetime import date
+import re
+from collections import OrderedDict
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from src.domain.capture import CaptureRow
+from src.domain.features import Features
+from src.repositories.columnar import ColumnarLog
+from src.utils.time_utils import parse_ts_epoch
 
 logger = logging.getLogger(__name__)
 
 
+# インデックス作成時にJSON全体を解析せず "ts" フィールドだけを抽出する
+_TS_FIELD_PATTERN = re.compile(rb'"ts"\s*:\s*"([^"]+)"')
+
+
+def _extract_epoch(raw_line: bytes) -> float | None:
+    """JSONL行から "ts" フィールドを抽出してUNIX時刻に変換
+
+    Args:
+        raw_line: JSONL行（バイト列）
+
+    Returns:
+        UNIX時刻（秒）。抽出・解析できない場合はNone
+    """
+    match = _TS_FIELD_PATTERN.search(raw_line)
+    if match is None:
+        return None
+    try:
+        return parse_ts_epoch(match.group(1).decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+# raw.jsonl の読み込み方式
+READ_BACKENDS = ("buffered", "mmap")
+
+
+def _iter_lines_mmap(
+    log_path: Path, start_offset: int = 0, end_offset: int | None = None
+) -> Iterator[bytes]:
+    """メモリマップしたログファイルを改行位置で分割して行を返す
+
+    ファイル全体をページキャッシュ経由で参照するため、同じファイルを読む
+    複数プロセス間でメモリを共有できる。
+
+    Args:
+        log_path: ログファイルパス
+        start_offset: 読み込み開始バイト位置（行頭）
+        end_offset: 読み込み終了バイト位置（Noneの場合はマップ時点のファイル末尾）
+
+    Yields:
+        1行分のバイト列（末尾行以外は改行を含む）
+    """
+    with open(log_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 or start_offset >= size:
+            # 空ファイルはメモリマップできない
+            return
+
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            end = size if end_offset is None else min(end_offset, size)
+            pos = start_offset
+            while pos < end:
+                newline = mm.find(b"\n", pos, end)
+                next_pos = end if newline == -1 else newline + 1
+                yield mm[pos:next_pos]
+                pos = next_pos
+
+
 class LogFileNotFoundError(FileNotFoundError):
     """ログファイルが存在しない"""
 
@@ -49,22 +115,59 @@ class LogRepository:
     ファイル配置:
     - raw.jsonl: %LOCALAPPDATA%/DailyReportBot/logs/YYYY-MM-DD.jsonl
     - features.json: %LOCALAPPDATA%/DailyReportBot/logs/YYYY-MM-DD_features.json
+    - checkpoint: %LOCALAPPDATA%/DailyReportBot/logs/YYYY-MM-DD_checkpoint.json
+    - index: %LOCALAPPDATA%/DailyReportBot/logs/YYYY-MM-DD.idx（時間範囲の読み込み用）
+    - columnar: %LOCALAPPDATA%/DailyReportBot/logs/YYYY-MM-DD.col（確定済みの日のみ）
     """
 
     DEFAULT_BASE_PATH = Path(os.getenv("LOCALAPPDATA", "~")) / "DailyReportBot" / "logs"
-
-    def __init__(self, base_path: Path | None = None) -> None:
+    DEFAULT_INDEX_INTERVAL_SEC = 300  # 時刻インデックスのセグメント長（秒）
+    DEFAULT_FEATURES_CACHE_SIZE = 32  # 解析済みfeatures.jsonのキャッシュ件数（日数）
+    INDEX_VERSION = 1
+
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        read_backend: str = "buffered",
+        features_cache_size: int = DEFAULT_FEATURES_CACHE_SIZE,
+    ) -> None:
         """リポジトリを初期化
 
         Args:
             base_path: ログ保存ディレクトリ。
                       Noneの場合は %LOCALAPPDATA%/DailyReportBot/logs/
+            read_backend: raw.jsonlの読み込み方式
+                - "buffered": 通常のバッファ付きファイル読み込み
+                - "mmap": メモリマップしたバッファ上で行分割（大容量・複数プロセス向け）
+            features_cache_size: load_features_model() のLRUキャッシュ件数
+                （0の場合はキャッシュしない）
+
+        Raises:
+            ValueError: 未知の read_backend が指定された場合、
+                features_cache_size が負の場合
         """
         if base_path is None:
             base_path = self.DEFAULT_BASE_PATH.expanduser()
 
+        if read_backend not in READ_BACKENDS:
+            raise ValueError(
+                f"Unknown read_backend: {read_backend} (expected one of {READ_BACKENDS})"
+            )
+
+        if features_cache_size < 0:
+            raise ValueError(f"features_cache_size must be >= 0: {features_cache_size}")
+
         self.base_path = Path(base_path)
-        logger.debug(f"LogRepository initialized with base_path: {self.base_path}")
+        self.read_backend = read_backend
+        self.features_cache_size = features_cache_size
+        # パス → ((mtime_ns, size), 解析済みFeatures)。末尾が最近使ったもの
+        self._features_cache: OrderedDict[Path, tuple[tuple[int, int], Features]] = (
+            OrderedDict()
+        )
+        logger.debug(
+            f"LogRepository initialized with base_path: {self.base_path} "
+            f"(read_backend={self.read_backend})"
+        )
 
     def get_log_path(self, target_date: date) -> Path:
         """対象日のログファイルパスを取得
@@ -90,6 +193,42 @@ class LogRepository:
         filename = f"{target_date.isoformat()}_features.json"
         return self.base_path / filename
 
+    def get_checkpoint_path(self, target_date: date) -> Path:
+        """対象日の差分集計チェックポイントファイルパスを取得
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            チェックポイントファイルの絶対パス (YYYY-MM-DD_checkpoint.json)
+        """
+        filename = f"{target_date.isoformat()}_checkpoint.json"
+        return self.base_path / filename
+
+    def get_index_path(self, target_date: date) -> Path:
+        """対象日の時刻インデックスファイルパスを取得
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            インデックスファイルの絶対パス (YYYY-MM-DD.idx)
+        """
+        filename = f"{target_date.isoformat()}.idx"
+        return self.base_path / filename
+
+    def get_columnar_path(self, target_date: date) -> Path:
+        """対象日の列指向アーカイブファイルパスを取得
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            列指向ファイルの絶対パス (YYYY-MM-DD.col)
+        """
+        filename = f"{target_date.isoformat()}.col"
+        return self.base_path / filename
+
     def read_raw_logs(self, target_date: date) -> list[dict[str, Any]]:
         """raw.jsonlを読み込み
 
@@ -107,48 +246,419 @@ class LogRepository:
             LogFileEmptyError: ファイルが空または有効なレコードが0件
             LogParseError: 全行が解析エラー
         """
+        return list(self.iter_raw_logs(target_date))
+
+    def iter_raw_logs(self, target_date: date) -> Iterator[dict[str, Any]]:
+        """raw.jsonlを1レコードずつ読み込むイテレータを取得
+
+        read_raw_logs() と同じ解析ルールで、全レコードをメモリに保持せずに
+        1行ずつ解析して返す。大量のキャプチャを持つ日の集計向け。
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            解析成功したレコードを順に返すイテレータ
+
+        Raises:
+            LogFileNotFoundError: ファイルが存在しない（呼び出し時に即時送出）
+            LogFileEmptyError: ファイルが空（呼び出し時に即時送出）、
+                または有効なレコードが0件（イテレーション終了時に送出）
+            LogParseError: 全行が解析エラー（イテレーション終了時に送出）
+        """
+        log_path = self._check_log_file(target_date)
+        return (record for record, _ in self._iter_records(log_path))
+
+    def iter_capture_rows(self, target_date: date) -> Iterator[CaptureRow]:
+        """raw.jsonlを1レコードずつ CaptureRow（検証なしの軽量レコード）として読み込む
+
+        解析ルール・例外は iter_raw_logs() と同じ。JSONオブジェクトでない行は読み飛ばす。
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            CaptureRow を順に返すイテレータ
+        """
+        from_dict = CaptureRow.from_dict
+        return (
+            from_dict(record)
+            for record in self.iter_raw_logs(target_date)
+            if isinstance(record, dict)
+        )
+
+    def iter_raw_logs_from(
+        self, target_date: date, start_offset: int = 0
+    ) -> Iterator[tuple[dict[str, Any], int]]:
+        """指定バイト位置以降のraw.jsonlを読み込むイテレータを取得
+
+        差分集計用。改行で終端された行のみを対象とし、ロガーが書き込み途中の
+        末尾行は読み込まない（次回の読み込みで処理される）。
+
+        Args:
+            target_date: 対象日
+            start_offset: 読み込み開始バイト位置（行頭であること）
+
+        Returns:
+            (レコード, そのレコード行の直後のバイト位置) を順に返すイテレータ
+
+        Raises:
+            LogFileNotFoundError: ファイルが存在しない（呼び出し時に即時送出）
+            LogFileEmptyError: start_offset=0 でファイルが空
+            LogParseError: start_offset=0 で全行が解析エラー
+        """
+        if start_offset == 0:
+            log_path = self._check_log_file(target_date)
+        else:
+            log_path = self.get_log_path(target_date)
+            if not log_path.exists():
+                logger.error(f"Log file not found: {log_path}")
+                raise LogFileNotFoundError(log_path)
+
+        return self._iter_records(
+            log_path, start_offset=start_offset, complete_lines_only=True
+        )
+
+    def iter_raw_logs_between(
+        self,
+        target_date: date,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """指定時間範囲 [start, end) のレコードを読み込むイテレータを取得
+
+        時刻インデックス（YYYY-MM-DD.idx）を最新化し、範囲と重なるセグメントの
+        バイト範囲だけを読み込む。タイムスタンプが欠損・解析不能なレコードは
+        どの範囲にも含まれない。
+
+        Args:
+            target_date: 対象日
+            start: 範囲の開始時刻（タイムゾーン付き、Noneの場合は制限なし）
+            end: 範囲の終了時刻（この時刻は含まない、Noneの場合は制限なし）
+
+        Returns:
+            範囲内のレコードを順に返すイテレータ
+
+        Raises:
+            LogFileNotFoundError: ファイルが存在しない（呼び出し時に即時送出）
+            LogFileEmptyError: ファイルが空（呼び出し時に即時送出）
+        """
+        log_path = self._check_log_file(target_date)
+        index = self.build_index(target_date)
+
+        start_epoch = start.timestamp() if start is not None else None
+        end_epoch = end.timestamp() if end is not None else None
+
+        # 範囲と重なるセグメントを選び、隣接するものは1つのバイト範囲にまとめる
+        byte_ranges: list[list[int]] = []
+        for seg_start, seg_end, seg_min, seg_max in index["segments"]:
+            if seg_min is None:
+                continue
+            if start_epoch is not None and seg_max < start_epoch:
+                continue
+            if end_epoch is not None and seg_min >= end_epoch:
+                continue
+            if byte_ranges and byte_ranges[-1][1] == seg_start:
+                byte_ranges[-1][1] = seg_end
+            else:
+                byte_ranges.append([seg_start, seg_end])
+
+        skipped = index["size"] - sum(e - s for s, e in byte_ranges)
+        logger.info(
+            f"Reading {len(byte_ranges)} byte ranges from {log_path} "
+            f"(skipped {skipped} of {index['size']} bytes)"
+        )
+
+        return self._iter_byte_ranges(log_path, byte_ranges, start_epoch, end_epoch)
+
+    def build_index(
+        self, target_date: date, interval_sec: int | None = None
+    ) -> dict[str, Any]:
+        """時刻インデックス（YYYY-MM-DD.idx）を作成・更新
+
+        ログを interval_sec ごとのセグメントに区切り、各セグメントの
+        [開始バイト, 終了バイト, 最小時刻, 最大時刻] を記録する。
+        既存インデックスがあれば最後のセグメント以降のみを走査して更新する。
+
+        インデックスは時間範囲の読み込み（iter_raw_logs_between）専用。
+        1日分の集計は iter_raw_logs でファイル全体を先頭から読むため使わない
+        （直近除外で読み飛ばせるのは末尾の数分だけで、シークしても
+        読み込み量はほとんど減らない）。
+
+        Args:
+            target_date: 対象日
+            interval_sec: セグメント長（秒）。Noneの場合は既定値
+
+        Returns:
+            インデックスデータ
+
+        Raises:
+            LogFileNotFoundError: ログファイルが存在しない
+        """
+        if interval_sec is None:
+            interval_sec = self.DEFAULT_INDEX_INTERVAL_SEC
+
+        log_path = self.get_log_path(target_date)
+        size = self.get_log_size(target_date)
+        index_path = self.get_index_path(target_date)
+
+        index = self._load_index(index_path)
+        if (
+            index is None
+            or index.get("version") != self.INDEX_VERSION
+            or index.get("interval_sec") != interval_sec
+            or index.get("size", 0) > size
+        ):
+            index = {
+                "version": self.INDEX_VERSION,
+                "interval_sec": interval_sec,
+                "size": 0,
+                "segments": [],
+            }
+        elif index["size"] == size:
+            return index
+
+        # 最後のセグメントは追記で伸びている可能性があるため作り直す
+        segments: list[list[Any]] = index["segments"]
+        resume_offset = segments.pop()[0] if segments else 0
+
+        segments.extend(self._scan_segments(log_path, resume_offset, interval_sec))
+        index["size"] = size
+
+        tmp_path = index_path.with_suffix(".idx.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+
+        logger.debug(
+            f"Index updated: {index_path} "
+            f"(segments={len(segments)}, resumed_at={resume_offset})"
+        )
+
+        return index
+
+    def _load_index(self, index_path: Path) -> dict[str, Any] | None:
+        """インデックスファイルを読み込み（存在しない・破損時はNone）"""
+        if not index_path.exists():
+            return None
+
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index: dict[str, Any] = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Broken index file, rebuilding: {index_path}: {e}")
+            return None
+
+        return index
+
+    def _scan_segments(
+        self, log_path: Path, start_offset: int, interval_sec: int
+    ) -> list[list[Any]]:
+        """ログを走査してセグメント一覧を作成
+
+        JSON全体は解析せず、各行の "ts" フィールドのみを抽出する。
+
+        Args:
+            log_path: ログファイルパス
+            start_offset: 走査開始バイト位置（行頭）
+            interval_sec: セグメント長（秒）
+
+        Returns:
+            [開始バイト, 終了バイト, 最小時刻(epoch), 最大時刻(epoch)] のリスト。
+            有効な時刻を含まないセグメントの最小/最大時刻はNone
+        """
+        segments: list[list[Any]] = []
+        current: list[Any] | None = None
+        current_bucket: int | None = None
+        offset = start_offset
+
+        for raw_line in self._iter_lines(log_path, start_offset):
+            line_start = offset
+            offset += len(raw_line)
+
+            epoch = _extract_epoch(raw_line)
+            bucket = int(epoch // interval_sec) if epoch is not None else None
+
+            if current is None or (
+                bucket is not None
+                and current_bucket is not None
+                and bucket != current_bucket
+            ):
+                current = [line_start, offset, None, None]
+                segments.append(current)
+                current_bucket = bucket
+            else:
+                current[1] = offset
+
+            if epoch is not None:
+                if current_bucket is None:
+                    current_bucket = bucket
+                if current[2] is None or epoch < current[2]:
+                    current[2] = epoch
+                if current[3] is None or epoch > current[3]:
+                    current[3] = epoch
+
+        return segments
+
+    def _iter_byte_ranges(
+        self,
+        log_path: Path,
+        byte_ranges: list[list[int]],
+        start_epoch: float | None,
+        end_epoch: float | None,
+    ) -> Iterator[dict[str, Any]]:
+        """指定バイト範囲の行を解析し、時刻範囲内のレコードを返す"""
+        for range_start, range_end in byte_ranges:
+            offset = range_start
+            for raw_line in self._iter_lines(log_path, range_start, range_end):
+                offset += len(raw_line)
+
+                line = raw_line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    epoch = parse_ts_epoch(record["ts"])
+                except (ValueError, TypeError, KeyError) as e:
+                    # 解析エラー・タイムスタンプ不正・タイムゾーンなしの行は範囲外扱い
+                    logger.debug(f"Skipped line at {offset} in {log_path}: {e}")
+                    continue
+
+                if start_epoch is not None and epoch < start_epoch:
+                    continue
+                if end_epoch is not None and epoch >= end_epoch:
+                    continue
+                yield record
+
+    def get_log_size(self, target_date: date) -> int:
+        """対象日のログファイルサイズ（バイト）を取得
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            ファイルサイズ
+
+        Raises:
+            LogFileNotFoundError: ファイルが存在しない
+        """
         log_path = self.get_log_path(target_date)
 
         if not log_path.exists():
             logger.error(f"Log file not found: {log_path}")
             raise LogFileNotFoundError(log_path)
 
-        if log_path.stat().st_size == 0:
+        return log_path.stat().st_size
+
+    def _check_log_file(self, target_date: date) -> Path:
+        """ログファイルの存在と空でないことを確認
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            ログファイルパス
+
+        Raises:
+            LogFileNotFoundError: ファイルが存在しない
+            LogFileEmptyError: ファイルが空
+        """
+        if self.get_log_size(target_date) == 0:
+            log_path = self.get_log_path(target_date)
             logger.error(f"Log file is empty: {log_path}")
             raise LogFileEmptyError(log_path)
 
-        records: list[dict[str, Any]] = []
+        return self.get_log_path(target_date)
+
+    def _iter_lines(
+        self, log_path: Path, start_offset: int = 0, end_offset: int | None = None
+    ) -> Iterator[bytes]:
+        """ログファイルの行を改行付きのバイト列として返す
+
+        read_backend に応じてバッファ付き読み込みまたはメモリマップを使う。
+        いずれの場合も文字列へのデコードは行わない（json.loads がバイト列を
+        直接受け付けるため、デコードは実際に解析する行に限られる）。
+
+        Args:
+            log_path: ログファイルパス
+            start_offset: 読み込み開始バイト位置（行頭）
+            end_offset: 読み込み終了バイト位置（行頭、Noneの場合はファイル末尾）
+
+        Yields:
+            1行分のバイト列（末尾行以外は改行を含む）
+        """
+        if self.read_backend == "mmap":
+            yield from _iter_lines_mmap(log_path, start_offset, end_offset)
+            return
+
+        with open(log_path, "rb") as f:
+            f.seek(start_offset)
+            offset = start_offset
+            for raw_line in f:
+                if end_offset is not None and offset >= end_offset:
+                    break
+                offset += len(raw_line)
+                yield raw_line
+
+    def _iter_records(
+        self,
+        log_path: Path,
+        start_offset: int = 0,
+        complete_lines_only: bool = False,
+    ) -> Iterator[tuple[dict[str, Any], int]]:
+        """ログファイルを1行ずつ解析してレコードを返す
+
+        Args:
+            log_path: ログファイルパス
+            start_offset: 読み込み開始バイト位置
+            complete_lines_only: Trueの場合、改行で終端されていない末尾行を読まない
+
+        Yields:
+            (解析成功したレコード, 行末の次のバイト位置)
+
+        Raises:
+            LogFileEmptyError: 先頭から読み込んで有効なレコードが0件（空行のみ）
+            LogParseError: 先頭から読み込んで全行が解析エラー
+        """
+        record_count = 0
         total_lines = 0
         error_lines = 0
+        offset = start_offset
 
-        logger.info(f"Reading raw logs from: {log_path}")
+        logger.info(f"Reading raw logs from: {log_path} (offset={start_offset})")
 
-        with open(log_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, start=1):
-                total_lines += 1
-                line = line.strip()
+        lines = self._iter_lines(log_path, start_offset)
+        for line_num, raw_line in enumerate(lines, start=1):
+            if complete_lines_only and not raw_line.endswith(b"\n"):
+                # 書き込み途中の行は次回に回す
+                break
 
-                if not line:
-                    # 空行はスキップ（エラーカウントに含めない）
-                    continue
+            offset += len(raw_line)
+            total_lines += 1
+            line = raw_line.strip()
 
-                try:
-                    record = json.loads(line)
-                    records.append(record)
-                except json.JSONDecodeError as e:
-                    error_lines += 1
-                    logger.warning(
-                        f"Failed to parse line {line_num} in {log_path}: {e}"
-                    )
-                    logger.debug(f"Invalid line content: {line[:100]}")
+            if not line:
+                # 空行はスキップ（エラーカウントに含めない）
+                continue
+
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                error_lines += 1
+                logger.warning(f"Failed to parse line {line_num} in {log_path}: {e}")
+                logger.debug(f"Invalid line content: {line[:100]!r}")
+                continue
+
+            record_count += 1
+            yield record, offset
 
         logger.info(
-            f"Read {len(records)} records from {log_path} "
+            f"Read {record_count} records from {log_path} "
             f"(total_lines={total_lines}, errors={error_lines})"
         )
 
-        # 有効なレコードが0件の場合
-        if len(records) == 0:
+        # 先頭から読み込んで有効なレコードが0件の場合
+        if record_count == 0 and start_offset == 0:
             # エラー行が存在する場合は全行解析エラー
             if error_lines > 0:
                 logger.error(f"All {error_lines} lines failed to parse: {log_path}")
@@ -158,16 +668,15 @@ class LogRepository:
                 logger.error(f"No valid records found in: {log_path}")
                 raise LogFileEmptyError(log_path)
 
-        return records
-
     def save_features(
-        self, target_date: date, features: dict[str, Any]
+        self, target_date: date, features: dict[str, Any] | bytes
     ) -> Path:
         """features.jsonを保存
 
         Args:
             target_date: 対象日
-            features: 特徴量データ（Featuresモデルのdict表現）
+            features: 特徴量データ（Featuresモデルのdict表現、または
+                EncodedFeatures.data のエンコード済みJSONバイト列）
 
         Returns:
             保存したファイルの絶対パス
@@ -175,6 +684,7 @@ class LogRepository:
         Note:
             - ディレクトリが存在しない場合は自動作成
             - UTF-8エンコーディング、BOMなし、インデント2スペース
+              （バイト列はそのまま書き込む）
         """
         features_path = self.get_features_path(target_date)
 
@@ -183,8 +693,12 @@ class LogRepository:
 
         logger.info(f"Saving features to: {features_path}")
 
-        with open(features_path, "w", encoding="utf-8") as f:
-            json.dump(features, f, ensure_ascii=False, indent=2)
+        self._features_cache.pop(features_path, None)
+        if isinstance(features, bytes):
+            features_path.write_bytes(features)
+        else:
+            with open(features_path, "w", encoding="utf-8") as f:
+                json.dump(features, f, ensure_ascii=False, indent=2)
 
         logger.info(f"Features saved successfully: {features_path}")
 
@@ -216,3 +730,208 @@ class LogRepository:
         logger.info(f"Features loaded successfully: {features_path}")
 
         return features
+
+    def load_features_model(self, target_date: date) -> Features | None:
+        """features.jsonを読み込んでFeaturesに変換（LRUキャッシュ付き）
+
+        解析済みのFeaturesをパスごとにキャッシュし、ファイルの (mtime, size) が
+        変わっていなければディスク読み込み・JSON解析・検証を行わずに返す。
+        save_features() で書き込んだ日のキャッシュは破棄する。
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            特徴量。ファイルが存在しない場合はNone
+
+        Raises:
+            pydantic.ValidationError: JSONパースエラー・スキーマ不一致（ファイル破損）
+        """
+        features_path = self.get_features_path(target_date)
+
+        try:
+            f = open(features_path, "rb")
+        except FileNotFoundError:
+            logger.debug(f"Features file not found: {features_path}")
+            self._features_cache.pop(features_path, None)
+            return None
+
+        with f:
+            # 読み込む内容と同じファイルの (mtime, size) で検証する
+            stat = os.fstat(f.fileno())
+            version = (stat.st_mtime_ns, stat.st_size)
+
+            cached = self._features_cache.get(features_path)
+            if cached is not None and cached[0] == version:
+                self._features_cache.move_to_end(features_path)
+                logger.debug(f"Features cache hit: {features_path}")
+                return cached[1]
+
+            logger.info(f"Loading features from: {features_path}")
+            features = Features.model_validate_json(f.read())
+
+        if self.features_cache_size > 0:
+            self._features_cache[features_path] = (version, features)
+            self._features_cache.move_to_end(features_path)
+            while len(self._features_cache) > self.features_cache_size:
+                self._features_cache.popitem(last=False)
+
+        return features
+
+    def clear_features_cache(self) -> None:
+        """load_features_model() のキャッシュを破棄"""
+        self._features_cache.clear()
+
+    def save_checkpoint(self, target_date: date, checkpoint: dict[str, Any]) -> Path:
+        """差分集計チェックポイントを保存
+
+        Args:
+            target_date: 対象日
+            checkpoint: 集計状態と読み込み済みバイト位置
+
+        Returns:
+            保存したファイルの絶対パス
+
+        Note:
+            書き込み途中で中断されても既存チェックポイントが壊れないよう、
+            一時ファイルに書き込んでから置き換える
+        """
+        checkpoint_path = self.get_checkpoint_path(target_date)
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = checkpoint_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, ensure_ascii=False)
+        os.replace(tmp_path, checkpoint_path)
+
+        logger.debug(f"Checkpoint saved: {checkpoint_path}")
+
+        return checkpoint_path
+
+    def load_checkpoint(self, target_date: date) -> dict[str, Any] | None:
+        """差分集計チェックポイントを読み込み
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            チェックポイントデータ。ファイルが存在しない場合はNone
+
+        Raises:
+            json.JSONDecodeError: JSONパースエラー（ファイル破損）
+        """
+        checkpoint_path = self.get_checkpoint_path(target_date)
+
+        if not checkpoint_path.exists():
+            logger.debug(f"Checkpoint file not found: {checkpoint_path}")
+            return None
+
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint: dict[str, Any] = json.load(f)
+
+        logger.debug(f"Checkpoint loaded: {checkpoint_path}")
+
+        return checkpoint
+
+    def has_columnar(self, target_date: date) -> bool:
+        """対象日の列指向アーカイブが利用可能か
+
+        raw.jsonl がアーカイブ作成後に更新されている場合は利用不可とする。
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            利用可能な場合True
+        """
+        columnar_path = self.get_columnar_path(target_date)
+        if not columnar_path.exists():
+            return False
+
+        log_path = self.get_log_path(target_date)
+        if log_path.exists() and (
+            log_path.stat().st_mtime > columnar_path.stat().st_mtime
+        ):
+            logger.info(f"Columnar archive is older than raw log: {columnar_path}")
+            return False
+
+        return True
+
+    def compact_day(self, target_date: date) -> Path:
+        """確定済みの日の raw.jsonl を列指向アーカイブに変換
+
+        raw.jsonl はそのまま残す（アーカイブは集計の読み込み用）。
+
+        Args:
+            target_date: 対象日（当日以降は追記中のため指定不可）
+
+        Returns:
+            保存したアーカイブの絶対パス
+
+        Raises:
+            ValueError: 対象日が当日以降
+            LogFileNotFoundError: ログファイルが存在しない
+            LogFileEmptyError: ログファイルが空
+            LogParseError: 全行解析エラー
+        """
+        if target_date >= date.today():
+            raise ValueError(f"Cannot compact a day that is not closed: {target_date}")
+
+        columnar = ColumnarLog.from_records(self.iter_raw_logs(target_date))
+
+        columnar_path = self.get_columnar_path(target_date)
+        tmp_path = columnar_path.with_suffix(".col.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(columnar.to_bytes())
+        os.replace(tmp_path, columnar_path)
+
+        logger.info(f"Compacted {len(columnar)} records to: {columnar_path}")
+
+        return columnar_path
+
+    def compact_closed_days(self) -> list[Path]:
+        """アーカイブ未作成（または古い）確定済みの日をすべて変換
+
+        Returns:
+            作成したアーカイブのパス一覧（日付順）
+        """
+        compacted: list[Path] = []
+        today = date.today()
+
+        for log_path in sorted(self.base_path.glob("*.jsonl")):
+            try:
+                target_date = date.fromisoformat(log_path.stem)
+            except ValueError:
+                continue
+            if target_date >= today or self.has_columnar(target_date):
+                continue
+
+            try:
+                compacted.append(self.compact_day(target_date))
+            except (LogFileEmptyError, LogParseError) as e:
+                logger.warning(f"Skipped compaction of {log_path}: {e}")
+
+        return compacted
+
+    def read_columnar(self, target_date: date) -> ColumnarLog:
+        """列指向アーカイブを読み込み
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            ColumnarLog
+
+        Raises:
+            LogFileNotFoundError: アーカイブが存在しない
+            ColumnarFormatError: アーカイブの形式が不正
+        """
+        columnar_path = self.get_columnar_path(target_date)
+
+        if not columnar_path.exists():
+            logger.error(f"Columnar archive not found: {columnar_path}")
+            raise LogFileNotFoundError(columnar_path)
+
+        logger.info(f"Reading columnar archive from: {columnar_path}")
+
+        return ColumnarLog.from_bytes(columnar_path.read_bytes(), columnar_path)
@@ -0,0 +1,162 @@
+"""PageMapRepository - 日付と Notion ページの対応表
+
+日付 → (page_id, URL) をログと同じディレクトリの JSON ファイルに保存し、
+日報出力のたびにデータベースを検索しなくて済むようにする。
+複数スレッドから同じインスタンスを更新してよい（publish_reports() のワーカー）。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from src.repositories.log_repository import LogRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PageRef(NamedTuple):
+    """Notion ページの参照"""
+
+    id: str
+    url: str
+
+
+class PageMapRepository:
+    """日付 → Notion ページの対応表（データベースごと）
+
+    ファイル形式:
+        {"version": 1, "databases": {database_id: {"YYYY-MM-DD": {"id": ..., "url": ...}}}}
+
+    Attributes:
+        path: 保存先ファイルパス
+        database_id: 対象の Notion データベースID
+    """
+
+    FILENAME = "notion_pages.json"
+    VERSION = 1
+
+    def __init__(self, database_id: str, path: Path | None = None) -> None:
+        """初期化
+
+        Args:
+            database_id: 対象の Notion データベースID
+            path: 保存先ファイルパス（Noneの場合はログ保存ディレクトリの
+                notion_pages.json）
+        """
+        if path is None:
+            path = LogRepository.DEFAULT_BASE_PATH.expanduser() / self.FILENAME
+
+        self.path = Path(path)
+        self.database_id = database_id
+        self._lock = threading.Lock()
+        self._data = self._load()
+        self._pages: dict[str, dict[str, str]] = self._data["databases"].setdefault(
+            database_id, {}
+        )
+
+    def _load(self) -> dict[str, Any]:
+        """ファイルを読み込み（存在しない・破損・形式が異なる場合は空）"""
+        empty: dict[str, Any] = {"version": self.VERSION, "databases": {}}
+        if not self.path.exists():
+            return empty
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable page map {self.path}: {e}")
+            return empty
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            logger.warning(f"Ignoring page map with unknown format: {self.path}")
+            return empty
+        return data
+
+    def _save(self) -> None:
+        """ファイルに保存（一時ファイルに書き込んでから置き換える）
+
+        呼び出し元で self._lock を取得していること。一時ファイルは呼び出しごとに
+        別名にする（他プロセスの保存と衝突しないように）。
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def get(self, date: str) -> PageRef | None:
+        """日付のページを取得
+
+        Args:
+            date: 日付 (YYYY-MM-DD)
+
+        Returns:
+            ページの参照（記録がない場合はNone）
+        """
+        with self._lock:
+            entry = self._pages.get(date)
+        if entry is None:
+            return None
+        return PageRef(entry["id"], entry["url"])
+
+    def set(self, date: str, page_id: str, url: str) -> None:
+        """日付のページを記録して保存
+
+        Args:
+            date: 日付 (YYYY-MM-DD)
+            page_id: ページID
+            url: ページURL
+        """
+        self.update({date: PageRef(page_id, url)})
+
+    def update(self, pages: dict[str, PageRef]) -> None:
+        """複数の日付のページをまとめて記録して保存（1回だけ書き込む）
+
+        Args:
+            pages: 日付 → ページの参照
+        """
+        with self._lock:
+            changed = False
+            for date, ref in pages.items():
+                entry = {"id": ref.id, "url": ref.url}
+                if self._pages.get(date) != entry:
+                    self._pages[date] = entry
+                    changed = True
+            if changed:
+                self._save()
+
+    def remove(self, *dates: str) -> None:
+        """日付の記録を削除して保存（ページが削除された場合など）
+
+        Args:
+            dates: 日付 (YYYY-MM-DD)
+        """
+        with self._lock:
+            removed = [
+                date for date in dates if self._pages.pop(date, None) is not None
+            ]
+            if removed:
+                self._save()
+
+    def dates(self) -> list[str]:
+        """記録がある日付（昇順）"""
+        with self._lock:
+            return sorted(self._pages)
+
+    def __contains__(self, date: object) -> bool:
+        with self._lock:
+            return date in self._pages
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pages)
@@ -6,28 +6,48 @@ raw.jsonlを読み込み、LLM要約に適した形式（features.json）に変
 
 from __future__ import annotations
 
+import json
 import logging
-from collections import Counter, defaultdict
-from datetime import date, datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, Iterable
 
 from src.domain.features import (
+    AppAccumulator,
     AppRank,
     AppSummary,
     AppUsage,
+    EncodedFeatures,
+    EpochTs,
     Features,
+    FeaturesAccumulator,
     FeaturesMeta,
+    FirstSeenCounter,
     GlobalKeywords,
     TimeBlock,
+    TimeBlockAccumulator,
+)
+from src.domain.session import Session, SessionState
+from src.repositories.columnar import ColumnarFormatError
+from src.repositories.log_repository import (
+    LogFileEmptyError,
+    LogFileNotFoundError,
+    LogParseError,
+    LogRepository,
+)
+from src.utils.text_utils import (
+    calculate_rank,
+    normalize_app_name,
 )
-from src.repositories.log_repository import LogRepository
-from src.utils.text_utils import calculate_rank, merge_keywords, normalize_app_name
 from src.utils.time_utils import (
     JST,
     calculate_duration_min,
+    format_time_of_day,
     get_time_block,
-    parse_ts,
+    parse_ts_epoch_offset,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,278 +62,264 @@ DEFAULT_CONFIG = {
     "top_urls_count": 5,  # 上位URL数
     "sampling_interval_sec": 120,  # サンプリング間隔（秒）
     "min_captures_for_report": 5,  # レポート生成最小キャプチャ数
+    "use_columnar_archive": False,  # 列指向アーカイブ（.col）があれば優先して読む
+    "aggregation_backend": "python",  # 集計バックエンド（"python" / "numpy"）
+    "keyword_capacity": None,  # キーワード類の近似集計で保持する上位件数（None: 正確に集計）
+    "session_max_gap_sec": 300,  # 同一セッションとみなすキャプチャ間隔の上限（秒）
+    "session_features_count": 5,  # セッションごとのキーワード・ファイル・URL数
+    "session_capacity": 500,  # セッション数の上限（キャプチャ数の多い順に残す、None: 無制限）
+    "compact_features_json": False,  # features.json をインデントなしで保存
 }
 
+# 集計バックエンド（"numpy" はオプション依存 numpy が必要）
+AGGREGATION_BACKENDS = ("python", "numpy")
 
-def _filter_recent(
-    records: list[dict[str, Any]],
-    exclude_sec: int = 120,
-    ts_field: str = "ts",
-) -> list[dict[str, Any]]:
-    """直近N秒のレコードを除外（安定化のため）
-
-    Args:
-        records: レコードリスト
-        exclude_sec: 除外する秒数
-        ts_field: タイムスタンプフィールド名
-
-    Returns:
-        フィルタリング後のレコードリスト
-    """
-    if not records:
-        return []
-
-    from datetime import timedelta
-
-    now = datetime.now(JST)
-    threshold = now - timedelta(seconds=exclude_sec)
-
-    filtered = []
-    for record in records:
-        try:
-            ts_value = record.get(ts_field)
-            if ts_value is None:
-                continue
-            ts = parse_ts(ts_value)
-            if ts <= threshold:
-                filtered.append(record)
-        except (ValueError, TypeError):
-            # タイムスタンプが無効なレコードはスキップ
-            continue
-
-    logger.debug(
-        f"Filtered recent records: {len(records)} -> {len(filtered)} "
-        f"(excluded {len(records) - len(filtered)} recent records)"
-    )
 
-    return filtered
+# 差分集計チェックポイントの形式バージョン（集計状態の構造を変えたら上げる）
+CHECKPOINT_VERSION = 6
 
 
-def _group_by_time_block(
-    records: list[dict[str, Any]],
-    block_min: int = 30,
-    ts_field: str = "ts",
-) -> dict[tuple[str, str], list[dict[str, Any]]]:
-    """レコードを時間ブロックでグループ化
+def _parse_record_ts(record: dict[str, Any], ts_field: str = "ts") -> EpochTs | None:
+    """レコードのタイムスタンプを解析
 
     Args:
-        records: レコードリスト
-        block_min: ブロックの長さ（分）
+        record: レコード
         ts_field: タイムスタンプフィールド名
 
     Returns:
-        {(start, end): [records...]} の辞書
+        (UNIX時刻, UTCオフセット秒)。欠損・解析不能・タイムゾーンなしの場合はNone
+        （タイムゾーンなしは閾値と比較できないため無効扱い）
     """
-    blocks: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
-
-    for record in records:
-        try:
-            ts_value = record.get(ts_field)
-            if ts_value is None:
-                continue
-            ts = parse_ts(ts_value)
-            block_key = get_time_block(ts, block_min)
-            blocks[block_key].append(record)
-        except (ValueError, TypeError):
-            continue
-
-    return dict(blocks)
-
-
-def _build_time_blocks(
-    grouped: dict[tuple[str, str], list[dict[str, Any]]],
+    ts_value = record.get(ts_field)
+    if ts_value is None:
+        return None
+    try:
+        return parse_ts_epoch_offset(ts_value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _finalize_time_block(
+    start: str,
+    end: str,
+    block: TimeBlockAccumulator,
     top_keywords_count: int = 10,
     top_files_count: int = 5,
-) -> list[TimeBlock]:
-    """グループ化されたデータから TimeBlock リストを生成
-
-    Args:
-        grouped: 時間ブロックでグループ化されたレコード
-        top_keywords_count: 上位キーワード数
-        top_files_count: 上位ファイル数
+) -> TimeBlock:
+    """時間ブロックの集計状態から TimeBlock を生成
 
-    Returns:
-        TimeBlock リスト（時刻順）
+    プロセス名ごとのカウントをアプリ表示名ごとにまとめ、上位5件の割合を求める。
     """
-    time_blocks: list[TimeBlock] = []
-
-    for (start, end), block_records in sorted(grouped.items()):
-        if not block_records:
-            continue
-
-        # アプリ別カウント
-        app_counter: Counter[str] = Counter()
-        for record in block_records:
-            process_name = record.get("process_name")
-            app_name = normalize_app_name(process_name)
-            app_counter[app_name] += 1
-
-        total_count = sum(app_counter.values())
-
-        # AppUsage リスト作成（上位5件）
-        apps: list[AppUsage] = []
-        for app_name, count in app_counter.most_common(5):
-            percent = (count / total_count) * 100 if total_count > 0 else 0.0
-            apps.append(AppUsage(name=app_name, percent=percent))
-
-        # キーワード集計
-        top_keywords = merge_keywords(block_records, field="keywords")[
-            :top_keywords_count
-        ]
-
-        # ファイル集計
-        top_files = merge_keywords(block_records, field="files")[:top_files_count]
-
-        time_blocks.append(
-            TimeBlock(
-                start=start,
-                end=end,
-                apps=apps,
-                top_keywords=top_keywords,
-                top_files=top_files,
-            )
-        )
-
-    return time_blocks
+    app_names = FirstSeenCounter()
+    for process_name, count, seen_at, order, position in block.apps.to_pairs():
+        app_names.add(normalize_app_name(process_name), seen_at, order, position, count)
+    total_count = app_names.total()
+
+    # AppUsage リスト作成（上位5件）
+    apps: list[AppUsage] = []
+    for app_name, count in app_names.ranked(5):
+        percent = (count / total_count) * 100 if total_count > 0 else 0.0
+        apps.append(AppUsage(name=app_name, percent=percent))
+
+    return TimeBlock(
+        start=start,
+        end=end,
+        apps=apps,
+        top_keywords=block.keywords.most_common(top_keywords_count),
+        top_files=block.files.most_common(top_files_count),
+    )
 
 
-def _build_app_summary(
-    records: list[dict[str, Any]],
+def _finalize_app_summary(
+    process_name: str,
+    count: int,
+    app: AppAccumulator,
+    total_count: int,
     sampling_interval_sec: int = 120,
     top_keywords_count: int = 10,
     top_files_count: int = 5,
     top_urls_count: int = 5,
-) -> list[AppSummary]:
-    """アプリケーション別の集計サマリを生成
+) -> AppSummary:
+    """アプリの集計状態から AppSummary を生成"""
+    duration_min = (count * sampling_interval_sec) / 60.0
+
+    # ランク計算
+    rank = AppRank(calculate_rank(count, total_count))
+
+    files = app.files.most_common(top_files_count)
+    urls = app.urls.most_common(top_urls_count)
+
+    return AppSummary(
+        name=normalize_app_name(process_name),
+        process=process_name,
+        count=count,
+        duration_min=duration_min,
+        rank=rank,
+        top_keywords=app.keywords.most_common(top_keywords_count),
+        top_files=files if files else None,
+        top_urls=urls if urls else None,
+    )
+
+
+def _finalize_sessions(
+    sessions: list[SessionState],
+    max_gap_sec: float,
+    sampling_interval_sec: int = 120,
+    features_count: int = 5,
+) -> list[Session]:
+    """セッションの集計状態から Session リストを生成
+
+    継続時間は次のセッションの開始までとする（session_capacity で捨てた
+    短いセッションの時間は直前のセッションに含まれる）。最後のセッションと、
+    max_gap_sec を超える中断の直前のセッションは最後のキャプチャから
+    1サンプリング間隔分とする。
 
     Args:
-        records: レコードリスト
+        sessions: セッションの集計状態（開始時刻順）
+        max_gap_sec: 同一セッションとみなすキャプチャ間隔の上限（秒）
         sampling_interval_sec: サンプリング間隔（秒）
-        top_keywords_count: 上位キーワード数
-        top_files_count: 上位ファイル数
-        top_urls_count: 上位URL数
+        features_count: セッションごとのキーワード・ファイル・URL数
 
     Returns:
-        AppSummary リスト（使用時間降順）
+        Session リスト（開始時刻順）
     """
-    # プロセス名でグループ化
-    app_groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    for record in records:
-        process_name = record.get("process_name") or "Unknown"
-        app_groups[process_name].append(record)
-
-    total_count = len(records)
-    app_summaries: list[AppSummary] = []
-
-    for process_name, app_records in app_groups.items():
-        count = len(app_records)
-        duration_min = (count * sampling_interval_sec) / 60.0
-
-        # ランク計算
-        rank_str = calculate_rank(count, total_count)
-        rank = AppRank(rank_str)
-
-        # アプリ表示名
-        app_name = normalize_app_name(process_name)
-
-        # キーワード集計
-        top_keywords = merge_keywords(app_records, field="keywords")[
-            :top_keywords_count
-        ]
-
-        # ファイル集計
-        files = merge_keywords(app_records, field="files")[:top_files_count]
-        top_files = files if files else None
-
-        # URL集計
-        urls = merge_keywords(app_records, field="urls")[:top_urls_count]
-        top_urls = urls if urls else None
-
-        app_summaries.append(
-            AppSummary(
-                name=app_name,
-                process=process_name,
-                count=count,
-                duration_min=duration_min,
-                rank=rank,
-                top_keywords=top_keywords,
-                top_files=top_files,
-                top_urls=top_urls,
+    result: list[Session] = []
+    for i, session in enumerate(sessions):
+        start_epoch = session.first_ts[0]
+        end_epoch = session.last_ts[0] + sampling_interval_sec
+        if i + 1 < len(sessions):
+            next_start = sessions[i + 1].first_ts[0]
+            if 0 <= next_start - session.last_ts[0] <= max_gap_sec:
+                end_epoch = next_start
+
+        result.append(
+            Session(
+                app=normalize_app_name(session.process_name),
+                process=session.process_name,
+                window_title=session.window_title,
+                start=format_time_of_day(start_epoch, session.first_ts[1]),
+                end=format_time_of_day(session.last_ts[0], session.last_ts[1]),
+                duration_min=round(max(end_epoch - start_epoch, 0) / 60.0, 1),
+                capture_count=session.capture_count,
+                keywords=list(session.keywords)[:features_count],
+                files=list(session.files)[:features_count],
+                urls=list(session.urls)[:features_count],
             )
         )
+    return result
 
-    # 使用時間降順でソート（Featuresの validator でもソートされるが、明示的に）
-    return sorted(app_summaries, key=lambda x: x.duration_min, reverse=True)
 
-
-def _build_global_keywords(
-    records: list[dict[str, Any]],
-    top_keywords_count: int = 10,
-    top_files_count: int = 5,
-    top_urls_count: int = 5,
-) -> GlobalKeywords:
-    """グローバル頻出特徴量を生成
+def _finalize_features(
+    accumulator: FeaturesAccumulator,
+    target_date: date,
+    config: dict[str, Any],
+    total_duration_min: int | None = None,
+) -> Features:
+    """集計状態から Features を確定する
 
     Args:
-        records: レコードリスト
-        top_keywords_count: 上位キーワード数
-        top_files_count: 上位ファイル数
-        top_urls_count: 上位URL数
+        accumulator: 集計状態
+        target_date: 対象日
+        config: 設定パラメータ
+        total_duration_min: 総記録時間（分）。Noneの場合は最初/最後の
+            キャプチャ時刻から計算する（複数日の集計では日ごとの合計を渡す）
 
     Returns:
-        GlobalKeywords オブジェクト
+        Features オブジェクト
     """
-    top_keywords = merge_keywords(records, field="keywords")[:top_keywords_count]
-    top_urls = merge_keywords(records, field="urls")[:top_urls_count]
-    top_files = merge_keywords(records, field="files")[:top_files_count]
-
-    return GlobalKeywords(
-        top_keywords=top_keywords,
-        top_urls=top_urls,
-        top_files=top_files,
+    top_keywords_count = config["top_keywords_count"]
+    top_files_count = config["top_files_count"]
+    top_urls_count = config["top_urls_count"]
+    sampling_interval_sec = config["sampling_interval_sec"]
+
+    time_blocks = [
+        _finalize_time_block(
+            start,
+            end,
+            block,
+            top_keywords_count=top_keywords_count,
+            top_files_count=top_files_count,
+        )
+        for (start, end), block in sorted(accumulator.blocks.items())
+    ]
+
+    # キャプチャ数（=使用時間）の降順、同数は初出順
+    app_summary = [
+        _finalize_app_summary(
+            process_name,
+            count,
+            accumulator.apps[process_name],
+            accumulator.capture_count,
+            sampling_interval_sec=sampling_interval_sec,
+            top_keywords_count=top_keywords_count,
+            top_files_count=top_files_count,
+            top_urls_count=top_urls_count,
+        )
+        for process_name, count in accumulator.app_counts.ranked()
+    ]
+
+    global_keywords = GlobalKeywords(
+        top_keywords=accumulator.keywords.most_common(top_keywords_count),
+        top_urls=accumulator.urls.most_common(top_urls_count),
+        top_files=accumulator.files.most_common(top_files_count),
     )
 
+    accumulator.sessions.compact()
+    sessions = _finalize_sessions(
+        accumulator.sessions.sessions,
+        accumulator.sessions.max_gap_sec,
+        sampling_interval_sec=sampling_interval_sec,
+        features_count=config["session_features_count"],
+    )
 
-def _build_meta(
+    meta = _meta_from_bounds(
+        target_date,
+        accumulator.capture_count,
+        accumulator.first_ts,
+        accumulator.last_ts,
+        sampling_interval_sec=sampling_interval_sec,
+        total_duration_min=total_duration_min,
+    )
+
+    return Features(
+        meta=meta,
+        time_blocks=time_blocks,
+        app_summary=app_summary,
+        global_keywords=global_keywords,
+        sessions=sessions,
+    )
+
+
+def _meta_from_bounds(
     target_date: date,
-    records: list[dict[str, Any]],
+    capture_count: int,
+    first_ts: EpochTs | None,
+    last_ts: EpochTs | None,
     sampling_interval_sec: int = 120,
-    ts_field: str = "ts",
+    total_duration_min: int | None = None,
 ) -> FeaturesMeta:
-    """メタデータを生成
+    """キャプチャ数と最初/最後の時刻からメタデータを生成
 
     Args:
         target_date: 対象日
-        records: レコードリスト
+        capture_count: キャプチャ数
+        first_ts: 最初のキャプチャ時刻（UNIX時刻, UTCオフセット秒）（なければNone）
+        last_ts: 最後のキャプチャ時刻（UNIX時刻, UTCオフセット秒）（なければNone）
         sampling_interval_sec: サンプリング間隔（秒）
-        ts_field: タイムスタンプフィールド名
+        total_duration_min: 総記録時間（分）。Noneの場合は最初/最後の時刻から計算
 
     Returns:
         FeaturesMeta オブジェクト
     """
-    capture_count = len(records)
-
-    # 最初と最後のキャプチャ時刻を取得
-    timestamps: list[datetime] = []
-    for record in records:
-        try:
-            ts_value = record.get(ts_field)
-            if ts_value:
-                timestamps.append(parse_ts(ts_value))
-        except (ValueError, TypeError):
-            continue
-
-    if timestamps:
-        timestamps.sort()
-        first_ts = timestamps[0]
-        last_ts = timestamps[-1]
-        first_capture = first_ts.strftime("%H:%M:%S")
-        last_capture = last_ts.strftime("%H:%M:%S")
-        total_duration_min = calculate_duration_min(
-            first_ts.isoformat(),
-            last_ts.isoformat(),
-            sampling_interval_sec,
-        )
+    if first_ts is not None and last_ts is not None:
+        first_capture = format_time_of_day(*first_ts)
+        last_capture = format_time_of_day(*last_ts)
+        if total_duration_min is None:
+            total_duration_min = calculate_duration_min(
+                first_ts[0],
+                last_ts[0],
+                sampling_interval_sec,
+            )
     else:
         first_capture = "00:00:00"
         last_capture = "00:00:00"
@@ -339,13 +345,13 @@ class LogAggregationService:
     処理ステップ:
     1. 対象日のログファイル特定
     2. raw.jsonl 読み込み（直近N秒除外）
-    3. 時間ブロック生成
-    4. アプリ別集計
-    5. キーワード集計
-    6. features.json 出力
+    3. セッション化（連続する同一 (window_title, process_name) をマージ）
+    4. 時間ブロック生成
+    5. アプリ別集計
+    6. キーワード集計
+    7. features.json 出力
 
-    Note:
-        セッション化（Phase 2機能）は現在スキップ
+    2〜6はレコードを1件ずつ読みながら1パスで処理する。
     """
 
     def __init__(
@@ -358,15 +364,45 @@ class LogAggregationService:
         Args:
             repository: LogRepositoryインスタンス（依存性注入）
             config: 設定パラメータ（オプション）
+
+        Raises:
+            ValueError: 未知の集計バックエンド
+            ImportError: "numpy" バックエンド指定時に numpy がインストールされていない
         """
         self.repository = repository or LogRepository()
         self.config = {**DEFAULT_CONFIG, **(config or {})}
 
+        backend = self.config["aggregation_backend"]
+        if backend not in AGGREGATION_BACKENDS:
+            raise ValueError(
+                f"Unknown aggregation backend: {backend} "
+                f"(expected one of {AGGREGATION_BACKENDS})"
+            )
+        self._numpy_backend: ModuleType | None = None
+        if backend == "numpy":
+            try:
+                from src.services import numpy_backend
+            except ImportError as e:
+                raise ImportError(
+                    "aggregation_backend='numpy' requires numpy "
+                    "(pip install daily-report-bot[numpy])"
+                ) from e
+            if self.config["keyword_capacity"] is None:
+                self._numpy_backend = numpy_backend
+            else:
+                # 近似集計の結果は取り込み順に依存するため、Python実装と同じく逐次に数える
+                logger.info(
+                    "keyword_capacity is set; aggregating with the Python backend"
+                )
+
         logger.debug(f"LogAggregationService initialized with config: {self.config}")
 
     def aggregate(self, target_date: date | None = None) -> Features:
         """ログを集計してFeaturesを生成
 
+        raw.jsonlをストリーミングで読み込み、各レコードを1パスで
+        時間ブロック・アプリ別・キーワード・メタデータの集計に取り込む。
+
         Args:
             target_date: 対象日（Noneの場合は当日）
 
@@ -384,86 +420,444 @@ class LogAggregationService:
 
         logger.info(f"Starting aggregation for date: {target_date}")
 
-        # 1. raw.jsonl 読み込み
-        raw_records = self.repository.read_raw_logs(target_date)
-        logger.info(f"Read {len(raw_records)} raw records")
+        # 1. raw.jsonl 読み込み + 2. 直近N秒除外 + 3-5. 集計（1パス）
+        accumulator = self._fold_day(target_date)
+
+        # 6. Features 作成
+        return self._build_features(accumulator, target_date)
+
+    def aggregate_range(
+        self, start: date, end: date, workers: int | None = None
+    ) -> Features:
+        """期間 [start, end]（両端を含む）のログを集計して1つのFeaturesを生成
+
+        日ごとの集計をプロセスプールに分散し、各ワーカーは集計状態のdict
+        （Featuresより小さくpickle可能）を返す。集計状態は日付順に結合するため、
+        ワーカー数や完了順によらず結果は同じになる。過去日の再生成（FR-8）や
+        週次・月次レポート（FR-21）向け。
+
+        - ログがない・空・全行解析エラーの日はスキップする
+        - 時間ブロックは時刻（HH:MM）ごとに全日分を合算する
+        - meta.date は start、総記録時間は日ごとの記録時間の合計
 
-        # 2. 直近N秒を除外
-        records = _filter_recent(
-            raw_records,
-            exclude_sec=self.config["exclude_recent_sec"],
-            ts_field="ts",
+        Args:
+            start: 開始日
+            end: 終了日（この日を含む）
+            workers: ワーカープロセス数（Noneの場合はCPU数と日数の小さい方、
+                1以下の場合はプロセスを使わずに順に集計する）
+
+        Returns:
+            集計結果のFeaturesオブジェクト
+
+        Raises:
+            ValueError: start が end より後
+        """
+        if start > end:
+            raise ValueError(f"start must not be after end: {start} > {end}")
+
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        if workers is None:
+            workers = min(os.cpu_count() or 1, len(days))
+
+        logger.info(
+            f"Starting range aggregation: {start} - {end} "
+            f"({len(days)} days, workers={workers})"
         )
-        logger.info(f"After filtering recent: {len(records)} records")
 
-        # 最小キャプチャ数チェック
-        min_captures = self.config["min_captures_for_report"]
-        if len(records) < min_captures:
-            logger.warning(
-                f"Not enough captures for report: {len(records)} < {min_captures}"
-            )
-            # 警告のみでエラーにはしない（空のFeaturesを返す）
+        if workers <= 1:
+            states = [self._aggregate_day_state(day) for day in days]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                states = list(
+                    executor.map(
+                        _aggregate_day_state,
+                        [self.repository.base_path] * len(days),
+                        [self.repository.read_backend] * len(days),
+                        [self.config] * len(days),
+                        days,
+                    )
+                )
+
+        # 日付順に結合（executor.map は入力順に結果を返す）
+        accumulator = self._new_accumulator()
+        total_duration_min = 0
+        aggregated_days = 0
+        for state in states:
+            if state is None:
+                continue
+            day_accumulator = FeaturesAccumulator.from_dict(state)
+            if day_accumulator.first_ts is not None:
+                total_duration_min += calculate_duration_min(
+                    day_accumulator.first_ts[0],
+                    day_accumulator.last_ts[0],
+                    self.config["sampling_interval_sec"],
+                )
+            accumulator.merge(day_accumulator)
+            aggregated_days += 1
+
+        logger.info(f"Aggregated {aggregated_days}/{len(days)} days")
+
+        return self._build_features(
+            accumulator, start, total_duration_min=total_duration_min
+        )
 
-        # 3. 時間ブロック生成
-        grouped = _group_by_time_block(
-            records,
-            block_min=self.config["time_block_min"],
-            ts_field="ts",
+    def _aggregate_day_state(self, target_date: date) -> dict[str, Any] | None:
+        """1日分を集計して集計状態のdictを返す（aggregate_range 用）
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            集計状態のdict。ログがない・空・全行解析エラーの場合はNone
+        """
+        try:
+            return self._fold_day(target_date).to_dict()
+        except (LogFileNotFoundError, LogFileEmptyError, LogParseError) as e:
+            logger.info(f"Skipping {target_date}: {e}")
+            return None
+
+    def _fold_day(self, target_date: date) -> FeaturesAccumulator:
+        """1日分のログを集計状態に取り込む
+
+        列指向アーカイブを使う設定でアーカイブがあればそちらを読む。
+        アーカイブが破損・不完全な場合は警告を出して raw.jsonl から集計する。
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            集計状態
+
+        Raises:
+            LogFileNotFoundError: ログファイルが存在しない
+            LogFileEmptyError: ログファイルが空
+            LogParseError: 全行解析エラー
+        """
+        if self.config["use_columnar_archive"] and self.repository.has_columnar(
+            target_date
+        ):
+            try:
+                columnar = self.repository.read_columnar(target_date)
+            except ColumnarFormatError as e:
+                logger.warning(f"{e}; falling back to raw log")
+            else:
+                if self._numpy_backend is not None:
+                    return self._numpy_backend.fold_columnar(
+                        columnar, self._recent_threshold(), self._new_accumulator()
+                    )
+                return self._fold_rows(columnar.iter_rows())
+
+        return self._fold_records(self.repository.iter_raw_logs(target_date))
+
+    def aggregate_window(
+        self,
+        target_date: date | None = None,
+        start: time | None = None,
+        end: time | None = None,
+    ) -> Features:
+        """指定時間帯 [start, end) のログのみを集計してFeaturesを生成
+
+        時刻インデックスを使い、時間帯外のバイト範囲は読み込まない。
+        時間帯レポートや時間ブロック単位の再生成向け。
+
+        Args:
+            target_date: 対象日（Noneの場合は当日）
+            start: 開始時刻（JST、Noneの場合は日の始まりから）
+            end: 終了時刻（JST、この時刻は含まない、Noneの場合は最後まで）
+
+        Returns:
+            集計結果のFeaturesオブジェクト
+
+        Raises:
+            LogFileNotFoundError: ログファイルが存在しない
+            LogFileEmptyError: ログファイルが空
+        """
+        if target_date is None:
+            target_date = date.today()
+
+        start_dt = datetime.combine(target_date, start, JST) if start else None
+        end_dt = datetime.combine(target_date, end, JST) if end else None
+
+        logger.info(
+            f"Starting windowed aggregation for date: {target_date} "
+            f"({start or 'start'} - {end or 'end'})"
         )
-        time_blocks = _build_time_blocks(
-            grouped,
-            top_keywords_count=self.config["top_keywords_count"],
-            top_files_count=self.config["top_files_count"],
+
+        records = self.repository.iter_raw_logs_between(
+            target_date, start=start_dt, end=end_dt
         )
-        logger.info(f"Generated {len(time_blocks)} time blocks")
-
-        # 4. アプリ別集計
-        app_summary = _build_app_summary(
-            records,
-            sampling_interval_sec=self.config["sampling_interval_sec"],
-            top_keywords_count=self.config["top_keywords_count"],
-            top_files_count=self.config["top_files_count"],
-            top_urls_count=self.config["top_urls_count"],
+        accumulator = self._fold_records(records)
+
+        return self._build_features(accumulator, target_date)
+
+    def aggregate_incremental(self, target_date: date | None = None) -> Features:
+        """前回実行時からの追記分のみを集計してFeaturesを生成
+
+        features.json と同じディレクトリのチェックポイント（集計状態と
+        読み込み済みバイト位置）を復元し、それ以降に追記された行だけを
+        読み込んで集計に加える。直近N秒のレコードに達した時点で読み込みを止め、
+        その位置をチェックポイントとして保存する（次回実行時に集計される）。
+
+        チェックポイントが存在しない・破損している・設定（time_block_min・
+        keyword_capacity・session_max_gap_sec・session_capacity）が変わった・
+        ログファイルが縮んだ場合は先頭から集計し直す。
+
+        Args:
+            target_date: 対象日（Noneの場合は当日）
+
+        Returns:
+            集計結果のFeaturesオブジェクト
+
+        Raises:
+            LogFileNotFoundError: ログファイルが存在しない
+            LogFileEmptyError: 先頭から集計する際にログファイルが空
+            LogParseError: 先頭から集計する際に全行解析エラー
+        """
+        if target_date is None:
+            target_date = date.today()
+
+        accumulator, offset = self._restore_checkpoint(target_date)
+        logger.info(
+            f"Starting incremental aggregation for date: {target_date} "
+            f"(offset={offset}, captures={accumulator.capture_count})"
         )
-        logger.info(f"Generated {len(app_summary)} app summaries")
-
-        # 5. キーワード集計
-        global_keywords = _build_global_keywords(
-            records,
-            top_keywords_count=self.config["top_keywords_count"],
-            top_files_count=self.config["top_files_count"],
-            top_urls_count=self.config["top_urls_count"],
+
+        offset = self._fold_appended(
+            accumulator, self.repository.iter_raw_logs_from(target_date, offset), offset
         )
 
-        # 6. メタデータ生成
-        meta = _build_meta(
+        self.repository.save_checkpoint(
             target_date,
-            records,
-            sampling_interval_sec=self.config["sampling_interval_sec"],
-            ts_field="ts",
+            {
+                "version": CHECKPOINT_VERSION,
+                "offset": offset,
+                "state": accumulator.to_dict(),
+            },
         )
 
-        # Features 作成
-        features = Features(
-            meta=meta,
-            time_blocks=time_blocks,
-            app_summary=app_summary,
-            global_keywords=global_keywords,
+        return self._build_features(accumulator, target_date)
+
+    def _build_features(
+        self,
+        accumulator: FeaturesAccumulator,
+        target_date: date,
+        total_duration_min: int | None = None,
+    ) -> Features:
+        """集計状態から Features を生成
+
+        Args:
+            accumulator: 集計状態
+            target_date: 対象日
+            total_duration_min: 総記録時間（分）（Noneの場合は最初/最後の時刻から計算）
+
+        Returns:
+            集計結果のFeaturesオブジェクト
+        """
+        logger.info(f"After filtering recent: {accumulator.capture_count} records")
+
+        # 最小キャプチャ数チェック
+        min_captures = self.config["min_captures_for_report"]
+        if accumulator.capture_count < min_captures:
+            logger.warning(
+                f"Not enough captures for report: "
+                f"{accumulator.capture_count} < {min_captures}"
+            )
+            # 警告のみでエラーにはしない（空のFeaturesを返す）
+
+        features = _finalize_features(
+            accumulator, target_date, self.config, total_duration_min=total_duration_min
+        )
+        logger.info(
+            f"Generated {len(features.time_blocks)} time blocks, "
+            f"{len(features.app_summary)} app summaries"
         )
 
         logger.info(f"Aggregation completed: {features}")
 
         return features
 
-    def aggregate_and_save(self, target_date: date | None = None) -> tuple[Features, Path]:
+    def _recent_threshold(self) -> float:
+        """直近除外の閾値（UNIX時刻、これより新しいレコードは集計しない）"""
+        return datetime.now(JST).timestamp() - self.config["exclude_recent_sec"]
+
+    def _fold_records(self, records: Iterable[dict[str, Any]]) -> FeaturesAccumulator:
+        """レコードを1パスで集計状態に取り込む
+
+        タイムスタンプは1レコードにつき1回だけ解析し、無効なもの・直近N秒の
+        ものは除外する。
+
+        Args:
+            records: レコードのイテラブル
+
+        Returns:
+            集計状態
+        """
+        return self._fold_rows((_parse_record_ts(record), record) for record in records)
+
+    def _fold_rows(
+        self, rows: Iterable[tuple[EpochTs | None, dict[str, Any]]]
+    ) -> FeaturesAccumulator:
+        """タイムスタンプ解析済みのレコードを1パスで集計状態に取り込む
+
+        Args:
+            rows: (タイムスタンプ（無効ならNone）, レコード) のイテラブル
+
+        Returns:
+            集計状態
+        """
+        threshold = self._recent_threshold()
+        accumulator = self._new_accumulator()
+        if self._numpy_backend is not None:
+            return self._numpy_backend.fold_rows(rows, threshold, accumulator)
+
+        block_min = accumulator.block_min
+
+        read_count = 0
+        for ts, record in rows:
+            read_count += 1
+            if ts is None or ts[0] > threshold:
+                continue
+
+            accumulator.add(record, ts, get_time_block(ts[0], block_min, ts[1]))
+
+        logger.debug(
+            f"Folded records: {read_count} -> {accumulator.capture_count} "
+            f"(excluded {read_count - accumulator.capture_count} records)"
+        )
+
+        return accumulator
+
+    def _fold_appended(
+        self,
+        accumulator: FeaturesAccumulator,
+        entries: Iterable[tuple[dict[str, Any], int]],
+        offset: int,
+    ) -> int:
+        """追記されたレコードを集計状態に取り込み、確定したバイト位置を返す
+
+        Args:
+            accumulator: 集計状態（破壊的に更新）
+            entries: (レコード, 行末のバイト位置) のイテラブル
+            offset: 読み込み開始バイト位置
+
+        Returns:
+            次回の読み込み開始バイト位置
+        """
+        threshold = self._recent_threshold()
+        block_min = accumulator.block_min
+        added = 0
+
+        for record, end_offset in entries:
+            ts = _parse_record_ts(record)
+            if ts is not None:
+                if ts[0] > threshold:
+                    # 直近N秒のレコード以降は次回に持ち越す
+                    break
+                accumulator.add(record, ts, get_time_block(ts[0], block_min, ts[1]))
+                added += 1
+            offset = end_offset
+
+        logger.info(f"Folded {added} appended records (next offset={offset})")
+
+        return offset
+
+    def _restore_checkpoint(self, target_date: date) -> tuple[FeaturesAccumulator, int]:
+        """チェックポイントから集計状態と読み込み済みバイト位置を復元
+
+        Args:
+            target_date: 対象日
+
+        Returns:
+            (集計状態, 読み込み開始バイト位置)。
+            チェックポイントが使えない場合は空の集計状態と0
+
+        Raises:
+            LogFileNotFoundError: ログファイルが存在しない
+        """
+        block_min = self.config["time_block_min"]
+
+        try:
+            checkpoint = self.repository.load_checkpoint(target_date)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Broken checkpoint, re-aggregating from start: {e}")
+            checkpoint = None
+
+        if checkpoint is not None:
+            offset = checkpoint.get("offset", 0)
+            state = checkpoint.get("state") or {}
+
+            if checkpoint.get("version") != CHECKPOINT_VERSION:
+                reason = "version mismatch"
+            elif state.get("block_min") != block_min:
+                reason = "time_block_min changed"
+            elif state.get("keyword_capacity") != self.config["keyword_capacity"]:
+                reason = "keyword_capacity changed"
+            elif (state.get("sessions") or {}).get("max_gap_sec") != self.config[
+                "session_max_gap_sec"
+            ]:
+                reason = "session_max_gap_sec changed"
+            elif (state.get("sessions") or {}).get("capacity") != self.config[
+                "session_capacity"
+            ]:
+                reason = "session_capacity changed"
+            elif offset > self.repository.get_log_size(target_date):
+                reason = "log file truncated"
+            else:
+                try:
+                    return FeaturesAccumulator.from_dict(state), offset
+                except (KeyError, TypeError, ValueError) as e:
+                    reason = f"invalid state: {e}"
+
+            logger.info(f"Discarding checkpoint ({reason}), re-aggregating from start")
+
+        return self._new_accumulator(), 0
+
+    def _new_accumulator(self) -> FeaturesAccumulator:
+        """設定に従った空の集計状態を作成"""
+        return FeaturesAccumulator(
+            block_min=self.config["time_block_min"],
+            keyword_capacity=self.config["keyword_capacity"],
+            session_max_gap_sec=self.config["session_max_gap_sec"],
+            session_capacity=self.config["session_capacity"],
+        )
+
+    def aggregate_and_save(
+        self, target_date: date | None = None, incremental: bool = False
+    ) -> tuple[Features, Path]:
         """ログを集計してfeatures.jsonに保存
 
+        エンコード結果も必要な場合（要約に渡す場合）は aggregate_and_encode() を使う。
+
         Args:
             target_date: 対象日（Noneの場合は当日）
+            incremental: Trueの場合は aggregate_incremental() で差分のみ集計
 
         Returns:
             (Features, 保存パス) のタプル
 
+        Raises:
+            LogFileNotFoundError: ログファイルが存在しない
+            LogFileEmptyError: ログファイルが空
+            LogParseError: 全行解析エラー
+        """
+        encoded, saved_path = self.aggregate_and_encode(target_date, incremental)
+        return encoded.features, saved_path
+
+    def aggregate_and_encode(
+        self, target_date: date | None = None, incremental: bool = False
+    ) -> tuple[EncodedFeatures, Path]:
+        """ログを集計してfeatures.jsonに保存し、保存したエンコード結果を返す
+
+        返した EncodedFeatures を SummarizerService.generate_report() に渡すと、
+        LLM入力・キャッシュキーに保存時のバイト列をそのまま使う。
+
+        Args:
+            target_date: 対象日（Noneの場合は当日）
+            incremental: Trueの場合は aggregate_incremental() で差分のみ集計
+
+        Returns:
+            (EncodedFeatures, 保存パス) のタプル
+
         Raises:
             LogFileNotFoundError: ログファイルが存在しない
             LogFileEmptyError: ログファイルが空
@@ -473,15 +867,41 @@ class LogAggregationService:
             target_date = date.today()
 
         # 集計実行
-        features = self.aggregate(target_date)
+        if incremental:
+            features = self.aggregate_incremental(target_date)
+        else:
+            features = self.aggregate(target_date)
 
-        # JSON形式で保存
-        features_dict = features.model_dump(mode="json")
-        saved_path = self.repository.save_features(target_date, features_dict)
+        # JSON形式で保存（dictを経由せずに1回だけエンコード）
+        encoded = features.encode(compact=self.config["compact_features_json"])
+        saved_path = self.repository.save_features(target_date, encoded.data)
 
         logger.info(f"Features saved to: {saved_path}")
 
-        return features, saved_path
+        return encoded, saved_path
+
+
+def _aggregate_day_state(
+    base_path: Path, read_backend: str, config: dict[str, Any], target_date: date
+) -> dict[str, Any] | None:
+    """ワーカープロセスで1日分を集計して集計状態のdictを返す
+
+    ProcessPoolExecutor から呼ばれるためモジュールレベルに置く。
+
+    Args:
+        base_path: ログ保存ディレクトリ
+        read_backend: LogRepository の読み込み方式
+        config: 設定パラメータ
+        target_date: 対象日
+
+    Returns:
+        集計状態のdict。ログがない・空・全行解析エラーの場合はNone
+    """
+    service = LogAggregationService(
+        repository=LogRepository(base_path, read_backend=read_backend),
+        config=config,
+    )
+    return service._aggregate_day_state(target_date)
 
 
 # 便利関数: デフォルト設定でサービスを作成
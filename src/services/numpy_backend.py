@@ -0,0 +1,510 @@
+"""NumPy集計バックエンド - 大量のキャプチャログを配列演算で集計
+
+LogAggregationService の設定で aggregation_backend="numpy" を指定すると使用する。
+レコードを列（UNIX時刻・アプリコード・キーワードコードのCSR配列）に変換し、
+時間ブロックの割り当てと各種カウント・初出位置を配列演算で求めてから、
+Python実装と同じ集計状態（FeaturesAccumulator）を組み立てる。Features への
+確定処理は共通のため、出力はPython実装と完全に一致する。
+
+列指向アーカイブ（.col）からはレコードのdictを作らずに直接配列へ変換する。
+
+numpy はオプション依存: pip install daily-report-bot[numpy]
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import Any, Iterable
+
+import numpy as np
+
+from src.domain.features import (
+    AppAccumulator,
+    EpochTs,
+    FeaturesAccumulator,
+    FirstSeenCounter,
+    KeywordCounter,
+    TimeBlockAccumulator,
+)
+from src.domain.session import SessionState
+from src.repositories.columnar import LIST_FIELDS, ColumnarLog
+from src.utils.time_utils import get_time_block
+
+logger = logging.getLogger(__name__)
+
+
+class _RecordColumns:
+    """集計対象レコードの列表現
+
+    Attributes:
+        ts_us: UNIX時刻（マイクロ秒）
+        utc_offsets: UTCオフセット（秒）
+        process_codes: process_name のコード（process_values の添字）
+        process_values: コード -> process_name（Noneを含みうる）
+        window_codes: window_title のコード（window_values の添字）
+        window_values: コード -> window_title（Noneを含みうる）
+        list_codes: リスト列ごとの値コード（空文字列は含まない）
+        list_rows: リスト列ごとの各値が属するレコード番号
+        list_positions: リスト列ごとの各値のレコード内の位置
+        list_values: リスト列ごとのコード -> 文字列
+    """
+
+    def __init__(
+        self,
+        ts_us: np.ndarray,
+        utc_offsets: np.ndarray,
+        process_codes: np.ndarray,
+        process_values: list[Any],
+        window_codes: np.ndarray,
+        window_values: list[Any],
+        list_codes: dict[str, np.ndarray],
+        list_rows: dict[str, np.ndarray],
+        list_positions: dict[str, np.ndarray],
+        list_values: dict[str, list[str]],
+    ) -> None:
+        self.ts_us = ts_us
+        self.utc_offsets = utc_offsets
+        self.process_codes = process_codes
+        self.process_values = process_values
+        self.window_codes = window_codes
+        self.window_values = window_values
+        self.list_codes = list_codes
+        self.list_rows = list_rows
+        self.list_positions = list_positions
+        self.list_values = list_values
+
+    def __len__(self) -> int:
+        return len(self.ts_us)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[tuple[EpochTs | None, dict[str, Any]]], threshold: float
+    ) -> _RecordColumns:
+        """タイムスタンプ解析済みのレコードから列表現を作成
+
+        無効なタイムスタンプ・閾値より新しいレコードは除外する。
+        """
+        ts_us: list[int] = []
+        utc_offsets: list[int] = []
+        process_codes: list[int] = []
+        process_index: dict[Any, int] = {}
+        window_codes: list[int] = []
+        window_index: dict[Any, int] = {}
+        list_codes: dict[str, list[int]] = {field: [] for field in LIST_FIELDS}
+        list_rows: dict[str, list[int]] = {field: [] for field in LIST_FIELDS}
+        list_positions: dict[str, list[int]] = {field: [] for field in LIST_FIELDS}
+        list_index: dict[str, dict[str, int]] = {field: {} for field in LIST_FIELDS}
+
+        for ts, record in rows:
+            if ts is None or ts[0] > threshold:
+                continue
+
+            row = len(ts_us)
+            epoch, offset = ts
+            ts_us.append(
+                epoch * 1_000_000
+                if isinstance(epoch, int)
+                else round(epoch * 1_000_000)
+            )
+            utc_offsets.append(offset)
+
+            process_name = record.get("process_name")
+            code = process_index.get(process_name)
+            if code is None:
+                code = process_index[process_name] = len(process_index)
+            process_codes.append(code)
+
+            window_title = record.get("window_title")
+            code = window_index.get(window_title)
+            if code is None:
+                code = window_index[window_title] = len(window_index)
+            window_codes.append(code)
+
+            for field in LIST_FIELDS:
+                values = record.get(field, [])
+                # KeywordCounter.update と同じく、リスト以外・空の値は無視
+                if not isinstance(values, list):
+                    continue
+                index = list_index[field]
+                codes = list_codes[field]
+                for position, value in enumerate(values):
+                    if not value:
+                        continue
+                    code = index.get(value)
+                    if code is None:
+                        code = index[value] = len(index)
+                    codes.append(code)
+                    list_rows[field].append(row)
+                    list_positions[field].append(position)
+
+        def to_arrays(columns: dict[str, list[int]]) -> dict[str, np.ndarray]:
+            return {
+                field: np.array(values, dtype=np.int64)
+                for field, values in columns.items()
+            }
+
+        return cls(
+            ts_us=np.array(ts_us, dtype=np.int64),
+            utc_offsets=np.array(utc_offsets, dtype=np.int64),
+            process_codes=np.array(process_codes, dtype=np.int64),
+            process_values=list(process_index),
+            window_codes=np.array(window_codes, dtype=np.int64),
+            window_values=list(window_index),
+            list_codes=to_arrays(list_codes),
+            list_rows=to_arrays(list_rows),
+            list_positions=to_arrays(list_positions),
+            list_values={field: list(index) for field, index in list_index.items()},
+        )
+
+    @classmethod
+    def from_columnar(cls, columnar: ColumnarLog, threshold: float) -> _RecordColumns:
+        """列指向アーカイブから列表現を作成（レコードのdictは作らない）
+
+        閾値より新しいレコードは除外する。
+        """
+        ts_us = np.frombuffer(columnar.ts_us, dtype=np.int64)
+        keep = ts_us / 1_000_000 <= threshold
+        # 元のレコード番号 -> 除外後のレコード番号
+        renumber = np.cumsum(keep) - 1
+
+        # -1（None）は辞書の末尾に追加した None を指すようにする
+        scalars: dict[str, tuple[np.ndarray, list[Any]]] = {}
+        for field in ("process_name", "window_title"):
+            values: list[Any] = [*columnar.dictionaries[field], None]
+            codes = np.frombuffer(columnar.scalar_codes[field], dtype=np.int32).astype(
+                np.int64
+            )[keep]
+            codes[codes < 0] = len(values) - 1
+            scalars[field] = codes, values
+        process_codes, process_values = scalars["process_name"]
+        window_codes, window_values = scalars["window_title"]
+
+        list_codes: dict[str, np.ndarray] = {}
+        list_rows: dict[str, np.ndarray] = {}
+        list_positions: dict[str, np.ndarray] = {}
+        for field in LIST_FIELDS:
+            offsets = np.frombuffer(columnar.list_offsets[field], dtype=np.int32)
+            codes = np.frombuffer(columnar.list_values[field], dtype=np.int32).astype(
+                np.int64
+            )
+            rows = np.repeat(np.arange(len(ts_us), dtype=np.int64), np.diff(offsets))
+            positions = np.arange(len(codes), dtype=np.int64) - offsets[rows]
+            non_empty = np.array(
+                [bool(value) for value in columnar.dictionaries[field]], dtype=bool
+            )
+            selected = keep[rows] & non_empty[codes]
+            list_codes[field] = codes[selected]
+            list_rows[field] = renumber[rows[selected]]
+            list_positions[field] = positions[selected]
+
+        return cls(
+            ts_us=ts_us[keep],
+            utc_offsets=np.frombuffer(columnar.utc_offsets, dtype=np.int32).astype(
+                np.int64
+            )[keep],
+            process_codes=process_codes,
+            process_values=process_values,
+            window_codes=window_codes,
+            window_values=window_values,
+            list_codes=list_codes,
+            list_rows=list_rows,
+            list_positions=list_positions,
+            list_values={field: columnar.dictionaries[field] for field in LIST_FIELDS},
+        )
+
+
+def _encode(values: list[Any]) -> tuple[np.ndarray, list[Any]]:
+    """値リストを初出順のコードに変換
+
+    Returns:
+        (元の添字 -> コードの配列, コード -> 値のリスト)
+    """
+    index: dict[Any, int] = {}
+    codes = [index.setdefault(value, len(index)) for value in values]
+    return np.array(codes, dtype=np.int64), list(index)
+
+
+def _epoch(us: int) -> int | float:
+    """マイクロ秒を parse_ts_epoch() と同じ表現（小数秒がなければint）に戻す"""
+    seconds, micros = divmod(us, 1_000_000)
+    return us / 1_000_000 if micros else seconds
+
+
+def _grouped_counters(
+    counter_cls: type[FirstSeenCounter],
+    capacity: int | None,
+    groups: np.ndarray | None,
+    keys: np.ndarray,
+    n_keys: int,
+    ts_us: np.ndarray,
+    orders: np.ndarray,
+    positions: np.ndarray,
+    codes: np.ndarray,
+    values: list[str],
+) -> dict[int, FirstSeenCounter]:
+    """出現をグループ・キーごとに数え、FirstSeenCounter の集計状態を組み立てる
+
+    各キーの初出は (時刻, レコード番号, 位置, 表記) の最小値（FirstSeenCounter と
+    同じ規則）。
+
+    Args:
+        counter_cls: 作成するカウンタのクラス
+        capacity: カウンタの近似集計で保持する上位件数（Noneの場合は正確に集計）
+        groups: 出現ごとのグループ番号（Noneの場合は全体で1グループ）
+        keys: 出現ごとの集計キーのコード
+        n_keys: 集計キーのコード数
+        ts_us: 出現ごとの時刻（マイクロ秒）
+        orders: 出現ごとのレコード番号
+        positions: 出現ごとのレコード内の位置
+        codes: 出現ごとの表記のコード
+        values: 表記のコード -> 文字列
+
+    Returns:
+        {グループ番号: カウンタ}
+    """
+    if len(keys) == 0:
+        return {}
+
+    combined = keys if groups is None else groups * n_keys + keys
+    value_rank = np.empty(len(values), dtype=np.int64)
+    value_rank[sorted(range(len(values)), key=values.__getitem__)] = np.arange(
+        len(values)
+    )
+
+    order = np.lexsort((value_rank[codes], positions, orders, ts_us, combined))
+    combined = combined[order]
+    starts = np.flatnonzero(np.concatenate(([True], combined[1:] != combined[:-1])))
+    counts = np.diff(np.append(starts, len(combined)))
+    first = order[starts]
+
+    pairs: dict[int, list[list[Any]]] = defaultdict(list)
+    for key, count, us, row, position, code in zip(
+        (combined[starts] // n_keys).tolist(),
+        counts.tolist(),
+        ts_us[first].tolist(),
+        orders[first].tolist(),
+        positions[first].tolist(),
+        codes[first].tolist(),
+    ):
+        pairs[key].append([values[code], count, _epoch(us), row, position])
+
+    return {group: counter_cls.from_pairs(p, capacity) for group, p in pairs.items()}
+
+
+def _sessions(
+    columns: _RecordColumns,
+    row_apps: np.ndarray,
+    app_names: list[str],
+    max_gap_sec: float,
+) -> list[SessionState]:
+    """アプリ・ウィンドウの変化点と中断からセッションを組み立てる
+
+    SessionBuilder.add() に1件ずつ取り込んだ場合と同じ結果になる。
+    """
+    n = len(columns)
+    ts_us = columns.ts_us
+    window_of_code, window_names = _encode(
+        [value or None for value in columns.window_values]
+    )
+    row_windows = window_of_code[columns.window_codes]
+
+    gaps = np.diff(ts_us)
+    boundaries = np.ones(n, dtype=bool)
+    boundaries[1:] = (
+        (row_apps[1:] != row_apps[:-1])
+        | (row_windows[1:] != row_windows[:-1])
+        | (gaps < 0)
+        | (gaps > round(max_gap_sec * 1_000_000))
+    )
+    starts = np.flatnonzero(boundaries)
+    ends = np.append(starts[1:], n) - 1
+    session_of_row = np.cumsum(boundaries) - 1
+
+    sessions: list[SessionState] = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        session = SessionState(
+            app_names[row_apps[start]],
+            window_names[row_windows[start]],
+            (_epoch(int(ts_us[start])), int(columns.utc_offsets[start])),
+        )
+        session.last_ts = (_epoch(int(ts_us[end])), int(columns.utc_offsets[end]))
+        session.capture_count = end - start + 1
+        sessions.append(session)
+
+    # キーワード等: セッションごとに出現順を保って重複を除く
+    for field in LIST_FIELDS:
+        codes = columns.list_codes[field]
+        if len(codes) == 0:
+            continue
+        values = columns.list_values[field]
+        row_sessions = session_of_row[columns.list_rows[field]]
+        _, first = np.unique(row_sessions * len(values) + codes, return_index=True)
+        first.sort()
+        for index, code in zip(row_sessions[first].tolist(), codes[first].tolist()):
+            getattr(sessions[index], field)[values[code]] = None
+
+    return sessions
+
+
+def _fold_columns(
+    columns: _RecordColumns, accumulator: FeaturesAccumulator
+) -> FeaturesAccumulator:
+    """列表現から空の集計状態を組み立てる
+
+    keyword_capacity を指定した場合は正確に数えた結果を近似集計のカウンタに
+    取り込むため、逐次に取り込む Python 実装とは結果が異なる（集計サービスは
+    keyword_capacity の指定時にこのバックエンドを使わない）。
+    """
+    block_min = accumulator.block_min
+    keyword_capacity = accumulator.keyword_capacity
+    n = len(columns)
+    if n == 0:
+        return accumulator
+
+    ts_us = columns.ts_us
+    utc_offsets = columns.utc_offsets
+
+    # メタデータ: (時刻, オフセット) の最小・最大
+    order = np.lexsort((utc_offsets, ts_us))
+    first, last = int(order[0]), int(order[-1])
+    accumulator.capture_count = n
+    accumulator.first_ts = (_epoch(int(ts_us[first])), int(utc_offsets[first]))
+    accumulator.last_ts = (_epoch(int(ts_us[last])), int(utc_offsets[last]))
+
+    # 時間ブロック: ローカル時刻の分から各時00分起点で block_min ごとに区切る
+    local_sec = ts_us // 1_000_000 + utc_offsets
+    minute_of_day = (local_sec % 86400) // 60
+    block_starts = minute_of_day - (minute_of_day % 60) % block_min
+    block_keys = np.unique(block_starts)
+    block_index = np.zeros(24 * 60, dtype=np.int64)
+    block_index[block_keys] = np.arange(len(block_keys))
+    row_blocks = block_index[block_starts]
+
+    blocks: list[TimeBlockAccumulator] = []
+    for start_minute in block_keys.tolist():
+        block = TimeBlockAccumulator(keyword_capacity)
+        accumulator.blocks[get_time_block(start_minute * 60, block_min, 0)] = block
+        blocks.append(block)
+
+    # アプリ（プロセス）別・時間ブロック別アプリのキャプチャ数
+    app_of_process, app_names = _encode(
+        [value or "Unknown" for value in columns.process_values]
+    )
+    row_apps = app_of_process[columns.process_codes]
+    row_orders = np.arange(n, dtype=np.int64)
+    row_positions = np.zeros(n, dtype=np.int64)
+    app_counters = _grouped_counters(
+        FirstSeenCounter,
+        None,
+        None,
+        row_apps,
+        len(app_names),
+        ts_us,
+        row_orders,
+        row_positions,
+        row_apps,
+        app_names,
+    )
+    if app_counters:
+        accumulator.app_counts = app_counters[0]
+    for index, counter in _grouped_counters(
+        FirstSeenCounter,
+        None,
+        row_blocks,
+        row_apps,
+        len(app_names),
+        ts_us,
+        row_orders,
+        row_positions,
+        row_apps,
+        app_names,
+    ).items():
+        blocks[index].apps = counter
+
+    apps = [AppAccumulator(keyword_capacity) for _ in app_names]
+    for code, app_name in enumerate(app_names):
+        accumulator.apps[app_name] = apps[code]
+
+    # キーワード・ファイル・URL（大文字小文字を無視して集計）
+    for field in LIST_FIELDS:
+        codes = columns.list_codes[field]
+        values = columns.list_values[field]
+        rows = columns.list_rows[field]
+        lower_of_code, lower_values = _encode([value.lower() for value in values])
+        args = (
+            lower_of_code[codes],
+            len(lower_values),
+            ts_us[rows],
+            rows,
+            columns.list_positions[field],
+            codes,
+            values,
+        )
+
+        global_counters = _grouped_counters(
+            KeywordCounter, keyword_capacity, None, *args
+        )
+        if global_counters:
+            setattr(accumulator, field, global_counters[0])
+        for code, counter in _grouped_counters(
+            KeywordCounter, keyword_capacity, row_apps[rows], *args
+        ).items():
+            setattr(apps[code], field, counter)
+        if field in ("keywords", "files"):
+            for index, counter in _grouped_counters(
+                KeywordCounter, keyword_capacity, row_blocks[rows], *args
+            ).items():
+                setattr(blocks[index], field, counter)
+
+    # 出現しなかったアプリ（列指向アーカイブの辞書のみにある値）は除く
+    for app_name in app_names:
+        if app_name not in accumulator.app_counts:
+            del accumulator.apps[app_name]
+
+    accumulator.sessions.sessions = _sessions(
+        columns, row_apps, app_names, accumulator.sessions.max_gap_sec
+    )
+    accumulator.sessions.compact()
+
+    return accumulator
+
+
+def fold_rows(
+    rows: Iterable[tuple[EpochTs | None, dict[str, Any]]],
+    threshold: float,
+    accumulator: FeaturesAccumulator,
+) -> FeaturesAccumulator:
+    """タイムスタンプ解析済みのレコードを配列演算で集計状態に変換
+
+    Args:
+        rows: (タイムスタンプ（無効ならNone）, レコード) のイテラブル
+        threshold: 直近除外の閾値（UNIX時刻）
+        accumulator: 取り込み先の空の集計状態（時間ブロック長などの設定を持つ）
+
+    Returns:
+        集計状態（LogAggregationService._fold_rows と同じ内容）
+    """
+    columns = _RecordColumns.from_rows(rows, threshold)
+    logger.debug(f"Folding {len(columns)} records with NumPy backend")
+    return _fold_columns(columns, accumulator)
+
+
+def fold_columnar(
+    columnar: ColumnarLog, threshold: float, accumulator: FeaturesAccumulator
+) -> FeaturesAccumulator:
+    """列指向アーカイブを配列演算で集計状態に変換
+
+    Args:
+        columnar: 列指向アーカイブ
+        threshold: 直近除外の閾値（UNIX時刻）
+        accumulator: 取り込み先の空の集計状態（時間ブロック長などの設定を持つ）
+
+    Returns:
+        集計状態（columnar.iter_rows() を _fold_rows した場合と同じ内容）
+    """
+    columns = _RecordColumns.from_columnar(columnar, threshold)
+    logger.debug(
+        f"Folding {len(columns)}/{len(columnar)} archived records with NumPy backend"
+    )
+    return _fold_columns(columns, accumulator)
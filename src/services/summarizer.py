@@ -7,10 +7,11 @@ LLM呼び出しが失敗した場合はフォールバックレポートを生
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from typing import Protocol
 
-from src.domain.features import Features
+from src.domain.features import EncodedFeatures, Features
 from src.domain.report import AppUsage as ReportAppUsage
 from src.domain.report import LLMSummary, Report, ReportMeta
 
@@ -33,48 +34,24 @@ class GeminiClientProtocol(Protocol):
         ...
 
 
-def _convert_features_to_dict(features: Features) -> dict:
+def _convert_features_to_dict(
+    features: Features, encoded: EncodedFeatures | None = None
+) -> dict:
     """Features を dict に変換（GeminiGateway のインターフェースに合わせる）
 
+    features.json と同じJSON表現を使う。エンコード済みの結果があれば再利用し、
+    なければ再エンコードせずに model_dump で変換する。
+
     Args:
         features: 集計済み特徴量
+        encoded: features をエンコード済みの場合はその結果
 
     Returns:
         features dict（gemini.py の generate_summary() に渡す形式）
     """
-    return {
-        "meta": {
-            "date": features.meta.date,
-            "generated_at": features.meta.generated_at,
-            "capture_count": features.meta.capture_count,
-            "first_capture": features.meta.first_capture,
-            "last_capture": features.meta.last_capture,
-            "total_duration_min": features.meta.total_duration_min,
-        },
-        "time_blocks": [
-            {
-                "start": block.start,
-                "end": block.end,
-                "apps": [{"name": app.name, "percent": app.percent} for app in block.apps],
-            }
-            for block in features.time_blocks
-        ],
-        "app_summary": [
-            {
-                "name": app.name,
-                "process": app.process,
-                "count": app.count,
-                "duration_min": app.duration_min,
-                "rank": app.rank.value,
-            }
-            for app in features.app_summary
-        ],
-        "global_keywords": {
-            "top_keywords": features.global_keywords.top_keywords,
-            "top_urls": features.global_keywords.top_urls,
-            "top_files": features.global_keywords.top_files,
-        },
-    }
+    if encoded is None or encoded.features is not features:
+        return features.model_dump(mode="json")
+    return encoded.to_dict()
 
 
 def _convert_features_to_app_usage(features: Features) -> list[ReportAppUsage]:
@@ -102,21 +79,90 @@ class SummarizerService:
 
     LLMを使用してFeaturesから日報Reportを生成。
     失敗時はフォールバックレポートを返す。
+
+    エンコード済みの特徴量（EncodedFeatures）を渡された場合は、LLMの要約結果を
+    cache_key（生成時刻を除いた特徴量の内容のハッシュ）ごとにキャッシュし、
+    同じ内容の再生成ではLLMを呼び出さない。
     """
 
-    def __init__(self, gemini_client: GeminiClientProtocol | None = None) -> None:
+    DEFAULT_SUMMARY_CACHE_SIZE = 32  # LLM要約結果のキャッシュ件数
+
+    def __init__(
+        self,
+        gemini_client: GeminiClientProtocol | None = None,
+        summary_cache_size: int = DEFAULT_SUMMARY_CACHE_SIZE,
+    ) -> None:
         """初期化
 
         Args:
             gemini_client: GeminiClientインスタンス（依存性注入）
+            summary_cache_size: LLM要約結果のLRUキャッシュ件数
+                （0の場合はキャッシュしない）
+
+        Raises:
+            ValueError: summary_cache_size が負の場合
         """
+        if summary_cache_size < 0:
+            raise ValueError(f"summary_cache_size must be >= 0: {summary_cache_size}")
+
         self.gemini_client = gemini_client
+        self.summary_cache_size = summary_cache_size
+        # (モデル名, cache_key) → LLM要約結果。末尾が最近使ったもの
+        self._summary_cache: OrderedDict[tuple[str, str], LLMSummary] = OrderedDict()
+
+    def _summarize(
+        self,
+        client: GeminiClientProtocol,
+        features: Features,
+        encoded: EncodedFeatures | None = None,
+    ) -> LLMSummary:
+        """LLMで要約（同じ特徴量・同じモデルの結果はキャッシュから返す）
 
-    def generate_report(self, features: Features) -> Report:
+        Args:
+            client: GeminiClientインスタンス
+            features: 集計済み特徴量
+            encoded: features のエンコード結果（Noneの場合はキャッシュを使わない）
+
+        Returns:
+            LLM生成サマリー
+        """
+        if encoded is None or encoded.features is not features:
+            logger.debug("LLM呼び出し開始")
+            return client.generate_summary(_convert_features_to_dict(features))
+
+        key = (client.model_name, encoded.cache_key)
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            self._summary_cache.move_to_end(key)
+            logger.info("LLM要約キャッシュを使用")
+            return cached.model_copy(deep=True)
+
+        logger.debug("LLM呼び出し開始")
+
+        # GeminiGateway がプロンプト構築からLLM呼び出しまで完結
+        summary = client.generate_summary(
+            _convert_features_to_dict(encoded.features, encoded)
+        )
+
+        if self.summary_cache_size > 0:
+            self._summary_cache[key] = summary.model_copy(deep=True)
+            while len(self._summary_cache) > self.summary_cache_size:
+                self._summary_cache.popitem(last=False)
+        return summary
+
+    def clear_summary_cache(self) -> None:
+        """LLM要約結果のキャッシュを全て破棄"""
+        self._summary_cache.clear()
+
+    def generate_report(
+        self, features: Features, encoded: EncodedFeatures | None = None
+    ) -> Report:
         """日報レポートを生成
 
         Args:
             features: 集計済み特徴量
+            encoded: features.encode() の結果（保存時のエンコードをLLM入力に再利用し、
+                LLM要約をキャッシュする。Noneの場合は model_dump で変換する）
 
         Returns:
             日報レポート（LLM生成またはフォールバック）
@@ -132,13 +178,7 @@ class SummarizerService:
             if self.gemini_client is None:
                 raise ValueError("GeminiClient が設定されていません")
 
-            # Features を dict に変換してGeminiGateway に渡す
-            features_dict = _convert_features_to_dict(features)
-
-            logger.debug("LLM呼び出し開始")
-
-            # GeminiGateway がプロンプト構築からLLM呼び出しまで完結
-            llm_summary = self.gemini_client.generate_summary(features_dict)
+            llm_summary = self._summarize(self.gemini_client, features, encoded)
 
             logger.info("LLM要約成功")
 
@@ -15,8 +15,11 @@ from .block_builder import (
     paragraph,
     rank_to_emoji,
 )
+from .block_diff import BlockDiff, block_signature, diff_blocks
+from .rate_limit import TokenBucket
 from .text_utils import (
     PROCESS_TO_APP_NAME,
+    KeywordCounter,
     calculate_rank,
     merge_keywords,
     normalize_app_name,
@@ -38,6 +41,7 @@ __all__ = [
     "calculate_duration_min",
     # Text utilities
     "merge_keywords",
+    "KeywordCounter",
     "calculate_rank",
     "normalize_app_name",
     "PROCESS_TO_APP_NAME",
@@ -52,4 +56,10 @@ __all__ = [
     "build_report_blocks",
     "build_report_blocks_from_report",
     "build_report_blocks_from_dict",
+    # Block diff utilities
+    "BlockDiff",
+    "block_signature",
+    "diff_blocks",
+    # Rate limit utilities
+    "TokenBucket",
 ]
@@ -0,0 +1,188 @@
+"""Block Diff - Notionページ本文の差分更新
+
+既存の子ブロックと新しく生成したブロックを (type, 内容のハッシュ) で突き合わせ、
+最小限の更新・削除・挿入操作を求める。
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+from typing import Any
+
+# blocks.update で内容（rich_text）を書き換えられるブロック種別
+RICH_TEXT_TYPES = frozenset(
+    {
+        "paragraph",
+        "heading_1",
+        "heading_2",
+        "heading_3",
+        "bulleted_list_item",
+        "numbered_list_item",
+        "quote",
+        "to_do",
+        "toggle",
+        "callout",
+    }
+)
+
+
+def _plain_text(rich_text: list[dict[str, Any]]) -> str:
+    """rich_text 配列をプレーンテキストに連結
+
+    生成したブロック（text.content）と API から取得したブロック（plain_text）の
+    どちらも同じテキストになる。
+    """
+    parts = []
+    for item in rich_text:
+        text = item.get("text")
+        if isinstance(text, dict) and "content" in text:
+            parts.append(text["content"])
+        else:
+            parts.append(item.get("plain_text", ""))
+    return "".join(parts)
+
+
+def block_signature(block: dict[str, Any]) -> str | None:
+    """ブロックの種別と内容から比較用のハッシュを生成
+
+    Args:
+        block: 生成したブロック、または blocks.children.list で取得したブロック
+
+    Returns:
+        ハッシュ文字列。内容を比較できないブロック（子ブロックを含まない
+        取得済みテーブル、未対応の種別）はNone
+
+    Examples:
+        >>> block_signature(paragraph("A")) == block_signature(paragraph("A"))
+        True
+    """
+    block_type = block.get("type")
+    body = block.get(block_type) if isinstance(block_type, str) else None
+    if not isinstance(body, dict):
+        return None
+
+    content: Any
+    if block_type in RICH_TEXT_TYPES:
+        content = _plain_text(body.get("rich_text", []))
+    elif block_type == "divider":
+        content = None
+    elif block_type == "table" and "children" in body:
+        content = [
+            body.get("table_width"),
+            body.get("has_column_header"),
+            body.get("has_row_header"),
+            [
+                [_plain_text(cell) for cell in row["table_row"]["cells"]]
+                for row in body["children"]
+            ],
+        ]
+    else:
+        return None
+
+    payload = json.dumps([block_type, content], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BlockDiff:
+    """ページ本文を新しいブロック列にするための操作
+
+    Attributes:
+        updates: 内容を書き換えるブロック (block_id, 新しいブロック)
+        deletes: 削除するブロックID
+        inserts: 挿入するブロック (直前のブロックID, ブロックリスト)。
+            直前のブロックIDがNoneの場合は末尾に追加（既存ブロックが全て
+            削除される場合のみ）
+        kept: 変更しないブロック数
+    """
+
+    __slots__ = ("updates", "deletes", "inserts", "kept")
+
+    def __init__(self) -> None:
+        self.updates: list[tuple[str, dict[str, Any]]] = []
+        self.deletes: list[str] = []
+        self.inserts: list[tuple[str | None, list[dict[str, Any]]]] = []
+        self.kept = 0
+
+    @property
+    def call_count(self) -> int:
+        """必要なAPI呼び出し数（挿入は1回の追加にまとめた場合）"""
+        return len(self.updates) + len(self.deletes) + len(self.inserts)
+
+    def __bool__(self) -> bool:
+        return self.call_count > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"BlockDiff(kept={self.kept}, updates={len(self.updates)}, "
+            f"deletes={len(self.deletes)}, "
+            f"inserts={sum(len(blocks) for _, blocks in self.inserts)})"
+        )
+
+    def _insert(self, after: str | None, block: dict[str, Any]) -> None:
+        if self.inserts and self.inserts[-1][0] == after:
+            self.inserts[-1][1].append(block)
+        else:
+            self.inserts.append((after, [block]))
+
+
+def diff_blocks(
+    existing: list[dict[str, Any]], blocks: list[dict[str, Any]]
+) -> BlockDiff:
+    """既存の子ブロックを blocks にするための最小限の操作を求める
+
+    (type, 内容のハッシュ) が一致するブロックはそのまま残し、位置が対応する
+    同じ種別のテキストブロックは内容を更新する。それ以外は削除・挿入する。
+
+    Notion API は先頭への挿入ができないため、残すブロックより前に挿入が
+    必要な場合は全ブロックを置換する操作を返す。
+
+    Args:
+        existing: blocks.children.list で取得した既存の子ブロック（順序通り）
+        blocks: 新しいブロックリスト
+
+    Returns:
+        BlockDiff
+    """
+    # 比較できないブロックは他のどのブロックとも一致しない値にする
+    old_keys = [
+        block_signature(block) or f"?old:{i}" for i, block in enumerate(existing)
+    ]
+    new_keys = [block_signature(block) or f"?new:{i}" for i, block in enumerate(blocks)]
+
+    diff = BlockDiff()
+    anchor: str | None = None
+    matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            diff.kept += i2 - i1
+            anchor = existing[i2 - 1]["id"]
+            continue
+
+        old, new = existing[i1:i2], blocks[j1:j2]
+        for k in range(max(len(old), len(new))):
+            before = old[k] if k < len(old) else None
+            after = new[k] if k < len(new) else None
+            if (
+                before is not None
+                and after is not None
+                and before.get("type") == after.get("type")
+                and after.get("type") in RICH_TEXT_TYPES
+            ):
+                diff.updates.append((before["id"], after))
+                anchor = before["id"]
+                continue
+            if before is not None:
+                diff.deletes.append(before["id"])
+            if after is not None:
+                diff._insert(anchor, after)
+
+    if any(after is None for after, _ in diff.inserts) and (diff.kept or diff.updates):
+        replace = BlockDiff()
+        replace.deletes = [block["id"] for block in existing]
+        if blocks:
+            replace.inserts = [(None, list(blocks))]
+        return replace
+
+    return diff
@@ -0,0 +1,130 @@
+"""Rate Limit - トークンバケットによるAPI呼び出しの流量制御
+
+スレッド・asyncioタスクをまたいで1つのバケットを共有できる。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """トークンバケット
+
+    rate 件/秒でトークンを補充し、最大 capacity 件までのバーストを許可する。
+    トークンは取得時に予約する（残量が負になった分だけ待機する）ため、
+    並行する呼び出し元の待ち時間は公平に積み上がる。
+
+    pause() で指定秒数の間すべての取得を止められる（HTTP 429 の Retry-After 用）。
+
+    Attributes:
+        rate: 1秒あたりの補充トークン数
+        capacity: バケットの容量（連続して即時に取得できる数）
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化
+
+        Args:
+            rate: 1秒あたりの補充トークン数
+            capacity: バケットの容量（Noneの場合は rate と同じ、最小1）
+            clock: 単調増加する時刻（秒）を返す関数
+
+        Raises:
+            ValueError: rate が0以下、capacity が1未満の場合
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0: {rate}")
+        if capacity is None:
+            capacity = max(1.0, rate)
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1: {capacity}")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._pauses = 0  # pause() で停止を延ばした回数（予約後の停止の検出用）
+
+    def _reserve(self) -> tuple[float, int]:
+        """トークンを1つ予約する
+
+        Returns:
+            (取得まで待機すべき秒数, 予約時点の pause() の回数)
+        """
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._paused_until)
+            elapsed = max(0.0, start - self._updated)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = max(self._updated, start)
+            self._tokens -= 1
+            shortage = -self._tokens if self._tokens < 0 else 0.0
+            return (start - now) + shortage / self.rate, self._pauses
+
+    def _paused_since(self, pauses: int) -> bool:
+        """予約後に pause() されたか"""
+        with self._lock:
+            return self._pauses != pauses
+
+    def acquire(self) -> float:
+        """トークンを1つ取得（取得できるまでスレッドをブロック）
+
+        Returns:
+            待機した秒数
+        """
+        waited = 0.0
+        while True:
+            wait, pauses = self._reserve()
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+            # 待機中に pause() された場合は予約を取り直し、再開後も rate の間隔で取得する
+            if not self._paused_since(pauses):
+                return waited
+
+    async def acquire_async(self) -> float:
+        """トークンを1つ取得（取得できるまでタスクを待機）
+
+        Returns:
+            待機した秒数
+        """
+        waited = 0.0
+        while True:
+            wait, pauses = self._reserve()
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+            if not self._paused_since(pauses):
+                return waited
+
+    def pause(self, seconds: float) -> None:
+        """指定秒数の間、全ての取得を止める
+
+        再開後はバケットが空の状態から補充する（再開直後のバーストを避ける）。
+        停止前に予約して待機中の呼び出し元は、待機後に予約を取り直す。
+
+        Args:
+            seconds: 停止する秒数
+        """
+        with self._lock:
+            until = self._clock() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                # 待機中の予約は取り直されるため、その分の不足も破棄する
+                self._tokens = 0.0
+                self._updated = max(self._updated, until)
+                self._pauses += 1
@@ -5,9 +5,10 @@
 
 from __future__ import annotations
 
-from collections import Counter
 from typing import Literal
 
+from src.domain.features import KeywordCounter
+
 # プロセス名からアプリ表示名へのマッピング
 PROCESS_TO_APP_NAME: dict[str, str] = {
     "Code.exe": "Visual Studio Code",
@@ -35,15 +36,25 @@ PROCESS_TO_APP_NAME: dict[str, str] = {
 }
 
 
-def merge_keywords(records: list[dict], field: str = "keywords") -> list[str]:
+def merge_keywords(
+    records: list[dict],
+    field: str = "keywords",
+    capacity: int | None = None,
+    limit: int | None = None,
+) -> list[str]:
     """大文字小文字を無視して重複排除、出現頻度でソート
 
     複数のレコードからキーワードを抽出し、出現頻度の高い順にソートしたユニークなリストを返す。
+    capacity を指定すると上位K件の近似集計（Misra-Gries）になり、異なるキーワードが
+    どれだけ多くてもメモリは capacity に比例する量で済む。
 
     Args:
         records: キーワードフィールドを含むレコードのリスト
                  各レコードは {field: ["keyword1", "keyword2", ...], ...} の形式
         field: キーワードフィールド名（デフォルト: "keywords"）
+        capacity: 近似集計で保持する上位件数（デフォルト: None = 全件を正確に集計）
+        limit: 返す上位件数（デフォルト: None = 全件）。指定時は全件をソートせず
+               heapq で上位のみを選ぶ（同数の順序は全件の場合と同じ）
 
     Returns:
         出現頻度順にソートされたユニークなキーワードリスト
@@ -57,34 +68,11 @@ def merge_keywords(records: list[dict], field: str = "keywords") -> list[str]:
         >>> merge_keywords(records)
         ['python', 'API', 'Testing', 'Docker']
     """
-    # 全キーワードを小文字化して収集
-    all_keywords: list[str] = []
+    counter = KeywordCounter(capacity)
     for record in records:
-        keywords = record.get(field, [])
-        if isinstance(keywords, list):
-            all_keywords.extend(keywords)
-
-    # 大文字小文字を無視してカウント（小文字化）
-    keyword_counter: Counter[str] = Counter()
-    original_case: dict[str, str] = {}  # 小文字 -> 最初に出現した元の表記
-
-    for keyword in all_keywords:
-        if not keyword:  # 空文字列をスキップ
-            continue
-
-        keyword_lower = keyword.lower()
-        keyword_counter[keyword_lower] += 1
-
-        # 最初に出現した表記を保持
-        if keyword_lower not in original_case:
-            original_case[keyword_lower] = keyword
-
-    # 出現頻度順にソート（降順）、元の表記を使用
-    sorted_keywords = [
-        original_case[keyword] for keyword, _ in keyword_counter.most_common()
-    ]
+        counter.update(record.get(field, []))
 
-    return sorted_keywords
+    return counter.most_common(limit)
 
 
 def calculate_rank(count: int, total_count: int) -> Literal["high", "medium", "low"]:
@@ -10,6 +10,23 @@ from datetime import datetime, timedelta, timezone
 # JSTタイムゾーン
 JST = timezone(timedelta(hours=9))
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+
+# 固定フォーマット（YYYY-MM-DDTHH:MM:SS(.fff)+09:00）用のキャッシュ
+# オフセット文字列（"+09:00"）-> UTCオフセット秒
+_UTC_OFFSET_CACHE: dict[str, int] = {}
+# 時までのローカル時刻（"YYYY-MM-DDTHH"）-> UTCとみなしたUNIX時刻
+_HOUR_EPOCH_CACHE: dict[str, int] = {}
+_HOUR_EPOCH_CACHE_MAX = 65536
+
+# 分・秒（"00"-"59"）、ミリ秒（"000"-"999"）の文字列 -> 値（形式チェックを兼ねる）
+_SEXAGESIMAL = {f"{i:02d}": i for i in range(60)}
+_MILLIS = {f"{i:03d}": i * 1000 for i in range(1000)}
+
+# 1日の分（0-1439）-> "HH:MM"
+_HHMM = [f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60)]
+
 
 def parse_ts(ts: str) -> datetime:
     """ISO 8601タイムスタンプをパース
@@ -31,6 +48,130 @@ def parse_ts(ts: str) -> datetime:
     return datetime.fromisoformat(ts)
 
 
+def parse_ts_epoch(ts: str) -> int | float:
+    """ISO 8601タイムスタンプをUNIX時刻（秒）にパース
+
+    ロガーの固定フォーマット（YYYY-MM-DDTHH:MM:SS(.fff)+09:00）は
+    datetimeを生成せずに文字列スライスとキャッシュで変換する。
+    それ以外の形式は parse_ts() にフォールバックする。
+
+    Args:
+        ts: ISO 8601形式のタイムスタンプ文字列（タイムゾーン付き）
+
+    Returns:
+        UNIX時刻（小数秒がなければint、あればfloat）
+
+    Raises:
+        ValueError: パース失敗時、またはタイムゾーンがない場合
+
+    Examples:
+        >>> parse_ts_epoch("2024-01-15T09:30:45+09:00")
+        1705278645
+        >>> parse_ts_epoch("2024-01-15T09:30:45.500+09:00")
+        1705278645.5
+    """
+    return parse_ts_epoch_offset(ts)[0]
+
+
+def parse_ts_epoch_offset(ts: str) -> tuple[int | float, int]:
+    """ISO 8601タイムスタンプをUNIX時刻とUTCオフセットにパース
+
+    parse_ts_epoch() と同じ変換を行い、時間ブロック計算などローカル時刻が
+    必要な処理のためにUTCオフセット（秒）も返す。
+
+    Args:
+        ts: ISO 8601形式のタイムスタンプ文字列（タイムゾーン付き）
+
+    Returns:
+        (UNIX時刻, UTCオフセット秒) のタプル
+
+    Raises:
+        ValueError: パース失敗時、またはタイムゾーンがない場合
+        TypeError: 文字列以外が渡された場合
+
+    Examples:
+        >>> parse_ts_epoch_offset("2024-01-15T09:30:45+09:00")
+        (1705278645, 32400)
+    """
+    n = len(ts)
+    if n >= 25 and ts[13] == ":" and ts[16] == ":":
+        hour_epoch = _HOUR_EPOCH_CACHE.get(ts[:13])
+        offset = _UTC_OFFSET_CACHE.get(ts[-6:])
+        minute = _SEXAGESIMAL.get(ts[14:16])
+        second = _SEXAGESIMAL.get(ts[17:19])
+        if (
+            hour_epoch is not None
+            and offset is not None
+            and minute is not None
+            and second is not None
+        ):
+            epoch = hour_epoch + minute * 60 + second - offset
+            if n == 25:
+                return epoch, offset
+            if ts[19] == ".":
+                # ミリ秒（3桁）・マイクロ秒（6桁）のみ高速パスで扱う
+                if n == 29:
+                    micros = _MILLIS.get(ts[20:23])
+                elif n == 32 and ts[20:26].isdigit():
+                    micros = int(ts[20:26])
+                else:
+                    micros = None
+                if micros == 0:
+                    return epoch, offset
+                if micros is not None:
+                    return (epoch * 1_000_000 + micros) / 1_000_000, offset
+
+    return _parse_ts_epoch_offset_slow(ts)
+
+
+def _parse_ts_epoch_offset_slow(ts: str) -> tuple[int | float, int]:
+    """parse_ts_epoch_offset() のフォールバック（キャッシュへの登録も行う）"""
+    dt = parse_ts(ts)
+    utc_offset = dt.utcoffset()
+    if utc_offset is None:
+        raise ValueError(f"Timestamp without UTC offset: {ts}")
+    offset = int(utc_offset.total_seconds())
+
+    # 固定フォーマットであれば次回以降の高速パス用にキャッシュ
+    if (
+        len(ts) >= 25
+        and ts[4] == "-"
+        and ts[7] == "-"
+        and ts[10] == "T"
+        and ts[13] == ":"
+        and ts[-6] in "+-"
+        and ts[-3] == ":"
+    ):
+        if len(_HOUR_EPOCH_CACHE) >= _HOUR_EPOCH_CACHE_MAX:
+            _HOUR_EPOCH_CACHE.clear()
+        local_hour = dt.replace(tzinfo=None, minute=0, second=0, microsecond=0)
+        _HOUR_EPOCH_CACHE[ts[:13]] = (local_hour - _EPOCH_NAIVE) // timedelta(seconds=1)
+        _UTC_OFFSET_CACHE[ts[-6:]] = offset
+
+    micros = (dt - _EPOCH) // timedelta(microseconds=1)
+    if micros % 1_000_000 == 0:
+        return micros // 1_000_000, offset
+    return micros / 1_000_000, offset
+
+
+def format_time_of_day(epoch: int | float, utc_offset_sec: int = 32400) -> str:
+    """UNIX時刻をローカル時刻の "HH:MM:SS" 文字列に変換
+
+    Args:
+        epoch: UNIX時刻（秒）
+        utc_offset_sec: UTCオフセット秒（デフォルト: JST）
+
+    Returns:
+        "HH:MM:SS"形式の時刻（小数秒は切り捨て）
+
+    Examples:
+        >>> format_time_of_day(1705278645, 32400)
+        '09:30:45'
+    """
+    local_sec = (int(epoch // 1) + utc_offset_sec) % 86400
+    return f"{_HHMM[local_sec // 60]}:{local_sec % 60:02d}"
+
+
 def filter_recent_records(records: list[dict], exclude_sec: int = 120) -> list[dict]:
     """直近N秒のレコードを除外（安定化のため）
 
@@ -73,14 +214,20 @@ def filter_recent_records(records: list[dict], exclude_sec: int = 120) -> list[d
     return filtered
 
 
-def get_time_block(ts: datetime, block_min: int = 30) -> tuple[str, str]:
+def get_time_block(
+    ts: datetime | int | float,
+    block_min: int = 30,
+    utc_offset_sec: int = 32400,
+) -> tuple[str, str]:
     """時刻から時間ブロック（開始・終了）を取得
 
     指定された時刻を含む時間ブロックの開始・終了時刻を計算。
+    ブロックは各時の00分を起点に block_min ごとに区切る。
 
     Args:
-        ts: 対象のdatetimeオブジェクト
+        ts: 対象のdatetimeオブジェクト、またはUNIX時刻（秒）
         block_min: ブロックの長さ（分）、デフォルト: 30分
+        utc_offset_sec: ts がUNIX時刻の場合のUTCオフセット秒（デフォルト: JST）
 
     Returns:
         (開始時刻, 終了時刻) のタプル、"HH:MM"形式
@@ -96,26 +243,24 @@ def get_time_block(ts: datetime, block_min: int = 30) -> tuple[str, str]:
         >>> ts = datetime(2024, 1, 15, 14, 20)
         >>> get_time_block(ts, block_min=60)
         ('14:00', '15:00')
+        >>> get_time_block(1705278645, block_min=30)  # 09:30:45 JST
+        ('09:30', '10:00')
     """
-    # 分を block_min で切り捨て
-    minutes_since_hour = ts.minute
-    block_start_minute = (minutes_since_hour // block_min) * block_min
+    if isinstance(ts, datetime):
+        minute_of_day = ts.hour * 60 + ts.minute
+    else:
+        minute_of_day = ((int(ts // 1) + utc_offset_sec) % 86400) // 60
 
-    # ブロック開始時刻
-    block_start = ts.replace(minute=block_start_minute, second=0, microsecond=0)
+    # 時内の分を block_min で切り捨て
+    block_start = minute_of_day - (minute_of_day % 60) % block_min
+    block_end = (block_start + block_min) % (24 * 60)
 
-    # ブロック終了時刻
-    block_end = block_start + timedelta(minutes=block_min)
-
-    return (
-        block_start.strftime("%H:%M"),
-        block_end.strftime("%H:%M"),
-    )
+    return _HHMM[block_start], _HHMM[block_end]
 
 
 def calculate_duration_min(
-    first_ts: str,
-    last_ts: str,
+    first_ts: str | int | float,
+    last_ts: str | int | float,
     sampling_interval_sec: int = 120,
 ) -> int:
     """総記録時間を計算（分）
@@ -123,8 +268,8 @@ def calculate_duration_min(
     最初と最後のタイムスタンプから、サンプリング間隔を考慮した総記録時間を計算。
 
     Args:
-        first_ts: 最初のタイムスタンプ（ISO 8601形式）
-        last_ts: 最後のタイムスタンプ（ISO 8601形式）
+        first_ts: 最初のタイムスタンプ（ISO 8601形式、またはUNIX時刻）
+        last_ts: 最後のタイムスタンプ（ISO 8601形式、またはUNIX時刻）
         sampling_interval_sec: サンプリング間隔（秒）、デフォルト: 120秒
 
     Returns:
@@ -141,13 +286,15 @@ def calculate_duration_min(
         >>> last = "2024-01-15T11:00:00+09:00"
         >>> calculate_duration_min(first, last)
         120
+        >>> calculate_duration_min(1705276800, 1705277400)  # UNIX時刻
+        12
     """
     try:
-        start = parse_ts(first_ts)
-        end = parse_ts(last_ts)
-
-        # 差分を計算（秒）
-        delta_sec = (end - start).total_seconds()
+        if isinstance(first_ts, str) or isinstance(last_ts, str):
+            # 差分を計算（秒）
+            delta_sec = (parse_ts(last_ts) - parse_ts(first_ts)).total_seconds()
+        else:
+            delta_sec = last_ts - first_ts
 
         # サンプリング間隔を加算（最後のサンプルもカウント）
         total_sec = delta_sec + sampling_interval_sec
@@ -0,0 +1,143 @@
+"""Gemini Gateway テスト"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.domain.report import LLMSummary
+from src.gateways.gemini import (
+    AsyncGeminiGateway,
+    generate_summary_with_fallback_async,
+)
+
+SUMMARY = LLMSummary(work_summary="テスト")
+
+
+class _Response:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class FakeAsyncModels:
+    """client.aio.models の代替（応答を順番に返す）
+
+    応答が "hang" の場合はキャンセルされるまで待機する。
+    """
+
+    def __init__(self, responses: list[Any]) -> None:
+        self.responses = list(responses)
+        self.calls = 0
+        self.cancelled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_content(self, **kwargs: Any) -> _Response:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            response = self.responses.pop(0)
+            if response == "hang":
+                await asyncio.Event().wait()
+            if isinstance(response, Exception):
+                raise response
+            return _Response(response)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+class FakeAsyncClient:
+    """google.genai の AsyncClient の代替"""
+
+    def __init__(self, responses: list[Any]) -> None:
+        self.models = FakeAsyncModels(responses)
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _gateway(client: FakeAsyncClient, **kwargs: Any) -> AsyncGeminiGateway:
+    fake: Any = client
+    return AsyncGeminiGateway(
+        timeout_sec=kwargs.pop("timeout_sec", 0.05),
+        retry_delay_sec=0,
+        client=fake,
+        **kwargs,
+    )
+
+
+class TestAsyncGeminiGateway:
+    """AsyncGeminiGateway クラスのテスト"""
+
+    def test_init_requires_api_key(self, monkeypatch):
+        """APIキー未設定時はValueError"""
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        with pytest.raises(ValueError):
+            AsyncGeminiGateway()
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_request_before_retry(self):
+        """タイムアウトした呼び出しはキャンセルされ、リトライと重ならない"""
+        client = FakeAsyncClient(["hang", "hang", SUMMARY.model_dump_json()])
+
+        summary = await _gateway(client).generate_summary({})
+
+        assert summary == SUMMARY
+        assert client.models.calls == 3
+        assert client.models.cancelled == 2
+        assert client.models.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_exhausted(self):
+        """全てのリトライが失敗したら例外"""
+        client = FakeAsyncClient([RuntimeError("boom"), "hang"])
+
+        with pytest.raises(Exception, match="failed after 2 attempts: API call timed"):
+            await _gateway(client, retry_count=1).generate_summary({})
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_client(self):
+        """async with を抜けるとクライアントを閉じる"""
+        client = FakeAsyncClient([])
+
+        async with _gateway(client):
+            pass
+
+        assert client.closed
+
+
+class TestGenerateSummaryWithFallbackAsync:
+    """generate_summary_with_fallback_async 関数のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_success(self):
+        """成功時はLLMのサマリー"""
+        client = FakeAsyncClient([SUMMARY.model_dump_json()])
+
+        summary, success, error = await generate_summary_with_fallback_async(
+            {}, gateway=_gateway(client)
+        )
+
+        assert (summary, success, error) == (SUMMARY, True, None)
+        # 渡されたゲートウェイは閉じない（複数日で使い回す）
+        assert not client.closed
+
+    @pytest.mark.asyncio
+    async def test_fallback_on_failure(self):
+        """全てのリトライが失敗した場合はテンプレートサマリー"""
+        client = FakeAsyncClient(["not json"] * 3)
+
+        summary, success, error = await generate_summary_with_fallback_async(
+            {}, gateway=_gateway(client)
+        )
+
+        assert success is False
+        assert error is not None
+        assert summary.main_tasks[0].title == "作業記録"
@@ -0,0 +1,709 @@
+"""Notion Gateway テスト"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from notion_client.errors import APIResponseError
+
+from src.domain.report import Report, ReportMeta
+from src.gateways import notion
+from src.gateways.notion import (
+    AsyncNotionGateway,
+    NotionGateway,
+    build_report_blocks,
+    paragraph,
+    publish_report,
+    publish_report_async,
+    publish_reports,
+)
+from src.repositories.page_map import PageMapRepository
+from src.utils.block_diff import block_signature
+from src.utils.rate_limit import TokenBucket
+
+
+class _Endpoint:
+    """API呼び出しを FakeAsyncClient.handle() に転送する非同期エンドポイント"""
+
+    def __init__(self, client: FakeAsyncClient, name: str) -> None:
+        self._client = client
+        self._name = name
+
+    def __getattr__(self, method: str) -> Any:
+        async def call(**kwargs: Any) -> Any:
+            return await self._client.handle(f"{self._name}.{method}", kwargs)
+
+        return call
+
+
+class FakeAsyncClient:
+    """notion_client.AsyncClient の代替（ページの子ブロックをメモリ上に保持）"""
+
+    def __init__(self, store: dict[str, list[Any]] | None = None) -> None:
+        # page_id -> 子ブロック（IDのみの場合は内容を比較できないブロック）
+        self.store: dict[str, list[dict[str, Any]]] = {
+            page_id: [_stored(block, f"b{i}") for i, block in enumerate(blocks)]
+            for page_id, blocks in (store or {}).items()
+        }
+        # page_id -> 日付（最初から存在するページは DATE）
+        self.dates: dict[str, str] = {page_id: DATE for page_id in self.store}
+        # アーカイブ済み（ゴミ箱）のページ
+        self.archived: set[str] = set()
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.failures: dict[str, list[Exception]] = {}
+        self.page_size = 100
+        self.closed = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # FakeSyncClient 経由で複数スレッドから呼ばれる場合の排他
+        self._lock = threading.Lock()
+        self.databases = _Endpoint(self, "databases")
+        self.pages = _Endpoint(self, "pages")
+        self.blocks = _Endpoint(self, "blocks")
+        self.blocks.children = _Endpoint(self, "blocks.children")
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+    async def handle(self, name: str, kwargs: dict[str, Any]) -> Any:
+        self.calls.append((name, kwargs))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # 他のタスクに制御を渡して並行実行を観測できるようにする
+            await asyncio.sleep(0)
+        finally:
+            self.in_flight -= 1
+        with self._lock:
+            return self._dispatch(name, kwargs)
+
+    def _dispatch(self, name: str, kwargs: dict[str, Any]) -> Any:
+        if self.failures.get(name):
+            raise self.failures[name].pop(0)
+        if len(kwargs.get("children", [])) > 100:
+            raise _api_error(400, "validation_error")
+
+        if name == "databases.query":
+            matched = [
+                _page(page_id, date)
+                for page_id, date in sorted(self.dates.items(), key=lambda x: x[1])
+                if _matches(kwargs["filter"], date) and page_id not in self.archived
+            ]
+            start = int(kwargs.get("start_cursor", 0))
+            end = start + min(kwargs.get("page_size", 100), self.page_size)
+            return {
+                "results": matched[start:end],
+                "has_more": end < len(matched),
+                "next_cursor": str(end) if end < len(matched) else None,
+            }
+        if name == "pages.create":
+            page_id = f"page{len(self.store) + 1}"
+            self.store[page_id] = [
+                _stored(block, f"new{i}") for i, block in enumerate(kwargs["children"])
+            ]
+            self.dates[page_id] = kwargs["properties"]["日付"]["date"]["start"]
+            return _page(page_id, self.dates[page_id])
+        if name == "pages.update":
+            if kwargs["page_id"] not in self.store:
+                raise _api_error(404, "object_not_found")
+            if kwargs["page_id"] in self.archived:
+                raise _api_error(
+                    400,
+                    "validation_error",
+                    "Can't edit block that is archived. "
+                    "You must unarchive the block before editing.",
+                )
+            return {"id": kwargs["page_id"]}
+        if name == "blocks.children.list":
+            children = self.store[kwargs["block_id"]]
+            start = int(kwargs.get("start_cursor", 0))
+            end = start + self.page_size
+            return {
+                "results": children[start:end],
+                "has_more": end < len(children),
+                "next_cursor": str(end) if end < len(children) else None,
+            }
+        if name == "blocks.delete":
+            for page_id, children in self.store.items():
+                self.store[page_id] = [
+                    block for block in children if block["id"] != kwargs["block_id"]
+                ]
+            return {"id": kwargs["block_id"]}
+        if name == "blocks.update":
+            block = self._find(kwargs.pop("block_id"))
+            block.update(kwargs)
+            return block
+        if name == "blocks.children.append":
+            children = self.store[kwargs["block_id"]]
+            new = [
+                _stored(block, f"new{len(self.calls)}-{i}")
+                for i, block in enumerate(kwargs["children"])
+            ]
+            after = kwargs.get("after")
+            index = len(children)
+            if after is not None:
+                index = [block["id"] for block in children].index(after) + 1
+            children[index:index] = new
+            return {"results": new}
+        raise AssertionError(f"unexpected call: {name}")
+
+    def _find(self, block_id: str) -> dict[str, Any]:
+        for children in self.store.values():
+            for block in children:
+                if block["id"] == block_id:
+                    return block
+        raise AssertionError(f"unknown block: {block_id}")
+
+    def names(self) -> list[str]:
+        return [name for name, _ in self.calls]
+
+    def ids(self, page_id: str) -> list[str]:
+        return [block["id"] for block in self.store[page_id]]
+
+
+class _SyncEndpoint(_Endpoint):
+    """同期クライアント用のエンドポイント（スレッドから呼び出し可）"""
+
+    def __getattr__(self, method: str) -> Any:
+        def call(**kwargs: Any) -> Any:
+            return asyncio.run(self._client.handle(f"{self._name}.{method}", kwargs))
+
+        return call
+
+
+class FakeSyncClient:
+    """FakeAsyncClient を notion_client.Client として使うアダプタ"""
+
+    def __init__(self, fake: FakeAsyncClient) -> None:
+        self.databases = _SyncEndpoint(fake, "databases")
+        self.pages = _SyncEndpoint(fake, "pages")
+        self.blocks = _SyncEndpoint(fake, "blocks")
+        self.blocks.children = _SyncEndpoint(fake, "blocks.children")
+
+
+DATE = "2025-01-15"
+
+
+def _page(page_id: str, date: str) -> dict[str, Any]:
+    """APIのページデータ"""
+    return {
+        "id": page_id,
+        "url": f"https://notion.so/{page_id}",
+        "properties": {"日付": {"date": {"start": date}}},
+    }
+
+
+def _matches(condition: dict[str, Any], date: str) -> bool:
+    """databases.query の日付フィルタを評価"""
+    if "and" in condition:
+        return all(_matches(c, date) for c in condition["and"])
+    op, value = next(iter(condition["date"].items()))
+    return {
+        "equals": date == value,
+        "on_or_after": date >= value,
+        "on_or_before": date <= value,
+        "is_not_empty": True,
+    }[op]
+
+
+def _api_error(
+    status: int, code: str, message: str = "", **headers: str
+) -> APIResponseError:
+    """APIResponseError（notion-client のバージョンによらず生成）"""
+    error = APIResponseError.__new__(APIResponseError)
+    error.args = (message,)
+    error.status = status
+    error.code = code
+    error.headers = {key.replace("_", "-"): value for key, value in headers.items()}
+    return error
+
+
+def _stored(block: Any, block_id: str) -> dict[str, Any]:
+    """ブロックIDを付与して保存用のブロックにする"""
+    if isinstance(block, str):
+        return {"id": block}
+    return {**block, "id": block_id}
+
+
+def _texts(blocks: list[dict[str, Any]]) -> list[str]:
+    """段落ブロックのテキスト"""
+    return [block["paragraph"]["rich_text"][0]["text"]["content"] for block in blocks]
+
+
+def _properties(date: str = DATE) -> dict[str, Any]:
+    return {"日付": {"date": {"start": date}}}
+
+
+def _unlimited() -> TokenBucket:
+    """テストで待機しないレート制限"""
+    return TokenBucket(rate=1_000_000)
+
+
+def _gateway(client: FakeAsyncClient, **kwargs: Any) -> AsyncNotionGateway:
+    fake: Any = client
+    kwargs.setdefault("rate_limiter", _unlimited())
+    return AsyncNotionGateway(
+        token="secret", database_id="db", retry_delay_sec=0, client=fake, **kwargs
+    )
+
+
+REPORT_TIME = datetime(2025, 1, 15, 18, 0, 0)
+
+
+def _report() -> Report:
+    return Report(
+        meta=ReportMeta(date="2025-01-15", generated_at=REPORT_TIME),
+        work_summary="テスト",
+    )
+
+
+class TestAsyncNotionGateway:
+    """AsyncNotionGateway クラスのテスト"""
+
+    def test_init_requires_token(self, monkeypatch):
+        """トークン未設定時はValueError"""
+        monkeypatch.delenv("NOTION_TOKEN", raising=False)
+        with pytest.raises(ValueError):
+            AsyncNotionGateway(database_id="db")
+
+    @pytest.mark.asyncio
+    async def test_retry_then_success(self):
+        """失敗した呼び出しはリトライされる"""
+        client = FakeAsyncClient({"page1": []})
+        client.failures["pages.update"] = [RuntimeError("timeout")]
+
+        await _gateway(client).update_page("page1", {})
+
+        assert client.names() == ["pages.update", "pages.update"]
+
+    @pytest.mark.asyncio
+    async def test_retry_exhausted(self):
+        """全てのリトライが失敗したら例外"""
+        client = FakeAsyncClient({"page1": []})
+        client.failures["pages.update"] = [RuntimeError("timeout")] * 2
+
+        with pytest.raises(Exception, match="Notion update failed after 2 attempts"):
+            await _gateway(client, retry_count=1).update_page("page1", {})
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_honours_retry_after(self):
+        """429 の Retry-After の間、共有のレート制限を止めてからリトライ"""
+        paused: list[float] = []
+
+        class RecordingBucket(TokenBucket):
+            def pause(self, seconds: float) -> None:
+                paused.append(seconds)
+
+        client = FakeAsyncClient({"page1": []})
+        client.failures["pages.update"] = [
+            _api_error(429, "rate_limited", retry_after="2")
+        ]
+        gateway = _gateway(client, rate_limiter=RecordingBucket(rate=1_000_000))
+
+        await gateway.update_page("page1", {})
+
+        assert paused == [2.0]
+        assert client.names() == ["pages.update", "pages.update"]
+
+    @pytest.mark.asyncio
+    async def test_list_blocks_paginates(self):
+        """子ブロックをページネーションして全件取得"""
+        client = FakeAsyncClient({"page1": [f"b{i}" for i in range(5)]})
+        client.page_size = 2
+
+        blocks = await _gateway(client).list_blocks("page1")
+
+        assert [block["id"] for block in blocks] == [f"b{i}" for i in range(5)]
+        assert client.names().count("blocks.children.list") == 3
+
+
+class TestDeleteBlocks:
+    """ブロックの並行削除のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_async_concurrency_is_bounded(self):
+        """同時実行数は delete_concurrency 以下"""
+        client = FakeAsyncClient({"page1": [f"b{i}" for i in range(10)]})
+        gateway = _gateway(client, delete_concurrency=3)
+
+        deleted = await gateway.clear_blocks("page1")
+
+        assert deleted == 10
+        assert client.store["page1"] == []
+        assert client.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_async_failed_blocks_retried_as_group(self):
+        """失敗したブロックだけをまとめてリトライ"""
+        client = FakeAsyncClient({"page1": [f"b{i}" for i in range(5)]})
+        client.failures["blocks.delete"] = [RuntimeError("timeout")] * 2
+        gateway = _gateway(client, delete_concurrency=5)
+
+        failed = await gateway.delete_blocks(client.ids("page1"))
+
+        assert failed == []
+        assert client.store["page1"] == []
+        assert client.names().count("blocks.delete") == 7
+
+    @pytest.mark.asyncio
+    async def test_async_returns_blocks_not_deleted(self):
+        """全てのリトライで失敗したブロックIDを返す"""
+        client = FakeAsyncClient({"page1": ["b0", "b1"]})
+        client.failures["blocks.delete"] = [RuntimeError("timeout")] * 3
+        gateway = _gateway(client, retry_count=1, delete_concurrency=1)
+
+        failed = await gateway.delete_blocks(["b0", "b1"])
+
+        # 1回目: b0, b1 が失敗 → 2回目: b0 が失敗、b1 は成功
+        assert failed == ["b0"]
+        assert client.ids("page1") == ["b0"]
+
+    def test_sync_delete_blocks(self):
+        """同期版も並行して削除し、失敗分をまとめてリトライ"""
+        gateway = NotionGateway(
+            token="secret",
+            database_id="db",
+            retry_delay_sec=0,
+            delete_concurrency=4,
+            rate_limiter=_unlimited(),
+        )
+        lock = threading.Lock()
+        attempts: dict[str, int] = {}
+
+        def delete(block_id: str) -> dict[str, str]:
+            with lock:
+                attempts[block_id] = attempts.get(block_id, 0) + 1
+                first = attempts[block_id] == 1
+            if first and block_id in ("b1", "b3"):
+                raise RuntimeError("timeout")
+            return {"id": block_id}
+
+        gateway.client = MagicMock()
+        gateway.client.blocks.delete.side_effect = delete
+
+        failed = gateway.delete_blocks([f"b{i}" for i in range(6)])
+
+        assert failed == []
+        assert attempts == {"b0": 1, "b1": 2, "b2": 1, "b3": 2, "b4": 1, "b5": 1}
+
+    def test_invalid_concurrency(self):
+        """delete_concurrency が1未満ならValueError"""
+        with pytest.raises(ValueError):
+            NotionGateway(token="secret", database_id="db", delete_concurrency=0)
+
+
+class TestUpdateBlocks:
+    """差分更新のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_blocks_are_written(self):
+        """作業サマリーだけが変わった場合は1ブロックの更新のみ"""
+        before = build_report_blocks(_report())
+        client = FakeAsyncClient({"page1": before})
+        changed = _report().model_copy(update={"work_summary": "変更後"})
+        blocks = build_report_blocks(changed)
+
+        diff = await _gateway(client).update_blocks("page1", blocks)
+
+        assert diff.call_count == 1
+        assert client.names() == ["blocks.children.list", "blocks.update"]
+        assert [block_signature(b) for b in client.store["page1"]] == [
+            block_signature(b) for b in blocks
+        ]
+
+
+class TestChunkedAppend:
+    """子ブロック数の上限（100件）を超えるブロックの追加のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_create_page_appends_rest(self):
+        """101件目以降はページ作成後に順番に追加"""
+        client = FakeAsyncClient()
+        blocks = [paragraph(str(i)) for i in range(250)]
+
+        page = await _gateway(client).create_page(_properties(), blocks)
+
+        assert client.names() == [
+            "pages.create",
+            "blocks.children.append",
+            "blocks.children.append",
+        ]
+        assert _texts(client.store[page["id"]]) == [str(i) for i in range(250)]
+
+    @pytest.mark.asyncio
+    async def test_insert_after_keeps_order(self):
+        """途中への挿入はチャンクをつなげて順序を保つ"""
+        client = FakeAsyncClient({"page1": [paragraph("head"), paragraph("tail")]})
+        blocks = [paragraph(str(i)) for i in range(150)]
+
+        added = await _gateway(client).append_blocks("page1", blocks, after="b0")
+
+        assert len(added) == 150
+        assert _texts(client.store["page1"]) == ["head"] + _texts(blocks) + ["tail"]
+
+    def test_only_failed_chunk_is_retried(self):
+        """失敗したチャンクだけを再送"""
+        fake = FakeAsyncClient({"page1": []})
+        fake.failures["blocks.children.append"] = [RuntimeError("timeout")]
+        gateway = NotionGateway(
+            token="secret",
+            database_id="db",
+            retry_delay_sec=0,
+            rate_limiter=_unlimited(),
+        )
+        client: Any = FakeSyncClient(fake)
+        gateway.client = client
+        blocks = [paragraph(str(i)) for i in range(201)]
+
+        gateway.append_blocks("page1", blocks)
+
+        sizes = [len(kwargs["children"]) for _, kwargs in fake.calls]
+        assert sizes == [100, 100, 100, 1]
+        assert _texts(fake.store["page1"]) == _texts(blocks)
+
+
+class TestPageMap:
+    """日付 → ページの対応表を使った出力のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_cached_page_skips_query(self, tmp_path):
+        """記録済みのページは検索せずに更新"""
+        page_map = PageMapRepository("db", path=tmp_path / "pages.json")
+        page_map.set(DATE, "page1", "https://notion.so/page1")
+        client = FakeAsyncClient({"page1": []})
+
+        await publish_report_async(
+            _report(), gateway=_gateway(client, page_map=page_map)
+        )
+
+        assert "databases.query" not in client.names()
+        assert "pages.update" in client.names()
+
+    @pytest.mark.asyncio
+    async def test_created_page_is_recorded(self, tmp_path):
+        """作成したページをファイルに記録し、次回は検索しない"""
+        path = tmp_path / "pages.json"
+        client = FakeAsyncClient()
+        gateway = _gateway(client, page_map=PageMapRepository("db", path=path))
+
+        page_id, _ = await publish_report_async(_report(), gateway=gateway)
+        gateway.page_map = PageMapRepository("db", path=path)
+        await publish_report_async(_report(), gateway=gateway)
+
+        assert gateway.page_map.get(DATE) == (page_id, f"https://notion.so/{page_id}")
+        assert client.names().count("databases.query") == 1
+
+    @pytest.mark.asyncio
+    async def test_deleted_page_falls_back_to_query(self, tmp_path):
+        """記録したページが存在しなければ検索し直す"""
+        page_map = PageMapRepository("db", path=tmp_path / "pages.json")
+        page_map.set(DATE, "gone", "https://notion.so/gone")
+        client = FakeAsyncClient({"page1": []})
+
+        page_id, _ = await publish_report_async(
+            _report(), gateway=_gateway(client, page_map=page_map)
+        )
+
+        assert page_id == "page1"
+        assert page_map.get(DATE) == ("page1", "https://notion.so/page1")
+        assert client.names().count("databases.query") == 1
+
+    @pytest.mark.asyncio
+    async def test_archived_page_is_recreated(self, tmp_path):
+        """記録したページがアーカイブされていれば記録を破棄して作成し直す"""
+        page_map = PageMapRepository("db", path=tmp_path / "pages.json")
+        page_map.set(DATE, "page1", "https://notion.so/page1")
+        client = FakeAsyncClient({"page1": []})
+        client.archived.add("page1")
+
+        page_id, _ = await publish_report_async(
+            _report(), gateway=_gateway(client, page_map=page_map)
+        )
+
+        assert page_id != "page1"
+        assert page_map.get(DATE) == (page_id, f"https://notion.so/{page_id}")
+        # アーカイブ済みの更新はリトライしない
+        assert client.names().count("pages.update") == 1
+
+    def test_archived_page_is_recreated_sync(self, tmp_path):
+        """同期版も同様に作成し直し、次回は新しいページを更新する"""
+        page_map = PageMapRepository("db", path=tmp_path / "pages.json")
+        page_map.set(DATE, "page1", "https://notion.so/page1")
+        client = FakeAsyncClient({"page1": []})
+        client.archived.add("page1")
+        gateway = NotionGateway(
+            token="secret",
+            database_id="db",
+            retry_delay_sec=0,
+            rate_limiter=_unlimited(),
+            page_map=page_map,
+        )
+        fake: Any = FakeSyncClient(client)
+        gateway.client = fake
+
+        first = gateway.publish_page(DATE, _properties(), [])
+        second = gateway.publish_page(DATE, _properties(), [])
+
+        assert first == second != ("page1", "https://notion.so/page1")
+        assert client.names().count("pages.create") == 1
+
+    @pytest.mark.asyncio
+    async def test_scan_pages(self, tmp_path):
+        """日付範囲のページをページネーションして記録"""
+        client = FakeAsyncClient()
+        client.page_size = 2
+        for i in range(5):
+            page_id = f"p{i}"
+            client.store[page_id] = []
+            client.dates[page_id] = f"2025-01-1{i}"
+        page_map = PageMapRepository("db", path=tmp_path / "pages.json")
+
+        pages = await _gateway(client, page_map=page_map).scan_pages(
+            "2025-01-11", "2025-01-14"
+        )
+
+        assert sorted(pages) == ["2025-01-11", "2025-01-12", "2025-01-13", "2025-01-14"]
+        assert len(page_map) == 4
+        assert client.names() == ["databases.query"] * 2
+
+
+class TestPublishReports:
+    """publish_reports 関数のテスト"""
+
+    @staticmethod
+    def _setup(tmp_path, **kwargs: Any) -> tuple[FakeAsyncClient, NotionGateway]:
+        client = FakeAsyncClient()
+        client.page_size = 2
+        for day in (11, 12, 13):
+            client.store[f"p{day}"] = []
+            client.dates[f"p{day}"] = f"2025-01-{day}"
+        gateway = NotionGateway(
+            token="secret",
+            database_id="db",
+            retry_delay_sec=0,
+            rate_limiter=_unlimited(),
+            page_map=PageMapRepository("db", path=tmp_path / "pages.json"),
+            **kwargs,
+        )
+        fake: Any = FakeSyncClient(client)
+        gateway.client = fake
+        return client, gateway
+
+    @staticmethod
+    def _reports() -> list[Report]:
+        return [
+            Report(meta=ReportMeta(date=f"2025-01-{day}", generated_at=REPORT_TIME))
+            for day in range(11, 16)
+        ]
+
+    def test_bulk_lookup_then_create_or_update(self, tmp_path):
+        """既存ページはまとめて検索し、作成と更新に振り分ける"""
+        client, gateway = self._setup(tmp_path)
+        # 削除済みのページの記録は検索結果で破棄される
+        gateway.page_map.set("2025-01-14", "gone", "https://notion.so/gone")
+
+        published, failed = publish_reports(
+            self._reports(), stats={"2025-01-11": (10, 20)}, gateway=gateway
+        )
+
+        assert failed == {}
+        assert list(published) == [f"2025-01-{day}" for day in range(11, 16)]
+        assert published["2025-01-11"] == ("p11", "https://notion.so/p11")
+        # 検索は範囲検索のページネーション（2件ずつ）の2回だけ
+        assert client.names().count("databases.query") == 2
+        assert client.names().count("pages.create") == 2
+        assert client.names().count("pages.update") == 3
+        assert gateway.page_map.dates() == list(published)
+        update = next(
+            kw
+            for name, kw in client.calls
+            if name == "pages.update" and kw["page_id"] == "p11"
+        )
+        assert update["properties"]["キャプチャ数"] == {"number": 10}
+
+    def test_parallel_creates_are_all_recorded(self, tmp_path):
+        """複数のワーカーが同時に作成したページが全て対応表に記録される"""
+        client, gateway = self._setup(tmp_path)
+        reports = [
+            Report(meta=ReportMeta(date=f"2025-02-{day:02d}", generated_at=REPORT_TIME))
+            for day in range(1, 25)
+        ]
+
+        published, failed = publish_reports(reports, gateway=gateway, max_workers=8)
+
+        assert failed == {}
+        assert len(published) == 24
+        restored = PageMapRepository("db", path=tmp_path / "pages.json")
+        assert restored.dates() == list(published)
+        assert list(tmp_path.iterdir()) == [tmp_path / "pages.json"]
+
+    def test_failure_does_not_stop_others(self, tmp_path):
+        """1件の失敗で他の日報の出力は中断しない"""
+        client, gateway = self._setup(tmp_path, retry_count=0)
+        client.failures["pages.create"] = [RuntimeError("timeout")]
+
+        published, failed = publish_reports(
+            self._reports(), gateway=gateway, max_workers=2
+        )
+
+        assert len(published) == 4
+        assert list(failed) in (["2025-01-14"], ["2025-01-15"])
+
+
+class TestPublishReport:
+    """publish_report 関数のテスト"""
+
+    def test_empty_page_map_is_used(self, tmp_path, monkeypatch):
+        """空の対応表を渡してもその対応表に記録する（既定のファイルに置き換えない）"""
+        client = FakeAsyncClient()
+        monkeypatch.setattr(notion, "Client", lambda **kwargs: FakeSyncClient(client))
+        page_map = PageMapRepository("db", path=tmp_path / "pages.json")
+        assert len(page_map) == 0
+
+        page_id, _ = publish_report(
+            _report(), token="secret", database_id="db", page_map=page_map
+        )
+
+        assert page_map.get(DATE) == (page_id, f"https://notion.so/{page_id}")
+        assert PageMapRepository("db", path=tmp_path / "pages.json").dates() == [DATE]
+
+
+class TestPublishReportAsync:
+    """publish_report_async 関数のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_create_new_page(self):
+        """既存ページがなければ新規作成"""
+        client = FakeAsyncClient()
+
+        page_id, page_url = await publish_report_async(
+            _report(), gateway=_gateway(client)
+        )
+
+        assert page_id == "page1"
+        assert page_url == "https://notion.so/page1"
+        assert client.names() == ["databases.query", "pages.create"]
+
+    @pytest.mark.asyncio
+    async def test_update_existing_page(self):
+        """既存ページはプロパティ更新・ブロック置換"""
+        client = FakeAsyncClient({"page1": ["old1", "old2"]})
+        gateway = _gateway(client)
+
+        page_id, _ = await publish_report_async(_report(), gateway=gateway)
+
+        assert page_id == "page1"
+        assert "pages.update" in client.names()
+        assert client.names().count("blocks.delete") == 2
+        assert client.names()[-1] == "blocks.children.append"
+        assert not any(block_id.startswith("old") for block_id in client.ids("page1"))
+        assert client.closed is False
+
+        async with gateway:
+            pass
+        assert client.closed is True
@@ -0,0 +1,214 @@
+"""ColumnarLog（列指向アーカイブ）のテスト"""
+
+from __future__ import annotations
+
+import json
+import struct
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.repositories import (
+    ColumnarFormatError,
+    ColumnarLog,
+    LogFileNotFoundError,
+    LogRepository,
+)
+from src.repositories.columnar import MAGIC
+from src.services.aggregator import create_aggregator
+from src.utils.time_utils import parse_ts, parse_ts_epoch_offset
+
+
+@pytest.fixture
+def sample_records() -> list[dict[str, Any]]:
+    """テスト用の生ログデータ（無効なタイムスタンプを含む）"""
+    return [
+        {
+            "ts": "2025-01-15T09:00:00.123+09:00",
+            "window_title": "main.py - Visual Studio Code",
+            "process_name": "Code.exe",
+            "keywords": ["Python", "def", "日本語"],
+            "files": ["main.py"],
+        },
+        {"ts": "invalid", "process_name": "Code.exe"},
+        {
+            "ts": "2025-01-15T00:02:00+00:00",
+            "window_title": None,
+            "process_name": None,
+            "keywords": [],
+            "urls": ["python.org", "github.com"],
+        },
+        {
+            "ts": "2025-01-15T09:04:00+09:00",
+            "window_title": "main.py - Visual Studio Code",
+            "process_name": "Code.exe",
+            "keywords": ["python"],
+            "files": "not-a-list",
+        },
+    ]
+
+
+class TestColumnarLog:
+    """ColumnarLog のテスト"""
+
+    def test_round_trip(self, sample_records: list[dict[str, Any]]) -> None:
+        """バイト列への変換と復元で内容が変わらない"""
+        columnar = ColumnarLog.from_records(sample_records)
+        restored = ColumnarLog.from_bytes(columnar.to_bytes(), Path("test.col"))
+
+        assert len(restored) == 3
+        assert list(restored.iter_rows()) == list(columnar.iter_rows())
+
+    def test_rows_preserve_timestamps_and_fields(
+        self, sample_records: list[dict[str, Any]]
+    ) -> None:
+        """タイムスタンプ（オフセット含む）とフィールドを復元できる"""
+        rows = list(ColumnarLog.from_records(sample_records).iter_rows())
+
+        ts, record = rows[0]
+        assert ts == parse_ts_epoch_offset(sample_records[0]["ts"])
+        assert ts == (parse_ts(sample_records[0]["ts"]).timestamp(), 32400)
+        assert record["process_name"] == "Code.exe"
+        assert record["keywords"] == ["Python", "def", "日本語"]
+
+        ts, record = rows[1]
+        assert ts[1] == 0
+        assert record["process_name"] is None
+        assert record["urls"] == ["python.org", "github.com"]
+
+        assert rows[2][1]["files"] == []
+
+    def test_bad_magic(self) -> None:
+        """形式不正はColumnarFormatError"""
+        with pytest.raises(ColumnarFormatError):
+            ColumnarLog.from_bytes(b"not a columnar file", Path("test.col"))
+
+    @pytest.mark.parametrize("key", ["count", "columns", "dictionaries"])
+    def test_missing_header_key(
+        self, sample_records: list[dict[str, Any]], key: str
+    ) -> None:
+        """ヘッダーのキー欠落はColumnarFormatError"""
+        data = ColumnarLog.from_records(sample_records).to_bytes()
+        (header_len,) = struct.unpack_from("<I", data, len(MAGIC))
+        start = len(MAGIC) + 4
+        header = json.loads(data[start : start + header_len])
+        del header[key]
+        header_bytes = json.dumps(header).encode("utf-8")
+        broken = (
+            MAGIC
+            + struct.pack("<I", len(header_bytes))
+            + header_bytes
+            + data[start + header_len :]
+        )
+
+        with pytest.raises(ColumnarFormatError):
+            ColumnarLog.from_bytes(broken, Path("test.col"))
+
+    def test_truncated_column(self, sample_records: list[dict[str, Any]]) -> None:
+        """途中で切れたファイルはColumnarFormatError"""
+        data = ColumnarLog.from_records(sample_records).to_bytes()
+
+        with pytest.raises(ColumnarFormatError):
+            ColumnarLog.from_bytes(data[:-4], Path("test.col"))
+
+
+class TestColumnarRepository:
+    """LogRepository の列指向アーカイブ操作のテスト"""
+
+    @pytest.fixture
+    def repository(self, tmp_path: Path) -> LogRepository:
+        """テスト用リポジトリインスタンス"""
+        return LogRepository(base_path=tmp_path)
+
+    @staticmethod
+    def _write_log(
+        repository: LogRepository, target_date: date, records: list[dict[str, Any]]
+    ) -> None:
+        repository.get_log_path(target_date).write_text(
+            "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records),
+            encoding="utf-8",
+        )
+
+    def test_compact_and_read(
+        self, repository: LogRepository, sample_records: list[dict[str, Any]]
+    ) -> None:
+        """compact_day で作成したアーカイブを read_columnar で読める"""
+        target_date = date(2025, 1, 15)
+        self._write_log(repository, target_date, sample_records)
+
+        path = repository.compact_day(target_date)
+
+        assert path == repository.get_columnar_path(target_date)
+        assert repository.has_columnar(target_date)
+        assert len(repository.read_columnar(target_date)) == 3
+
+    def test_compact_rejects_open_day(self, repository: LogRepository) -> None:
+        """当日のログは変換できない"""
+        with pytest.raises(ValueError):
+            repository.compact_day(date.today())
+
+    def test_compact_closed_days(
+        self, repository: LogRepository, sample_records: list[dict[str, Any]]
+    ) -> None:
+        """未変換の確定済みの日のみを変換"""
+        for target_date in (date(2025, 1, 15), date(2025, 1, 16), date.today()):
+            self._write_log(repository, target_date, sample_records)
+        repository.compact_day(date(2025, 1, 15))
+
+        compacted = repository.compact_closed_days()
+
+        assert compacted == [repository.get_columnar_path(date(2025, 1, 16))]
+
+    def test_read_columnar_not_found(self, repository: LogRepository) -> None:
+        """アーカイブ不存在はLogFileNotFoundError"""
+        with pytest.raises(LogFileNotFoundError):
+            repository.read_columnar(date(2025, 1, 15))
+
+    def test_aggregate_from_archive_matches_jsonl(
+        self,
+        repository: LogRepository,
+        sample_records: list[dict[str, Any]],
+    ) -> None:
+        """アーカイブからの集計結果がraw.jsonlからの集計と一致"""
+        target_date = date(2025, 1, 15)
+        self._write_log(repository, target_date, sample_records)
+        repository.compact_day(target_date)
+
+        from_jsonl = create_aggregator(
+            base_path=repository.base_path, config={"exclude_recent_sec": 0}
+        ).aggregate(target_date)
+        service = create_aggregator(
+            base_path=repository.base_path,
+            config={"exclude_recent_sec": 0, "use_columnar_archive": True},
+        )
+        repository.get_log_path(target_date).unlink()  # アーカイブのみで集計できる
+        from_archive = service.aggregate(target_date)
+
+        assert from_archive.model_dump(exclude={"meta": {"generated_at"}}) == (
+            from_jsonl.model_dump(exclude={"meta": {"generated_at"}})
+        )
+
+    def test_aggregate_falls_back_on_broken_archive(
+        self,
+        repository: LogRepository,
+        sample_records: list[dict[str, Any]],
+    ) -> None:
+        """壊れたアーカイブは無視してraw.jsonlから集計"""
+        target_date = date(2025, 1, 15)
+        self._write_log(repository, target_date, sample_records)
+        path = repository.compact_day(target_date)
+        path.write_bytes(path.read_bytes()[:-4])
+
+        from_jsonl = create_aggregator(
+            base_path=repository.base_path, config={"exclude_recent_sec": 0}
+        ).aggregate(target_date)
+        from_broken = create_aggregator(
+            base_path=repository.base_path,
+            config={"exclude_recent_sec": 0, "use_columnar_archive": True},
+        ).aggregate(target_date)
+
+        assert from_broken.model_dump(exclude={"meta": {"generated_at"}}) == (
+            from_jsonl.model_dump(exclude={"meta": {"generated_at"}})
+        )
@@ -3,18 +3,21 @@
 from __future__ import annotations
 
 import json
-from datetime import date
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from src.domain.capture import CaptureRow
+from src.domain.features import Features, FeaturesMeta
 from src.repositories import (
     LogFileEmptyError,
     LogFileNotFoundError,
     LogParseError,
     LogRepository,
 )
+from src.utils.time_utils import JST
 
 
 class TestLogRepository:
@@ -199,6 +202,121 @@ class TestLogRepository:
         assert exc_info.value.file_path == log_path
         assert exc_info.value.total_lines == 3
 
+    def test_iter_raw_logs_yields_records_lazily(
+        self,
+        repository: LogRepository,
+        sample_date: date,
+        sample_raw_logs: list[dict[str, Any]],
+    ) -> None:
+        """iter_raw_logs: レコードを1件ずつ返す"""
+        log_path = repository.get_log_path(sample_date)
+
+        with open(log_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(sample_raw_logs[0], ensure_ascii=False) + "\n")
+            f.write("invalid json line\n")
+            f.write(json.dumps(sample_raw_logs[1], ensure_ascii=False) + "\n")
+
+        iterator = repository.iter_raw_logs(sample_date)
+
+        assert not isinstance(iterator, list)
+        assert next(iterator)["process_name"] == "Code.exe"
+        assert next(iterator)["process_name"] == "chrome.exe"
+        with pytest.raises(StopIteration):
+            next(iterator)
+
+    def test_iter_capture_rows(
+        self,
+        repository: LogRepository,
+        sample_date: date,
+        sample_raw_logs: list[dict[str, Any]],
+    ) -> None:
+        """iter_capture_rows: CaptureRow として返す（JSONオブジェクト以外は読み飛ばす）"""
+        log_path = repository.get_log_path(sample_date)
+
+        with open(log_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(sample_raw_logs[0], ensure_ascii=False) + "\n")
+            f.write("[1, 2]\n")
+            f.write(json.dumps(sample_raw_logs[1], ensure_ascii=False) + "\n")
+
+        rows = list(repository.iter_capture_rows(sample_date))
+
+        assert [row.process_name for row in rows] == ["Code.exe", "chrome.exe"]
+        assert rows[0] == CaptureRow.from_dict(sample_raw_logs[0])
+
+    def test_iter_raw_logs_file_not_found_raised_eagerly(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """iter_raw_logs: ファイル不存在はイテレーション前に検出"""
+        with pytest.raises(LogFileNotFoundError):
+            repository.iter_raw_logs(sample_date)
+
+    def test_iter_raw_logs_empty_file_raised_eagerly(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """iter_raw_logs: 空ファイルはイテレーション前に検出"""
+        repository.get_log_path(sample_date).touch()
+
+        with pytest.raises(LogFileEmptyError):
+            repository.iter_raw_logs(sample_date)
+
+    def test_iter_raw_logs_all_invalid(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """iter_raw_logs: 全行不正の場合は読み切った時点でLogParseError"""
+        log_path = repository.get_log_path(sample_date)
+
+        with open(log_path, "w", encoding="utf-8") as f:
+            f.write("invalid line 1\n")
+            f.write("{broken json\n")
+
+        iterator = repository.iter_raw_logs(sample_date)
+
+        with pytest.raises(LogParseError) as exc_info:
+            list(iterator)
+
+        assert exc_info.value.total_lines == 2
+
+    def test_iter_raw_logs_from_offset(
+        self,
+        repository: LogRepository,
+        sample_date: date,
+        sample_raw_logs: list[dict[str, Any]],
+    ) -> None:
+        """iter_raw_logs_from: 指定バイト位置以降の完結した行のみを読む"""
+        log_path = repository.get_log_path(sample_date)
+        first_line = json.dumps(sample_raw_logs[0], ensure_ascii=False) + "\n"
+        second_line = json.dumps(sample_raw_logs[1], ensure_ascii=False) + "\n"
+
+        with open(log_path, "w", encoding="utf-8") as f:
+            f.write(first_line + second_line + '{"ts": "2025-01')
+
+        entries = list(repository.iter_raw_logs_from(sample_date))
+        assert [offset for _, offset in entries] == [
+            len(first_line.encode("utf-8")),
+            len((first_line + second_line).encode("utf-8")),
+        ]
+
+        resumed = list(repository.iter_raw_logs_from(sample_date, entries[0][1]))
+        assert len(resumed) == 1
+        assert resumed[0][0]["process_name"] == "chrome.exe"
+
+    def test_save_and_load_checkpoint(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """save_checkpoint/load_checkpoint: チェックポイントを保存・復元できる"""
+        assert repository.load_checkpoint(sample_date) is None
+
+        saved_path = repository.save_checkpoint(
+            sample_date, {"version": 1, "offset": 42, "state": {}}
+        )
+
+        assert saved_path == repository.get_checkpoint_path(sample_date)
+        assert repository.load_checkpoint(sample_date) == {
+            "version": 1,
+            "offset": 42,
+            "state": {},
+        }
+
     def test_save_features_success(
         self,
         repository: LogRepository,
@@ -218,6 +336,19 @@ class TestLogRepository:
         assert loaded["meta"]["date"] == "2025-01-15"
         assert loaded["meta"]["capture_count"] == 2
 
+    def test_save_features_bytes(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """save_features: エンコード済みのバイト列はそのまま書き込む"""
+        data = '{"meta": {"date": "2025-01-15", "note": "日本語"}}'.encode("utf-8")
+
+        saved_path = repository.save_features(sample_date, data)
+
+        assert saved_path.read_bytes() == data
+        loaded = repository.load_features(sample_date)
+        assert loaded is not None
+        assert loaded["meta"]["note"] == "日本語"
+
     def test_save_features_creates_directory(
         self, tmp_path: Path, sample_date: date, sample_features: dict[str, Any]
     ) -> None:
@@ -285,6 +416,68 @@ class TestLogRepository:
         with pytest.raises(json.JSONDecodeError):
             repository.load_features(sample_date)
 
+    @staticmethod
+    def _features(capture_count: int) -> Features:
+        return Features(
+            meta=FeaturesMeta(
+                date="2025-01-15",
+                generated_at="2025-01-15T18:00:00+09:00",
+                capture_count=capture_count,
+                first_capture="09:00:00",
+                last_capture="09:02:00",
+                total_duration_min=4.0,
+            )
+        )
+
+    def test_load_features_model_cached(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """load_features_model: 変更がなければ解析済みのFeaturesを再利用"""
+        features = self._features(2)
+        repository.save_features(sample_date, features.encode().data)
+
+        first = repository.load_features_model(sample_date)
+        second = repository.load_features_model(sample_date)
+
+        assert first == features
+        assert second is first
+
+    def test_load_features_model_invalidated(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """load_features_model: save_features・外部からの書き換えで再読み込み"""
+        repository.save_features(sample_date, self._features(2).encode().data)
+        repository.load_features_model(sample_date)
+
+        repository.save_features(sample_date, self._features(3).encode().data)
+        loaded = repository.load_features_model(sample_date)
+        assert loaded is not None
+        assert loaded.meta.capture_count == 3
+
+        # 外部プロセスによる書き換え（サイズが変わる）
+        features_path = repository.get_features_path(sample_date)
+        features_path.write_bytes(self._features(100).encode().data)
+        loaded = repository.load_features_model(sample_date)
+        assert loaded is not None
+        assert loaded.meta.capture_count == 100
+
+        features_path.unlink()
+        assert repository.load_features_model(sample_date) is None
+
+    def test_load_features_model_lru_eviction(self, temp_log_dir: Path) -> None:
+        """load_features_model: キャッシュ件数を超えたら最も古いものを破棄"""
+        repository = LogRepository(base_path=temp_log_dir, features_cache_size=1)
+        dates = [date(2025, 1, 15), date(2025, 1, 16)]
+        for target_date in dates:
+            repository.save_features(target_date, self._features(2).encode().data)
+
+        first = repository.load_features_model(dates[0])
+        repository.load_features_model(dates[1])
+
+        assert repository.load_features_model(dates[0]) is not first
+        with pytest.raises(ValueError):
+            LogRepository(base_path=temp_log_dir, features_cache_size=-1)
+
     def test_default_base_path(self) -> None:
         """__init__: base_path未指定時にデフォルトパスを使用"""
         repository = LogRepository()
@@ -326,3 +519,152 @@ class TestLogRepository:
 
         assert loaded is not None
         assert loaded["global_keywords"]["top_keywords"] == ["日本語", "キーワード"]
+
+
+class TestLogRepositoryTimeIndex:
+    """時刻インデックス（YYYY-MM-DD.idx）のテスト"""
+
+    @pytest.fixture
+    def repository(self, tmp_path: Path) -> LogRepository:
+        """テスト用リポジトリインスタンス"""
+        return LogRepository(base_path=tmp_path)
+
+    @pytest.fixture
+    def sample_date(self) -> date:
+        """テスト用の日付"""
+        return date(2025, 1, 15)
+
+    @staticmethod
+    def _write_hours(log_path: Path, hours: list[int], mode: str = "w") -> None:
+        with open(log_path, mode, encoding="utf-8") as f:
+            for hour in hours:
+                for minute in range(0, 60, 10):
+                    record = {
+                        "ts": f"2025-01-15T{hour:02d}:{minute:02d}:00.000+09:00",
+                        "process_name": f"app{hour}.exe",
+                    }
+                    f.write(json.dumps(record) + "\n")
+
+    @staticmethod
+    def _jst(hour: int, minute: int = 0) -> datetime:
+        return datetime(2025, 1, 15, hour, minute, tzinfo=JST)
+
+    def test_build_index_creates_sidecar(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """build_index: セグメント一覧をサイドカーファイルに保存"""
+        log_path = repository.get_log_path(sample_date)
+        self._write_hours(log_path, [9, 10, 11])
+
+        index = repository.build_index(sample_date, interval_sec=3600)
+
+        assert repository.get_index_path(sample_date).exists()
+        assert index["size"] == log_path.stat().st_size
+        assert len(index["segments"]) == 3
+        assert index["segments"][0][0] == 0
+        assert index["segments"][-1][1] == log_path.stat().st_size
+
+    def test_iter_raw_logs_between_reads_only_range(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """iter_raw_logs_between: [start, end) のレコードのみを返す"""
+        log_path = repository.get_log_path(sample_date)
+        self._write_hours(log_path, [9, 10, 11, 12])
+
+        records = list(
+            repository.iter_raw_logs_between(
+                sample_date, start=self._jst(10), end=self._jst(12)
+            )
+        )
+
+        assert len(records) == 12
+        assert {r["process_name"] for r in records} == {"app10.exe", "app11.exe"}
+
+    def test_index_is_extended_after_append(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """追記後の読み込みでインデックスが更新される"""
+        log_path = repository.get_log_path(sample_date)
+        self._write_hours(log_path, [9])
+        repository.build_index(sample_date)
+
+        self._write_hours(log_path, [10], mode="a")
+        records = list(
+            repository.iter_raw_logs_between(sample_date, start=self._jst(10))
+        )
+
+        assert len(records) == 6
+        index = repository.build_index(sample_date)
+        assert index["size"] == log_path.stat().st_size
+
+    def test_out_of_order_record_is_found(
+        self, repository: LogRepository, sample_date: date
+    ) -> None:
+        """時刻順でないレコードも範囲読み込みで取りこぼさない"""
+        log_path = repository.get_log_path(sample_date)
+        self._write_hours(log_path, [9, 10])
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"ts": "2025-01-15T09:05:00+09:00"}) + "\n")
+            f.write("broken line\n")
+
+        records = list(
+            repository.iter_raw_logs_between(
+                sample_date, start=self._jst(9), end=self._jst(9, 10)
+            )
+        )
+
+        assert [r["ts"][11:16] for r in records] == ["09:00", "09:05"]
+
+
+class TestLogRepositoryMmapBackend:
+    """read_backend="mmap" のテスト"""
+
+    @pytest.fixture
+    def sample_date(self) -> date:
+        """テスト用の日付"""
+        return date(2025, 1, 15)
+
+    @pytest.fixture
+    def log_dir(self, tmp_path: Path, sample_date: date) -> Path:
+        """空行・不正行・改行なし末尾行を含むログ"""
+        lines = [
+            json.dumps({"ts": "2025-01-15T09:00:00+09:00", "keywords": ["日本語"]}),
+            "",
+            "invalid json line",
+            json.dumps({"ts": "2025-01-15T09:10:00+09:00", "process_name": "a.exe"}),
+            json.dumps({"ts": "2025-01-15T09:20:00+09:00", "process_name": "b.exe"}),
+        ]
+        (tmp_path / f"{sample_date.isoformat()}.jsonl").write_text(
+            "\r\n".join(lines), encoding="utf-8"
+        )
+        return tmp_path
+
+    def test_read_matches_buffered_backend(
+        self, log_dir: Path, sample_date: date
+    ) -> None:
+        """mmap読み込みの結果がバッファ付き読み込みと一致"""
+        buffered = LogRepository(base_path=log_dir)
+        mapped = LogRepository(base_path=log_dir, read_backend="mmap")
+
+        assert mapped.read_raw_logs(sample_date) == buffered.read_raw_logs(sample_date)
+        assert list(mapped.iter_raw_logs_from(sample_date)) == list(
+            buffered.iter_raw_logs_from(sample_date)
+        )
+        assert len(mapped.read_raw_logs(sample_date)) == 3
+
+    def test_range_read_with_mmap(self, log_dir: Path, sample_date: date) -> None:
+        """mmapでも時刻範囲読み込みができる"""
+        mapped = LogRepository(base_path=log_dir, read_backend="mmap")
+
+        records = list(
+            mapped.iter_raw_logs_between(
+                sample_date, start=datetime(2025, 1, 15, 9, 5, tzinfo=JST)
+            )
+        )
+
+        assert [r["process_name"] for r in records] == ["a.exe", "b.exe"]
+
+    def test_unknown_backend(self, tmp_path: Path) -> None:
+        """未知の read_backend はValueError"""
+        with pytest.raises(ValueError):
+            LogRepository(base_path=tmp_path, read_backend="unknown")
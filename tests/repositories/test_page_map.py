@@ -0,0 +1,53 @@
+"""PageMapRepositoryのテスト"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from src.repositories import PageMapRepository, PageRef
+
+
+class TestPageMapRepository:
+    """PageMapRepository のテスト"""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """記録した対応表を別インスタンスで読み込める"""
+        path = tmp_path / "pages.json"
+        page_map = PageMapRepository("db", path=path)
+        page_map.set("2025-01-15", "page1", "https://notion.so/page1")
+        page_map.update(
+            {
+                "2025-01-16": PageRef("page2", "https://notion.so/page2"),
+                "2025-01-17": PageRef("page3", "https://notion.so/page3"),
+            }
+        )
+        page_map.remove("2025-01-17")
+
+        restored = PageMapRepository("db", path=path)
+
+        assert len(restored) == 2
+        assert restored.get("2025-01-15") == PageRef("page1", "https://notion.so/page1")
+        assert restored.get("2025-01-17") is None
+        assert "2025-01-16" in restored
+
+    def test_separate_databases(self, tmp_path: Path) -> None:
+        """データベースごとに別の対応表"""
+        path = tmp_path / "pages.json"
+        PageMapRepository("db1", path=path).set("2025-01-15", "page1", "url1")
+        PageMapRepository("db2", path=path).set("2025-01-15", "page2", "url2")
+
+        assert PageMapRepository("db1", path=path).get("2025-01-15").id == "page1"
+        assert PageMapRepository("db2", path=path).get("2025-01-15").id == "page2"
+
+    def test_broken_file_is_ignored(self, tmp_path: Path) -> None:
+        """破損・形式の異なるファイルは空として扱う"""
+        path = tmp_path / "pages.json"
+        path.write_text("{broken", encoding="utf-8")
+        assert len(PageMapRepository("db", path=path)) == 0
+
+        path.write_text(json.dumps({"version": 99}), encoding="utf-8")
+        page_map = PageMapRepository("db", path=path)
+        page_map.set("2025-01-15", "page1", "url1")
+
+        assert json.loads(path.read_text(encoding="utf-8"))["version"] == 1
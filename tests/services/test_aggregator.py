@@ -19,24 +19,27 @@ from src.repositories.log_repository import (
 from src.services.aggregator import (
     DEFAULT_CONFIG,
     LogAggregationService,
-    _build_app_summary,
-    _build_global_keywords,
-    _build_meta,
-    _build_time_blocks,
-    _filter_recent,
-    _group_by_time_block,
     create_aggregator,
 )
-from src.utils.time_utils import JST
+from src.utils.text_utils import merge_keywords
+from src.utils.time_utils import JST, parse_ts
+
+
+def _aggregate(records: list[dict[str, Any]], **config: Any) -> Features:
+    """レコードを LogAggregationService.aggregate で集計"""
+    mock_repository = MagicMock(spec=LogRepository)
+    mock_repository.iter_raw_logs.return_value = iter(records)
+    service = LogAggregationService(repository=mock_repository, config=config)
+    return service.aggregate(date(2024, 1, 15))
 
 
 class TestFilterRecent:
-    """_filter_recent のテスト"""
+    """直近N秒除外のテスト"""
 
     def test_empty_records(self) -> None:
-        """空のレコードリストは空を返す"""
-        result = _filter_recent([])
-        assert result == []
+        """空のレコードは0件として集計"""
+        result = _aggregate([])
+        assert result.meta.capture_count == 0
 
     def test_filters_recent_records(self) -> None:
         """直近N秒のレコードを除外"""
@@ -45,27 +48,27 @@ class TestFilterRecent:
         recent_time = (now - timedelta(seconds=30)).isoformat()
 
         records = [
-            {"ts": old_time, "data": "old"},
-            {"ts": recent_time, "data": "recent"},
+            {"ts": old_time, "keywords": ["old"]},
+            {"ts": recent_time, "keywords": ["recent"]},
         ]
 
-        result = _filter_recent(records, exclude_sec=120)
+        result = _aggregate(records, exclude_recent_sec=120)
 
-        assert len(result) == 1
-        assert result[0]["data"] == "old"
+        assert result.meta.capture_count == 1
+        assert result.global_keywords.top_keywords == ["old"]
 
     def test_keeps_all_old_records(self) -> None:
         """古いレコードは全て保持"""
         now = datetime.now(JST)
         records = [
-            {"ts": (now - timedelta(hours=1)).isoformat(), "data": "1"},
-            {"ts": (now - timedelta(hours=2)).isoformat(), "data": "2"},
-            {"ts": (now - timedelta(hours=3)).isoformat(), "data": "3"},
+            {"ts": (now - timedelta(hours=1)).isoformat()},
+            {"ts": (now - timedelta(hours=2)).isoformat()},
+            {"ts": (now - timedelta(hours=3)).isoformat()},
         ]
 
-        result = _filter_recent(records, exclude_sec=120)
+        result = _aggregate(records, exclude_recent_sec=120)
 
-        assert len(result) == 3
+        assert result.meta.capture_count == 3
 
     def test_skips_invalid_timestamps(self) -> None:
         """無効なタイムスタンプはスキップ"""
@@ -73,67 +76,55 @@ class TestFilterRecent:
         valid_time = (now - timedelta(hours=1)).isoformat()
 
         records = [
-            {"ts": valid_time, "data": "valid"},
-            {"ts": "invalid-timestamp", "data": "invalid"},
-            {"data": "no-ts"},  # ts フィールドなし
+            {"ts": valid_time, "keywords": ["valid"]},
+            {"ts": "invalid-timestamp", "keywords": ["invalid"]},
+            {"keywords": ["no-ts"]},  # ts フィールドなし
         ]
 
-        result = _filter_recent(records)
+        result = _aggregate(records)
 
-        assert len(result) == 1
-        assert result[0]["data"] == "valid"
+        assert result.meta.capture_count == 1
+        assert result.global_keywords.top_keywords == ["valid"]
 
 
-class TestGroupByTimeBlock:
-    """_group_by_time_block のテスト"""
+class TestTimeBlocks:
+    """時間ブロック集計のテスト"""
 
     def test_empty_records(self) -> None:
-        """空のレコードは空辞書を返す"""
-        result = _group_by_time_block([])
-        assert result == {}
+        """空のレコードは空リストを返す"""
+        assert _aggregate([]).time_blocks == []
 
     def test_groups_by_30min_blocks(self) -> None:
         """30分ブロックでグループ化"""
         base_date = "2024-01-15"
         records = [
-            {"ts": f"{base_date}T09:10:00+09:00", "data": "1"},
-            {"ts": f"{base_date}T09:20:00+09:00", "data": "2"},
-            {"ts": f"{base_date}T09:40:00+09:00", "data": "3"},
-            {"ts": f"{base_date}T10:05:00+09:00", "data": "4"},
+            {"ts": f"{base_date}T09:10:00+09:00", "keywords": ["a"]},
+            {"ts": f"{base_date}T09:20:00+09:00", "keywords": ["a"]},
+            {"ts": f"{base_date}T09:40:00+09:00", "keywords": ["b"]},
+            {"ts": f"{base_date}T10:05:00+09:00", "keywords": ["c"]},
         ]
 
-        result = _group_by_time_block(records, block_min=30)
-
-        assert ("09:00", "09:30") in result
-        assert ("09:30", "10:00") in result
-        assert ("10:00", "10:30") in result
-        assert len(result[("09:00", "09:30")]) == 2
-        assert len(result[("09:30", "10:00")]) == 1
-        assert len(result[("10:00", "10:30")]) == 1
+        result = _aggregate(records, exclude_recent_sec=0, time_block_min=30)
 
-
-class TestBuildTimeBlocks:
-    """_build_time_blocks のテスト"""
-
-    def test_empty_groups(self) -> None:
-        """空のグループは空リストを返す"""
-        result = _build_time_blocks({})
-        assert result == []
+        assert [(b.start, b.end, b.top_keywords) for b in result.time_blocks] == [
+            ("09:00", "09:30", ["a"]),
+            ("09:30", "10:00", ["b"]),
+            ("10:00", "10:30", ["c"]),
+        ]
 
     def test_builds_time_blocks_with_apps(self) -> None:
         """TimeBlockを正しく構築"""
-        grouped = {
-            ("09:00", "09:30"): [
-                {"process_name": "Code.exe", "keywords": ["Python"], "files": []},
-                {"process_name": "Code.exe", "keywords": ["Flask"], "files": []},
-                {"process_name": "chrome.exe", "keywords": [], "files": []},
-            ],
-        }
-
-        result = _build_time_blocks(grouped)
-
-        assert len(result) == 1
-        block = result[0]
+        ts = "2024-01-15T09:10:00+09:00"
+        records = [
+            {"ts": ts, "process_name": "Code.exe", "keywords": ["Python"]},
+            {"ts": ts, "process_name": "Code.exe", "keywords": ["Flask"]},
+            {"ts": ts, "process_name": "chrome.exe", "keywords": []},
+        ]
+
+        result = _aggregate(records)
+
+        assert len(result.time_blocks) == 1
+        block = result.time_blocks[0]
         assert block.start == "09:00"
         assert block.end == "09:30"
         assert len(block.apps) == 2
@@ -143,26 +134,25 @@ class TestBuildTimeBlocks:
 
     def test_time_blocks_sorted_by_time(self) -> None:
         """TimeBlockは時刻順でソート"""
-        grouped = {
-            ("14:00", "14:30"): [{"process_name": "chrome.exe"}],
-            ("09:00", "09:30"): [{"process_name": "Code.exe"}],
-            ("11:00", "11:30"): [{"process_name": "slack.exe"}],
-        }
+        records = [
+            {"ts": "2024-01-15T14:10:00+09:00", "process_name": "chrome.exe"},
+            {"ts": "2024-01-15T09:10:00+09:00", "process_name": "Code.exe"},
+            {"ts": "2024-01-15T11:10:00+09:00", "process_name": "slack.exe"},
+        ]
+
+        result = _aggregate(records)
 
-        result = _build_time_blocks(grouped)
+        assert [b.start for b in result.time_blocks] == ["09:00", "11:00", "14:00"]
 
-        assert result[0].start == "09:00"
-        assert result[1].start == "11:00"
-        assert result[2].start == "14:00"
 
+class TestAppSummary:
+    """アプリ別集計のテスト"""
 
-class TestBuildAppSummary:
-    """_build_app_summary のテスト"""
+    TS = "2024-01-15T09:00:00+09:00"
 
     def test_empty_records(self) -> None:
         """空レコードは空リストを返す"""
-        result = _build_app_summary([])
-        assert result == []
+        assert _aggregate([]).app_summary == []
 
     def test_builds_app_summary(self) -> None:
         """AppSummaryを正しく構築"""
@@ -172,7 +162,9 @@ class TestBuildAppSummary:
             {"process_name": "chrome.exe", "keywords": ["docs"], "urls": ["python.org"]},
         ]
 
-        result = _build_app_summary(records, sampling_interval_sec=120)
+        result = _aggregate(
+            [{"ts": self.TS, **r} for r in records], sampling_interval_sec=120
+        ).app_summary
 
         assert len(result) == 2
         # 使用時間降順でソート
@@ -190,7 +182,7 @@ class TestBuildAppSummary:
         records += [{"process_name": "slack.exe"} for _ in range(1)]
         records += [{"process_name": "notepad.exe"} for _ in range(3)]
 
-        result = _build_app_summary(records)
+        result = _aggregate([{"ts": self.TS, **r} for r in records]).app_summary
 
         app_by_name = {app.name: app for app in result}
         assert app_by_name["Visual Studio Code"].rank == AppRank.HIGH  # 40%
@@ -199,45 +191,45 @@ class TestBuildAppSummary:
         assert app_by_name["Slack"].rank == AppRank.MEDIUM  # 10%
 
 
-class TestBuildGlobalKeywords:
-    """_build_global_keywords のテスト"""
+class TestGlobalKeywords:
+    """グローバル頻出特徴量のテスト"""
 
     def test_empty_records(self) -> None:
         """空レコードは空のGlobalKeywordsを返す"""
-        result = _build_global_keywords([])
+        result = _aggregate([]).global_keywords
         assert result.top_keywords == []
         assert result.top_urls == []
         assert result.top_files == []
 
     def test_merges_all_keywords(self) -> None:
         """全レコードからキーワードをマージ"""
+        ts = "2024-01-15T09:00:00+09:00"
         records = [
             {"keywords": ["Python", "Flask"], "urls": ["python.org"], "files": ["main.py"]},
             {"keywords": ["Python", "API"], "urls": ["github.com"], "files": ["app.py"]},
             {"keywords": ["Docker"], "urls": ["python.org"], "files": []},
         ]
 
-        result = _build_global_keywords(records)
+        result = _aggregate([{"ts": ts, **r} for r in records]).global_keywords
 
         # Pythonが最頻出
-        assert "Python" in result.top_keywords
-        assert "python.org" in result.top_urls
+        assert result.top_keywords[0] == "Python"
+        assert result.top_urls[0] == "python.org"
         assert "main.py" in result.top_files
 
 
-class TestBuildMeta:
-    """_build_meta のテスト"""
+class TestMeta:
+    """メタデータのテスト"""
 
     def test_builds_meta_correctly(self) -> None:
         """メタデータを正しく構築"""
-        target_date = date(2024, 1, 15)
         records = [
             {"ts": "2024-01-15T09:00:00+09:00"},
             {"ts": "2024-01-15T10:00:00+09:00"},
             {"ts": "2024-01-15T11:00:00+09:00"},
         ]
 
-        result = _build_meta(target_date, records)
+        result = _aggregate(records).meta
 
         assert result.date == "2024-01-15"
         assert result.capture_count == 3
@@ -247,9 +239,7 @@ class TestBuildMeta:
 
     def test_empty_records_meta(self) -> None:
         """空レコードのメタデータ"""
-        target_date = date(2024, 1, 15)
-
-        result = _build_meta(target_date, [])
+        result = _aggregate([]).meta
 
         assert result.capture_count == 0
         assert result.first_capture == "00:00:00"
@@ -299,7 +289,7 @@ class TestLogAggregationService:
         self, mock_repository: MagicMock, sample_records: list[dict[str, Any]]
     ) -> None:
         """aggregate メソッドがFeaturesを返す"""
-        mock_repository.read_raw_logs.return_value = sample_records
+        mock_repository.iter_raw_logs.return_value = iter(sample_records)
 
         service = LogAggregationService(
             repository=mock_repository,
@@ -316,7 +306,7 @@ class TestLogAggregationService:
         self, mock_repository: MagicMock, sample_records: list[dict[str, Any]]
     ) -> None:
         """target_date=None で当日を使用"""
-        mock_repository.read_raw_logs.return_value = sample_records
+        mock_repository.iter_raw_logs.return_value = iter(sample_records)
 
         service = LogAggregationService(
             repository=mock_repository,
@@ -327,13 +317,13 @@ class TestLogAggregationService:
             mock_date.today.return_value = date(2024, 1, 15)
             service.aggregate(None)
 
-        mock_repository.read_raw_logs.assert_called_once_with(date(2024, 1, 15))
+        mock_repository.iter_raw_logs.assert_called_once_with(date(2024, 1, 15))
 
     def test_aggregate_handles_file_not_found(
         self, mock_repository: MagicMock
     ) -> None:
         """ファイル不存在エラーを伝播"""
-        mock_repository.read_raw_logs.side_effect = LogFileNotFoundError(
+        mock_repository.iter_raw_logs.side_effect = LogFileNotFoundError(
             Path("/test/2024-01-15.jsonl")
         )
 
@@ -346,7 +336,7 @@ class TestLogAggregationService:
         self, mock_repository: MagicMock
     ) -> None:
         """空ファイルエラーを伝播"""
-        mock_repository.read_raw_logs.side_effect = LogFileEmptyError(
+        mock_repository.iter_raw_logs.side_effect = LogFileEmptyError(
             Path("/test/2024-01-15.jsonl")
         )
 
@@ -359,7 +349,7 @@ class TestLogAggregationService:
         self, mock_repository: MagicMock, sample_records: list[dict[str, Any]]
     ) -> None:
         """aggregate_and_save がFeaturesを保存"""
-        mock_repository.read_raw_logs.return_value = sample_records
+        mock_repository.iter_raw_logs.return_value = iter(sample_records)
         mock_repository.save_features.return_value = Path("/test/features.json")
 
         service = LogAggregationService(
@@ -373,6 +363,112 @@ class TestLogAggregationService:
         assert path == Path("/test/features.json")
         mock_repository.save_features.assert_called_once()
 
+    def test_aggregate_and_encode_returns_saved_bytes(
+        self, mock_repository: MagicMock, sample_records: list[dict[str, Any]]
+    ) -> None:
+        """aggregate_and_encode は保存したバイト列をそのまま返す"""
+        mock_repository.iter_raw_logs.return_value = iter(sample_records)
+        mock_repository.save_features.return_value = Path("/test/features.json")
+
+        service = LogAggregationService(
+            repository=mock_repository,
+            config={"exclude_recent_sec": 0},
+        )
+
+        encoded, _ = service.aggregate_and_encode(date(2024, 1, 15))
+
+        mock_repository.save_features.assert_called_once_with(
+            date(2024, 1, 15), encoded.data
+        )
+        assert isinstance(encoded.features, Features)
+
+
+class TestSinglePassAggregation:
+    """1パス集計エンジンのテスト"""
+
+    @pytest.fixture
+    def mixed_records(self) -> list[dict[str, Any]]:
+        """同数キーワード・無効タイムスタンプ・順不同を含むレコード"""
+        base_date = "2024-01-15"
+        return [
+            {
+                "ts": f"{base_date}T09:10:00+09:00",
+                "process_name": "Code.exe",
+                "keywords": ["Python", "API"],
+                "files": ["main.py"],
+            },
+            {"ts": "invalid-timestamp", "process_name": "Code.exe"},
+            {
+                "ts": f"{base_date}T09:40:00+09:00",
+                "process_name": "chrome.exe",
+                "keywords": ["api", "Docs"],
+                "urls": ["python.org"],
+            },
+            {
+                "ts": f"{base_date}T09:05:00+09:00",
+                "process_name": None,
+                "keywords": ["python"],
+            },
+            {"process_name": "slack.exe"},  # ts フィールドなし
+            {
+                "ts": f"{base_date}T10:05:00+09:00",
+                "process_name": "chrome.exe",
+                "keywords": ["Docs", "API"],
+                "urls": ["github.com", "Python.org"],
+                "files": ["README.md"],
+            },
+        ]
+
+    def test_matches_merge_keywords(self, mixed_records: list[dict[str, Any]]) -> None:
+        """頻出特徴量が merge_keywords による集計と一致する"""
+        result = _aggregate(mixed_records)
+
+        # 同数・表記の初出はキャプチャ時刻順で決まるため、時刻順に並べて比較
+        records = sorted(
+            (r for r in mixed_records if r.get("ts", "").startswith("2024-")),
+            key=lambda r: parse_ts(r["ts"]),
+        )
+
+        assert result.global_keywords.top_keywords == merge_keywords(
+            records, field="keywords", limit=10
+        )
+        assert result.global_keywords.top_urls == merge_keywords(
+            records, field="urls", limit=5
+        )
+        assert result.global_keywords.top_files == merge_keywords(
+            records, field="files", limit=5
+        )
+        assert [(b.start, b.top_keywords) for b in result.time_blocks] == [
+            ("09:00", ["python", "API"]),
+            ("09:30", ["api", "Docs"]),
+            ("10:00", ["Docs", "API"]),
+        ]
+        assert [app.process for app in result.app_summary] == [
+            "chrome.exe",
+            "Unknown",
+            "Code.exe",
+        ]
+
+    def test_consumes_iterator_once(self, mixed_records: list[dict[str, Any]]) -> None:
+        """レコードのイテレータを1回だけ走査する"""
+        consumed: list[int] = []
+
+        def generate() -> Any:
+            for i, record in enumerate(mixed_records):
+                consumed.append(i)
+                yield record
+
+        mock_repository = MagicMock(spec=LogRepository)
+        mock_repository.iter_raw_logs.return_value = generate()
+        service = LogAggregationService(repository=mock_repository)
+
+        result = service.aggregate(date(2024, 1, 15))
+
+        assert consumed == list(range(len(mixed_records)))
+        assert result.meta.capture_count == 4
+        assert result.meta.first_capture == "09:05:00"
+        assert result.meta.last_capture == "10:05:00"
+
 
 class TestCreateAggregator:
     """create_aggregator のテスト"""
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import json
-from datetime import date
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +15,7 @@ import pytest
 from src.domain.features import Features
 from src.repositories.log_repository import LogFileEmptyError, LogFileNotFoundError
 from src.services.aggregator import LogAggregationService, create_aggregator
+from src.utils.time_utils import JST
 
 
 class TestAggregatorIntegration:
@@ -110,6 +111,38 @@ class TestAggregatorIntegration:
         saved_content = json.loads(saved_path.read_text(encoding="utf-8"))
         assert saved_content["meta"]["date"] == "2024-01-15"
 
+    def test_sessions(self, temp_log_dir: Path, sample_jsonl_content: str) -> None:
+        """連続する同一ウィンドウがセッションにまとまり features.json に出力される"""
+        target_date = date(2024, 1, 15)
+        (temp_log_dir / f"{target_date.isoformat()}.jsonl").write_text(
+            sample_jsonl_content, encoding="utf-8"
+        )
+        service = create_aggregator(base_path=temp_log_dir)
+
+        features, saved_path = service.aggregate_and_save(target_date)
+
+        assert [
+            (s.app, s.start, s.end, s.duration_min, s.capture_count)
+            for s in features.sessions
+        ] == [
+            ("Visual Studio Code", "09:00:00", "09:02:00", 4.0, 2),
+            ("Google Chrome", "09:04:00", "09:04:00", 2.0, 1),
+            # 次のキャプチャまで24分空いているため1サンプリング間隔分
+            ("Visual Studio Code", "09:06:00", "09:06:00", 2.0, 1),
+            ("Slack", "09:30:00", "09:30:00", 2.0, 1),
+        ]
+        assert features.sessions[0].keywords == [
+            "Python",
+            "def",
+            "function",
+            "class",
+            "import",
+        ]
+        assert features.sessions[0].files == ["main.py", "utils.py"]
+
+        saved = json.loads(saved_path.read_text(encoding="utf-8"))
+        assert len(saved["sessions"]) == 4
+
     def test_japanese_content(self, temp_log_dir: Path) -> None:
         """日本語コンテンツの処理"""
         records = [
@@ -306,3 +339,309 @@ class TestAggregatorIntegration:
         assert features.meta.capture_count == 1000
         assert len(features.app_summary) == 2  # Code.exe と chrome.exe
         assert len(features.time_blocks) > 0
+
+    def test_session_capacity(self, temp_log_dir: Path) -> None:
+        """ウィンドウが頻繁に切り替わってもセッション数は session_capacity まで"""
+        start = datetime(2024, 1, 15, 9, 0, tzinfo=JST)
+        records = [
+            {
+                "ts": (start + timedelta(seconds=30 * i)).isoformat(),
+                "window_title": f"file{i // 2 if i % 40 < 10 else i}.py - VSCode",
+                "process_name": "Code.exe",
+                "keywords": [],
+                "urls": [],
+                "files": [],
+            }
+            for i in range(1000)
+        ]
+        target_date = date(2024, 1, 15)
+        (temp_log_dir / f"{target_date.isoformat()}.jsonl").write_text(
+            "".join(json.dumps(r) + "\n" for r in records), encoding="utf-8"
+        )
+        service = create_aggregator(
+            base_path=temp_log_dir,
+            config={"exclude_recent_sec": 0, "session_capacity": 20},
+        )
+
+        features = service.aggregate_incremental(target_date)
+
+        assert len(features.sessions) == 20
+        assert features.sessions[0].start == "09:00:00"
+        assert features.sessions[-1].end == "17:19:30"
+        # 先頭と末尾以外は2キャプチャ続いたセッションが残る
+        assert {s.capture_count for s in features.sessions[1:-1]} == {2}
+        checkpoint = service.repository.load_checkpoint(target_date)
+        assert len(checkpoint["state"]["sessions"]["sessions"]) <= 40
+
+
+class TestIncrementalAggregation:
+    """差分集計（チェックポイント）の統合テスト"""
+
+    @pytest.fixture
+    def temp_log_dir(self, tmp_path: Path) -> Path:
+        """テスト用の一時ログディレクトリ"""
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir(parents=True)
+        return log_dir
+
+    @staticmethod
+    def _record(minute: int, process_name: str, keywords: list[str]) -> str:
+        record = {
+            "ts": f"2024-01-15T09:{minute:02d}:00+09:00",
+            "window_title": process_name,
+            "process_name": process_name,
+            "keywords": keywords,
+            "urls": [],
+            "files": [f"{process_name}.txt"],
+        }
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    @staticmethod
+    def _without_generated_at(features: Features) -> dict[str, Any]:
+        return features.model_dump(exclude={"meta": {"generated_at"}})
+
+    def test_appended_lines_match_full_aggregation(self, temp_log_dir: Path) -> None:
+        """追記分のみの集計結果が全件集計と一致"""
+        target_date = date(2024, 1, 15)
+        log_file = temp_log_dir / f"{target_date.isoformat()}.jsonl"
+        log_file.write_text(
+            self._record(0, "Code.exe", ["Python", "API"])
+            + self._record(2, "chrome.exe", ["api"]),
+            encoding="utf-8",
+        )
+
+        service = create_aggregator(
+            base_path=temp_log_dir, config={"exclude_recent_sec": 0}
+        )
+        first = service.aggregate_incremental(target_date)
+        assert first.meta.capture_count == 2
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(self._record(40, "slack.exe", ["meeting", "Python"]))
+            f.write(self._record(42, "Code.exe", ["python"]))
+
+        incremental = service.aggregate_incremental(target_date)
+        full = service.aggregate(target_date)
+
+        assert self._without_generated_at(incremental) == (
+            self._without_generated_at(full)
+        )
+        checkpoint = service.repository.load_checkpoint(target_date)
+        assert checkpoint is not None
+        assert checkpoint["offset"] == log_file.stat().st_size
+
+    def test_partial_last_line_is_deferred(self, temp_log_dir: Path) -> None:
+        """書き込み途中の末尾行は次回に持ち越す"""
+        target_date = date(2024, 1, 15)
+        log_file = temp_log_dir / f"{target_date.isoformat()}.jsonl"
+        complete = self._record(0, "Code.exe", ["Python"])
+        partial = self._record(2, "chrome.exe", ["docs"])
+        log_file.write_text(complete + partial[:20], encoding="utf-8")
+
+        service = create_aggregator(
+            base_path=temp_log_dir, config={"exclude_recent_sec": 0}
+        )
+        features = service.aggregate_incremental(target_date)
+        assert features.meta.capture_count == 1
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(partial[20:])
+
+        features = service.aggregate_incremental(target_date)
+        assert features.meta.capture_count == 2
+
+    def test_recent_records_are_deferred(self, temp_log_dir: Path) -> None:
+        """直近N秒のレコードはチェックポイントに含めない"""
+        target_date = date.today()
+        log_file = temp_log_dir / f"{target_date.isoformat()}.jsonl"
+        now = datetime.now(JST)
+        lines = [
+            {"ts": (now - timedelta(minutes=10)).isoformat(), "process_name": "a.exe"},
+            {"ts": (now - timedelta(seconds=10)).isoformat(), "process_name": "b.exe"},
+        ]
+        log_file.write_text(
+            "".join(json.dumps(r) + "\n" for r in lines), encoding="utf-8"
+        )
+
+        service = create_aggregator(
+            base_path=temp_log_dir, config={"exclude_recent_sec": 120}
+        )
+        features = service.aggregate_incremental(target_date)
+        assert features.meta.capture_count == 1
+
+        checkpoint = service.repository.load_checkpoint(target_date)
+        assert checkpoint is not None
+        assert checkpoint["offset"] == len(json.dumps(lines[0]) + "\n")
+
+        # 閾値が変われば持ち越したレコードも集計される
+        service.config["exclude_recent_sec"] = 0
+        features = service.aggregate_incremental(target_date)
+        assert features.meta.capture_count == 2
+
+    def test_checkpoint_discarded_when_block_size_changes(
+        self, temp_log_dir: Path
+    ) -> None:
+        """time_block_min が変わった場合は先頭から集計し直す"""
+        target_date = date(2024, 1, 15)
+        log_file = temp_log_dir / f"{target_date.isoformat()}.jsonl"
+        log_file.write_text(
+            self._record(0, "Code.exe", ["Python"])
+            + self._record(40, "chrome.exe", ["docs"]),
+            encoding="utf-8",
+        )
+
+        create_aggregator(
+            base_path=temp_log_dir, config={"exclude_recent_sec": 0}
+        ).aggregate_incremental(target_date)
+
+        service = create_aggregator(
+            base_path=temp_log_dir,
+            config={"exclude_recent_sec": 0, "time_block_min": 60},
+        )
+        features = service.aggregate_incremental(target_date)
+
+        assert features.meta.capture_count == 2
+        assert [(b.start, b.end) for b in features.time_blocks] == [("09:00", "10:00")]
+
+    def test_aggregate_and_save_incremental(self, temp_log_dir: Path) -> None:
+        """aggregate_and_save(incremental=True) がチェックポイントと結果を保存"""
+        target_date = date(2024, 1, 15)
+        log_file = temp_log_dir / f"{target_date.isoformat()}.jsonl"
+        log_file.write_text(self._record(0, "Code.exe", ["Python"]), encoding="utf-8")
+
+        service = create_aggregator(
+            base_path=temp_log_dir, config={"exclude_recent_sec": 0}
+        )
+        features, saved_path = service.aggregate_and_save(target_date, incremental=True)
+
+        assert saved_path.exists()
+        assert service.repository.get_checkpoint_path(target_date).exists()
+        assert features.meta.capture_count == 1
+
+
+class TestWindowedAggregation:
+    """時間帯指定集計の統合テスト"""
+
+    def test_aggregate_window_matches_filtered_records(self, tmp_path: Path) -> None:
+        """時間帯内のレコードのみを集計した結果と一致"""
+        target_date = date(2024, 1, 15)
+        records = [
+            {
+                "ts": f"2024-01-15T{hour:02d}:{minute:02d}:00+09:00",
+                "process_name": "Code.exe" if minute % 20 else "chrome.exe",
+                "keywords": [f"kw{hour}", "Python"],
+            }
+            for hour in range(8, 14)
+            for minute in range(0, 60, 10)
+        ]
+        (tmp_path / "2024-01-15.jsonl").write_text(
+            "".join(json.dumps(r) + "\n" for r in records), encoding="utf-8"
+        )
+        in_window = [r for r in records if "09:00" <= r["ts"][11:16] < "12:00"]
+        (tmp_path / "expected").mkdir()
+        (tmp_path / "expected" / "2024-01-15.jsonl").write_text(
+            "".join(json.dumps(r) + "\n" for r in in_window), encoding="utf-8"
+        )
+
+        windowed = create_aggregator(
+            base_path=tmp_path, config={"exclude_recent_sec": 0}
+        ).aggregate_window(target_date, start=time(9, 0), end=time(12, 0))
+        expected = create_aggregator(
+            base_path=tmp_path / "expected", config={"exclude_recent_sec": 0}
+        ).aggregate(target_date)
+
+        assert windowed.meta.capture_count == 18
+        assert windowed.model_dump(exclude={"meta": {"generated_at"}}) == (
+            expected.model_dump(exclude={"meta": {"generated_at"}})
+        )
+
+
+class TestRangeAggregation:
+    """複数日集計（aggregate_range）の統合テスト"""
+
+    @staticmethod
+    def _day_records(day: date, process_names: list[str]) -> list[dict[str, Any]]:
+        return [
+            {
+                "ts": f"{day.isoformat()}T09:{minute * 4:02d}:00+09:00",
+                "process_name": process_name,
+                "keywords": [f"kw{day.day}", "Python" if minute % 2 else "python"],
+                "urls": [],
+                "files": [f"{process_name}.txt"],
+            }
+            for minute, process_name in enumerate(process_names)
+        ]
+
+    @pytest.fixture
+    def log_dir(self, tmp_path: Path) -> Path:
+        """1/15〜1/17のログ（1/16は欠損）と、全レコードを1日にまとめたログ"""
+        log_dir = tmp_path / "logs"
+        (log_dir / "combined").mkdir(parents=True)
+        combined: list[dict[str, Any]] = []
+        for day, process_names in [
+            (date(2024, 1, 15), ["Code.exe", "chrome.exe", "Code.exe"]),
+            (date(2024, 1, 17), ["slack.exe", "chrome.exe", "chrome.exe", "x.exe"]),
+        ]:
+            records = self._day_records(day, process_names)
+            combined += records
+            (log_dir / f"{day.isoformat()}.jsonl").write_text(
+                "".join(json.dumps(r) + "\n" for r in records), encoding="utf-8"
+            )
+        (log_dir / "combined" / "2024-01-15.jsonl").write_text(
+            "".join(json.dumps(r) + "\n" for r in combined), encoding="utf-8"
+        )
+        return log_dir
+
+    def test_merged_days_match_single_pass(self, log_dir: Path) -> None:
+        """日ごとの集計を結合した結果が全レコードの集計と一致（欠損日はスキップ）"""
+        features = create_aggregator(base_path=log_dir).aggregate_range(
+            date(2024, 1, 15), date(2024, 1, 17), workers=1
+        )
+        expected = create_aggregator(base_path=log_dir / "combined").aggregate(
+            date(2024, 1, 15)
+        )
+
+        exclude = {"meta": {"generated_at", "total_duration_min"}}
+        assert features.model_dump(exclude=exclude) == expected.model_dump(
+            exclude=exclude
+        )
+        assert features.meta.date == "2024-01-15"
+        assert features.meta.capture_count == 7
+        # 日ごとの記録時間の合計: (8分 + 2分) + (12分 + 2分)
+        assert features.meta.total_duration_min == 24
+
+    def test_process_pool_matches_sequential(self, log_dir: Path) -> None:
+        """プロセスプールでも順に集計した場合と同じ結果"""
+        service = create_aggregator(base_path=log_dir)
+
+        sequential = service.aggregate_range(
+            date(2024, 1, 14), date(2024, 1, 17), workers=1
+        )
+        parallel = service.aggregate_range(
+            date(2024, 1, 14), date(2024, 1, 17), workers=2
+        )
+
+        assert parallel.model_dump(exclude={"meta": {"generated_at"}}) == (
+            sequential.model_dump(exclude={"meta": {"generated_at"}})
+        )
+
+    def test_keyword_capacity_keeps_heavy_hitters(self, log_dir: Path) -> None:
+        """keyword_capacity を指定しても頻出キーワードは残る"""
+        exact = create_aggregator(base_path=log_dir).aggregate_range(
+            date(2024, 1, 15), date(2024, 1, 17), workers=1
+        )
+        bounded = create_aggregator(
+            base_path=log_dir, config={"keyword_capacity": 1}
+        ).aggregate_range(date(2024, 1, 15), date(2024, 1, 17), workers=1)
+
+        assert exact.global_keywords.top_keywords == ["python", "kw17", "kw15"]
+        assert bounded.global_keywords.top_keywords[0] == "python"
+        assert len(bounded.global_keywords.top_keywords) <= 2
+        assert bounded.meta.capture_count == exact.meta.capture_count
+
+    def test_invalid_range(self, log_dir: Path) -> None:
+        """start が end より後ならValueError"""
+        with pytest.raises(ValueError):
+            create_aggregator(base_path=log_dir).aggregate_range(
+                date(2024, 1, 17), date(2024, 1, 15)
+            )
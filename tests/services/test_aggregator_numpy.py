@@ -0,0 +1,165 @@
+"""NumPy集計バックエンドのテスト
+
+Python実装と同じ Features を生成することを確認する。
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.domain.features import Features
+from src.services.aggregator import LogAggregationService, create_aggregator
+from src.utils.time_utils import JST
+
+pytest.importorskip("numpy")
+
+
+def _without_generated_at(features: Features) -> dict[str, Any]:
+    data = features.model_dump(mode="json")
+    data["meta"].pop("generated_at")
+    return data
+
+
+@pytest.fixture
+def records() -> list[dict[str, Any]]:
+    """同数・大文字小文字違い・欠損値・同時刻・オフセット違い・同一ウィンドウの連続を含むログ"""
+    base = datetime(2025, 1, 15, 8, 50, tzinfo=JST)
+    processes = ["Code.exe", "chrome.exe", None, "slack.exe", "Unknown"]
+    keywords = ["Python", "python", "API", "", "テスト", "Error", "api"]
+    result = []
+    for i in range(240):
+        ts = base + timedelta(seconds=37 * i, milliseconds=(i % 4) * 250)
+        if i % 11 == 0:
+            ts = ts.astimezone(timezone.utc)  # UTC表記
+        record: dict[str, Any] = {
+            "ts": ts.isoformat(timespec="milliseconds" if i % 3 else "seconds"),
+            "process_name": processes[(i // 7) % len(processes)],
+            "window_title": f"window {i // 10}" if i % 13 else "",
+            "keywords": [keywords[(i + k) % len(keywords)] for k in range(i % 4)],
+            "urls": ["github.com"] if i % 5 == 0 else [],
+            "files": [f"file{i % 7}.py", f"FILE{i % 3}.py"] if i % 2 else None,
+        }
+        result.append(record)
+
+    # 同時刻のレコード（最初/最後の採用規則）
+    result.append({**result[0], "process_name": "tie.exe"})
+    result.append({**result[-2], "process_name": "tie.exe"})
+    # 同時刻で表記だけが違うレコード（ファイル内の順序で表記を選ぶ）
+    result.append({**result[5], "keywords": ["error", "Zeta"], "process_name": "b"})
+    result.append({**result[5], "keywords": ["ZETA", "Error"], "process_name": "a"})
+    # 無効なタイムスタンプ・直近のレコードは除外される
+    result.append({**result[1], "ts": "invalid"})
+    result.append({**result[1], "ts": "2025-01-15T09:00:00"})
+    result.append({**result[1], "ts": datetime.now(JST).isoformat()})
+    return result
+
+
+def _write_log(base_path: Path, target_date: date, records: list[dict]) -> None:
+    (base_path / f"{target_date.isoformat()}.jsonl").write_text(
+        "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records),
+        encoding="utf-8",
+    )
+
+
+class TestNumpyBackend:
+    """aggregation_backend="numpy" のテスト"""
+
+    @pytest.mark.parametrize("block_min", [15, 30, 60])
+    def test_matches_python_backend(
+        self, tmp_path: Path, records: list[dict[str, Any]], block_min: int
+    ) -> None:
+        """Python実装と同じFeaturesを生成する"""
+        target_date = date(2025, 1, 15)
+        _write_log(tmp_path, target_date, records)
+
+        python_features = create_aggregator(
+            tmp_path, config={"time_block_min": block_min}
+        ).aggregate(target_date)
+        numpy_features = create_aggregator(
+            tmp_path,
+            config={"time_block_min": block_min, "aggregation_backend": "numpy"},
+        ).aggregate(target_date)
+
+        assert _without_generated_at(numpy_features) == _without_generated_at(
+            python_features
+        )
+
+    def test_matches_python_backend_from_columnar(
+        self, tmp_path: Path, records: list[dict[str, Any]]
+    ) -> None:
+        """列指向アーカイブからの集計でもPython実装と一致する"""
+        target_date = date(2025, 1, 15)
+        _write_log(tmp_path, target_date, records)
+        python_service = create_aggregator(tmp_path)
+        python_service.repository.compact_day(target_date)
+
+        python_features = python_service.aggregate(target_date)
+        numpy_features = create_aggregator(
+            tmp_path,
+            config={"use_columnar_archive": True, "aggregation_backend": "numpy"},
+        ).aggregate(target_date)
+
+        assert _without_generated_at(numpy_features) == _without_generated_at(
+            python_features
+        )
+
+    def test_keyword_capacity_matches_python_backend(
+        self, tmp_path: Path, records: list[dict[str, Any]]
+    ) -> None:
+        """近似集計（keyword_capacity 指定）でもPython実装と一致する"""
+        target_date = date(2025, 1, 15)
+        _write_log(tmp_path, target_date, records)
+        config = {"keyword_capacity": 2, "top_keywords_count": 5}
+
+        python_features = create_aggregator(tmp_path, config=config).aggregate(
+            target_date
+        )
+        numpy_features = create_aggregator(
+            tmp_path, config={**config, "aggregation_backend": "numpy"}
+        ).aggregate(target_date)
+
+        assert _without_generated_at(numpy_features) == _without_generated_at(
+            python_features
+        )
+
+    def test_session_capacity_matches_python_backend(
+        self, tmp_path: Path, records: list[dict[str, Any]]
+    ) -> None:
+        """セッション数の制限（session_capacity 指定）でもPython実装と一致する"""
+        target_date = date(2025, 1, 15)
+        _write_log(tmp_path, target_date, records)
+        config = {"session_capacity": 5}
+
+        python_features = create_aggregator(tmp_path, config=config).aggregate(
+            target_date
+        )
+        numpy_features = create_aggregator(
+            tmp_path, config={**config, "aggregation_backend": "numpy"}
+        ).aggregate(target_date)
+
+        assert len(python_features.sessions) == 5
+        assert _without_generated_at(numpy_features) == _without_generated_at(
+            python_features
+        )
+
+    def test_no_valid_records(self, tmp_path: Path) -> None:
+        """有効なレコードがなければ空のFeatures"""
+        target_date = date(2025, 1, 15)
+        _write_log(tmp_path, target_date, [{"ts": "invalid", "process_name": "a"}])
+
+        features = create_aggregator(
+            tmp_path, config={"aggregation_backend": "numpy"}
+        ).aggregate(target_date)
+
+        assert features.meta.capture_count == 0
+        assert features.time_blocks == []
+
+    def test_unknown_backend(self) -> None:
+        """未知のバックエンドはValueError"""
+        with pytest.raises(ValueError):
+            LogAggregationService(config={"aggregation_backend": "polars"})
@@ -0,0 +1,98 @@
+"""SummarizerService の LLM要約キャッシュのテスト
+
+test_summarizer.py とは別モジュールにして、集計サービスと組み合わせて確認する。
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+from src.domain.report import LLMSummary
+from src.services.aggregator import create_aggregator
+from src.services.summarizer import SummarizerService
+
+TARGET_DATE = date(2024, 1, 15)
+
+
+class CountingClient:
+    """呼び出し回数と入力を記録するモック GeminiClient"""
+
+    model_name = "gemini-2.5-flash-test"
+
+    def __init__(self) -> None:
+        self.inputs: list[dict] = []
+
+    def generate_summary(self, features: dict) -> LLMSummary:
+        self.inputs.append(features)
+        return LLMSummary(work_summary=f"要約{len(self.inputs)}")
+
+
+def _write_log(base_path: Path, keywords: list[str]) -> None:
+    records = [
+        {
+            "ts": f"2024-01-15T09:{minute:02d}:00+09:00",
+            "window_title": "main.py - VSCode",
+            "process_name": "Code.exe",
+            "keywords": keywords,
+            "urls": [],
+            "files": ["main.py"],
+        }
+        for minute in range(0, 20, 2)
+    ]
+    (base_path / f"{TARGET_DATE.isoformat()}.jsonl").write_text(
+        "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records),
+        encoding="utf-8",
+    )
+
+
+class TestSummaryCache:
+    """LLM要約キャッシュのテスト"""
+
+    def test_regenerated_features_hit_cache(self, tmp_path: Path) -> None:
+        """同じログを集計し直した特徴量ではLLMを呼び出さない"""
+        _write_log(tmp_path, ["Python", "Flask"])
+        aggregator = create_aggregator(base_path=tmp_path)
+        client = CountingClient()
+        service = SummarizerService(gemini_client=client)
+
+        first_encoded, _ = aggregator.aggregate_and_encode(TARGET_DATE)
+        first = service.generate_report(first_encoded.features, first_encoded)
+        again_encoded, _ = aggregator.aggregate_and_encode(TARGET_DATE)
+        again = service.generate_report(again_encoded.features, again_encoded)
+
+        # 保存時のエンコード結果をそのままLLM入力にする
+        assert client.inputs[0] == first_encoded.to_dict()
+        assert again_encoded.features is not first_encoded.features
+        assert first.work_summary == again.work_summary == "要約1"
+        assert len(client.inputs) == 1
+
+    def test_changed_log_misses_cache(self, tmp_path: Path) -> None:
+        """ログの内容が変われば要約し直す"""
+        aggregator = create_aggregator(base_path=tmp_path)
+        client = CountingClient()
+        service = SummarizerService(gemini_client=client)
+
+        _write_log(tmp_path, ["Python", "Flask"])
+        encoded, _ = aggregator.aggregate_and_encode(TARGET_DATE)
+        first = service.generate_report(encoded.features, encoded)
+        _write_log(tmp_path, ["Docker"])
+        encoded, _ = aggregator.aggregate_and_encode(TARGET_DATE)
+        other = service.generate_report(encoded.features, encoded)
+
+        assert first.work_summary == "要約1"
+        assert other.work_summary == "要約2"
+
+    def test_without_encoded_uses_model_dump(self, tmp_path: Path) -> None:
+        """エンコード結果を渡さない場合はエンコードせず、キャッシュも使わない"""
+        _write_log(tmp_path, ["Python"])
+        features = create_aggregator(base_path=tmp_path).aggregate(TARGET_DATE)
+        client = CountingClient()
+        service = SummarizerService(gemini_client=client)
+
+        service.generate_report(features)
+        service.generate_report(features)
+
+        assert client.inputs[0] == features.model_dump(mode="json")
+        assert len(client.inputs) == 2
@@ -0,0 +1,295 @@
+"""集計の中間状態（FeaturesAccumulator ほか）のユニットテスト."""
+
+from typing import Any
+
+import pytest
+
+from src.domain.features import (
+    FeaturesAccumulator,
+    FirstSeenCounter,
+    KeywordCounter,
+)
+
+JST_OFFSET = 32400
+
+
+def _record(
+    process_name: str | None,
+    keywords: list[str],
+    files: list[str] | None = None,
+    urls: list[str] | None = None,
+) -> dict[str, Any]:
+    return {
+        "process_name": process_name,
+        "keywords": keywords,
+        "files": files or [],
+        "urls": urls or [],
+    }
+
+
+# (UNIX時刻, レコード, 時間ブロック)
+ROWS = [
+    (100, _record("Code.exe", ["Python", "API"], ["main.py"]), ("09:00", "09:30")),
+    (
+        160,
+        _record("chrome.exe", ["api", "Docs"], urls=["python.org"]),
+        ("09:00", "09:30"),
+    ),
+    (220, _record(None, ["python"]), ("09:00", "09:30")),
+    (1900, _record("Code.exe", ["Go", "docs"], ["MAIN.py"]), ("09:30", "10:00")),
+    (1960, _record("chrome.exe", ["DOCS"], urls=["Python.org"]), ("09:30", "10:00")),
+    (2020, _record("Code.exe", ["go"]), ("09:30", "10:00")),
+]
+
+
+def _accumulate(rows: list[tuple[int, dict[str, Any], tuple[str, str]]]):
+    accumulator = FeaturesAccumulator(block_min=30)
+    for epoch, record, block in rows:
+        accumulator.add(record, (epoch, JST_OFFSET), block)
+    return accumulator
+
+
+def _merged(*parts: FeaturesAccumulator) -> FeaturesAccumulator:
+    result = FeaturesAccumulator(block_min=30)
+    for part in parts:
+        result.merge(part)
+    return result
+
+
+def _snapshot(accumulator: FeaturesAccumulator) -> dict[str, Any]:
+    """順序に依存しない比較用の表現."""
+    return {
+        "blocks": {
+            key: (
+                block.apps.ranked(),
+                block.keywords.ranked(),
+                block.files.ranked(),
+            )
+            for key, block in accumulator.blocks.items()
+        },
+        "app_counts": accumulator.app_counts.ranked(),
+        "apps": {
+            name: (app.keywords.ranked(), app.files.ranked(), app.urls.ranked())
+            for name, app in accumulator.apps.items()
+        },
+        "keywords": accumulator.keywords.ranked(),
+        "urls": accumulator.urls.ranked(),
+        "files": accumulator.files.ranked(),
+        "capture_count": accumulator.capture_count,
+        "first_ts": accumulator.first_ts,
+        "last_ts": accumulator.last_ts,
+    }
+
+
+class TestKeywordCounter:
+    """KeywordCounter / FirstSeenCounter のテスト."""
+
+    def test_first_seen_casing_by_time(self) -> None:
+        """表記と同数時の順序は取り込み順ではなく出現時刻で決まる."""
+        counter = KeywordCounter()
+        counter.update(["python", "API"], seen_at=20)
+        counter.update(["Python", "Go"], seen_at=10)
+
+        assert counter.ranked() == [("Python", 2), ("Go", 1), ("API", 1)]
+
+    def test_same_time_keeps_record_order(self) -> None:
+        """同時刻のレコードは表記と同数時の順序をレコード番号の順で決める."""
+        counter = KeywordCounter()
+        counter.update(["python", "Rust"], seen_at=10, order=0)
+        counter.update(["Python", "Go", "rust"], seen_at=10, order=1)
+
+        assert counter.ranked() == [("python", 2), ("Rust", 2), ("Go", 1)]
+
+    def test_accumulator_same_time_follows_file_order(self) -> None:
+        """同時刻のレコードはファイル内の順序（merge_keywords と同じ）."""
+        rows = [
+            (100, _record("b.exe", ["zeta", "Beta"]), ("09:00", "09:30")),
+            (100, _record("a.exe", ["ZETA", "alpha", "beta"]), ("09:00", "09:30")),
+        ]
+
+        accumulator = _accumulate(rows)
+
+        assert accumulator.keywords.ranked() == [
+            ("zeta", 2),
+            ("Beta", 2),
+            ("alpha", 1),
+        ]
+        assert accumulator.app_counts.ranked() == [("b.exe", 1), ("a.exe", 1)]
+
+    def test_merge_is_commutative(self) -> None:
+        """merge の順序によらず同じ結果."""
+        a = KeywordCounter()
+        a.update(["python", "Rust"], seen_at=20)
+        b = KeywordCounter()
+        b.update(["Python", "rust", "Go"], seen_at=10)
+
+        ab = KeywordCounter()
+        ab.merge(a)
+        ab.merge(b)
+        ba = KeywordCounter()
+        ba.merge(b)
+        ba.merge(a)
+
+        assert ab.ranked() == ba.ranked() == [("Python", 2), ("rust", 2), ("Go", 1)]
+
+    def test_case_sensitive_counter(self) -> None:
+        """FirstSeenCounter は大文字小文字を区別する."""
+        counter = FirstSeenCounter()
+        counter.add("Code.exe", seen_at=1)
+        counter.add("code.exe", seen_at=2)
+        counter.add("code.exe", seen_at=3)
+
+        assert counter.ranked() == [("code.exe", 2), ("Code.exe", 1)]
+        assert counter.total() == 3
+
+    def test_keyed_update_matches_update(self) -> None:
+        """keyed() で作った値を複数のカウンタで共有しても update() と同じ結果."""
+        values = ["Python", "", "API", "python", "Go"]
+        keyed = KeywordCounter.keyed(values)
+        shared = [KeywordCounter(), KeywordCounter(capacity=1)]
+        for counter in shared:
+            counter.update_keyed(keyed, seen_at=1)
+
+        direct = KeywordCounter()
+        direct.update(values, seen_at=1)
+        bounded = KeywordCounter(capacity=1)
+        bounded.update(values, seen_at=1)
+
+        assert shared[0].ranked() == direct.ranked()
+        assert shared[1].ranked() == bounded.ranked()
+        assert [position for position, _, _ in keyed] == [0, 2, 3, 4]
+
+    def test_contains(self) -> None:
+        """in は集計キーで判定する."""
+        counter = KeywordCounter()
+        counter.update(["Python"])
+
+        assert "python" in counter
+        assert "Go" not in counter
+        assert None not in counter
+
+    def test_lowercase_keys_are_interned(self) -> None:
+        """同じ表記の集計キーは同一オブジェクト."""
+        first = KeywordCounter.keyed(["".join(["Py", "thon"])])
+        second = KeywordCounter.keyed(["".join(["Pyt", "hon"])])
+
+        assert first[0][1] == "python"
+        assert first[0][1] is second[0][1]
+
+    def test_pairs_round_trip(self) -> None:
+        """to_pairs / from_pairs で集計状態を復元できる."""
+        counter = KeywordCounter()
+        counter.update(["Python", "API"], seen_at=1.5)
+        counter.update(["api"], seen_at=2)
+
+        restored = KeywordCounter.from_pairs(counter.to_pairs())
+
+        assert restored.ranked() == counter.ranked()
+        assert isinstance(restored, KeywordCounter)
+
+
+class TestBoundedCounter:
+    """capacity を指定した KeywordCounter（Misra-Gries）のテスト."""
+
+    @staticmethod
+    def _stream() -> list[str]:
+        # 頻出語3つと1回だけのOCRノイズ300語
+        heavy = ["Python"] * 120 + ["API"] * 80 + ["Docs"] * 60
+        noise = [f"noise{i}" for i in range(300)]
+        return [word for pair in zip(heavy + [""] * 40, noise) for word in pair if word]
+
+    def test_exact_below_capacity(self) -> None:
+        """異なる値が capacity の2倍以下なら正確に集計する."""
+        bounded = KeywordCounter(capacity=2)
+        exact = KeywordCounter()
+        for counter in (bounded, exact):
+            counter.update(["Python", "API", "python", "Go"])
+
+        assert bounded.ranked() == exact.ranked()
+
+    def test_heavy_hitters_survive_with_bounded_size(self) -> None:
+        """保持する値は capacity の2倍以内で、頻出語の順位は正確."""
+        counter = KeywordCounter(capacity=5)
+        max_size = 0
+        for word in self._stream():
+            counter.update([word])
+            max_size = max(max_size, len(counter))
+
+        assert max_size <= 10
+        assert counter.most_common()[:3] == ["Python", "API", "Docs"]
+
+    def test_merge_of_bounded_counters(self) -> None:
+        """近似集計同士を結合しても頻出語は残る."""
+        stream = self._stream()
+        a = KeywordCounter(capacity=5)
+        a.update(stream[::2])
+        b = KeywordCounter(capacity=5)
+        b.update(stream[1::2])
+
+        a.merge(b)
+
+        assert len(a) <= 10
+        assert a.most_common()[:3] == ["Python", "API", "Docs"]
+
+    def test_invalid_capacity(self) -> None:
+        """capacity が1未満ならValueError."""
+        with pytest.raises(ValueError):
+            KeywordCounter(capacity=0)
+
+    def test_accumulator_round_trip_keeps_capacity(self) -> None:
+        """to_dict / from_dict で keyword_capacity も復元される."""
+        accumulator = FeaturesAccumulator(block_min=30, keyword_capacity=3)
+        for epoch, record, block in ROWS:
+            accumulator.add(record, (epoch, JST_OFFSET), block)
+
+        restored = FeaturesAccumulator.from_dict(accumulator.to_dict())
+
+        assert restored.keyword_capacity == 3
+        assert restored.keywords.capacity == 3
+        assert restored.apps["Code.exe"].keywords.capacity == 3
+        assert _snapshot(restored) == _snapshot(accumulator)
+
+
+class TestFeaturesAccumulator:
+    """FeaturesAccumulator の結合のテスト."""
+
+    def test_merge_of_slices_matches_single_pass(self) -> None:
+        """分割して集計・結合した結果が一括の集計と一致する."""
+        expected = _snapshot(_accumulate(ROWS))
+
+        assert _snapshot(_merged(_accumulate(ROWS[:2]), _accumulate(ROWS[2:]))) == (
+            expected
+        )
+
+    def test_merge_is_commutative_and_associative(self) -> None:
+        """結合順・グループ分けによらず同じ結果（時刻が交錯するスライスでも）."""
+        a = _accumulate(ROWS[0::3])
+        b = _accumulate(ROWS[1::3])
+        c = _accumulate(ROWS[2::3])
+        expected = _snapshot(_accumulate(ROWS))
+
+        assert _snapshot(_merged(a, b, c)) == expected
+        assert _snapshot(_merged(c, b, a)) == expected
+        assert _snapshot(_merged(_merged(b, c), a)) == expected
+
+    def test_merge_does_not_modify_other(self) -> None:
+        """merge は引数の集計状態を変更しない."""
+        other = _accumulate(ROWS[3:])
+        before = _snapshot(other)
+
+        _merged(_accumulate(ROWS[:3]), other)
+
+        assert _snapshot(other) == before
+
+    def test_merge_rejects_different_block_size(self) -> None:
+        """時間ブロックの長さが異なる集計状態は結合できない."""
+        with pytest.raises(ValueError):
+            FeaturesAccumulator(block_min=30).merge(FeaturesAccumulator(block_min=60))
+
+    def test_dict_round_trip(self) -> None:
+        """to_dict / from_dict で集計状態を復元できる."""
+        accumulator = _accumulate(ROWS)
+
+        restored = FeaturesAccumulator.from_dict(accumulator.to_dict())
+
+        assert _snapshot(restored) == _snapshot(accumulator)
@@ -1,11 +1,13 @@
 """CaptureRecord ドメインモデルのユニットテスト."""
 
+import json
 from datetime import datetime, timezone
 
 import pytest
 from pydantic import ValidationError
 
-from src.domain.capture import CaptureRecord
+from src.domain.capture import CaptureRecord, CaptureRow, from_jsonl_lines
+from src.domain.features import FeaturesAccumulator
 
 
 class TestCaptureRecordValidation:
@@ -273,3 +275,74 @@ class TestCaptureRecordStringRepresentation:
         assert "ts=" in result
         assert "window_title=" in result
         assert "process_name=" in result
+
+
+class TestCaptureRow:
+    """CaptureRow（検証なしの軽量レコード）のテスト."""
+
+    RAW = {
+        "ts": "2025-12-25T14:30:00+09:00",
+        "window_title": "main.py - Visual Studio Code",
+        "process_name": "Code.exe",
+        "keywords": ["Python", "def", "Python"],
+        "urls": None,
+        "files": ["main.py"],
+    }
+
+    def test_from_dict_does_not_validate(self) -> None:
+        """from_dict は値をそのまま保持し、リスト以外は空リストにする."""
+        row = CaptureRow.from_dict(self.RAW)
+
+        assert row.keywords == ["Python", "def", "Python"]
+        assert row.urls == []
+        assert row.numbers == []
+        assert row.get("process_name") == "Code.exe"
+        assert row.get("missing", "default") == "default"
+
+    def test_to_record_validates(self) -> None:
+        """to_record で検証・正規化した CaptureRecord に変換できる."""
+        record = CaptureRow.from_dict(self.RAW).to_record()
+
+        assert record.keywords == ["Python", "def"]
+        assert record.to_row().keywords == ["Python", "def"]
+
+        with pytest.raises(ValidationError):
+            CaptureRow.from_dict({"ts": "invalid"}).to_record()
+
+    def test_accumulator_accepts_rows(self) -> None:
+        """dict の代わりに集計状態へ渡せる."""
+        by_dict = FeaturesAccumulator()
+        by_dict.add(self.RAW, (0, 32400), ("14:30", "15:00"))
+        by_row = FeaturesAccumulator()
+        by_row.add(CaptureRow.from_dict(self.RAW), (0, 32400), ("14:30", "15:00"))
+
+        assert by_row.to_dict() == by_dict.to_dict()
+
+
+class TestFromJsonlLines:
+    """from_jsonl_lines のテスト."""
+
+    def test_converts_lines(self) -> None:
+        """bytes/str の行を変換し、空行は読み飛ばす."""
+        line = json.dumps(TestCaptureRow.RAW)
+        rows = list(from_jsonl_lines([line.encode() + b"\n", "", "  \n", line]))
+
+        assert len(rows) == 2
+        assert rows[0] == rows[1] == CaptureRow.from_dict(TestCaptureRow.RAW)
+
+    def test_validate(self) -> None:
+        """validate=True の場合は検証・正規化する."""
+        line = json.dumps({**TestCaptureRow.RAW, "urls": []})
+        rows = list(from_jsonl_lines([line], validate=True))
+
+        assert rows[0].keywords == ["Python", "def"]
+
+        with pytest.raises(ValidationError):
+            list(from_jsonl_lines(['{"ts": "invalid"}'], validate=True))
+
+    def test_invalid_lines(self) -> None:
+        """JSONでない行・オブジェクトでない行はValueError."""
+        with pytest.raises(ValueError):
+            list(from_jsonl_lines(["{broken"]))
+        with pytest.raises(ValueError):
+            list(from_jsonl_lines(["[1, 2]"]))
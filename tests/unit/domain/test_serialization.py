@@ -260,6 +260,81 @@ class TestFeaturesSerialization:
         assert isinstance(summary.rank, AppRank)
 
 
+class TestEncodedFeatures:
+    """Features.encode() のテスト."""
+
+    @staticmethod
+    def _features() -> Features:
+        return Features(
+            meta=FeaturesMeta(
+                date="2025-12-25",
+                generated_at="2025-12-25T18:00:00+09:00",
+                capture_count=2,
+                first_capture="09:00:00",
+                last_capture="09:01:00",
+                total_duration_min=2.0,
+            ),
+            app_summary=[
+                AppSummary(
+                    name="メモ帳",
+                    process="notepad.exe",
+                    count=2,
+                    duration_min=2.0,
+                    rank=AppRank.HIGH,
+                    top_keywords=["日本語"],
+                ),
+            ],
+        )
+
+    def test_matches_json_dump(self) -> None:
+        """json.dump（indent=2, ensure_ascii=False）と同じ内容."""
+        features = self._features()
+
+        encoded = features.encode()
+
+        expected = json.dumps(
+            features.model_dump(mode="json"), ensure_ascii=False, indent=2
+        )
+        assert encoded.data.decode("utf-8") == expected
+        assert encoded.to_dict() == features.model_dump(mode="json")
+        assert Features.model_validate_json(encoded.data) == features
+
+    def test_compact(self) -> None:
+        """compact=True ではインデントなし."""
+        features = self._features()
+
+        compact = features.encode(compact=True)
+
+        assert b"\n" not in compact.data
+        assert len(compact) < len(features.encode())
+        assert compact.to_dict() == features.encode().to_dict()
+
+    def test_cache_key(self) -> None:
+        """同じ内容なら同じキー、内容が変われば別のキー."""
+        features = self._features()
+        changed = features.model_copy(
+            update={"meta": features.meta.model_copy(update={"capture_count": 3})}
+        )
+
+        assert features.encode().cache_key == features.encode().cache_key
+        assert len(features.encode().cache_key) == 64
+        assert changed.encode().cache_key != features.encode().cache_key
+
+    def test_cache_key_ignores_generated_at(self) -> None:
+        """生成時刻だけが違う場合は同じキー."""
+        features = self._features()
+        regenerated = features.model_copy(
+            update={
+                "meta": features.meta.model_copy(
+                    update={"generated_at": "2099-01-01T00:00:00+09:00"}
+                )
+            }
+        )
+
+        assert regenerated.encode().cache_key == features.encode().cache_key
+        assert regenerated.encode().data != features.encode().data
+
+
 class TestEdgeCases:
     """エッジケースのシリアライゼーションテスト."""
 
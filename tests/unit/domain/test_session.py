@@ -0,0 +1,159 @@
+"""セッション化（SessionBuilder）のユニットテスト."""
+
+from typing import Any
+
+import pytest
+
+from src.domain.session import SessionBuilder, SessionState
+
+JST_OFFSET = 32400
+
+
+def _record(
+    process_name: str | None, window_title: str | None, keywords: list[str]
+) -> dict[str, Any]:
+    return {
+        "process_name": process_name,
+        "window_title": window_title,
+        "keywords": keywords,
+        "files": [],
+        "urls": [],
+    }
+
+
+def _switching_rows(count: int) -> list[tuple[int, dict[str, Any]]]:
+    """1分ごとにウィンドウを切り替え、7回に1回だけ同じウィンドウが3回続くログ."""
+    rows = []
+    epoch = 0
+    for i in range(count):
+        for _ in range(3 if i % 7 == 0 else 1):
+            rows.append((epoch, _record("Code.exe", f"file{i}.py", [])))
+            epoch += 60
+    return rows
+
+
+# (UNIX時刻, レコード)
+ROWS = [
+    (0, _record("Code.exe", "main.py", ["Python", "def"])),
+    (120, _record("Code.exe", "main.py", ["def", "class"])),
+    (240, _record("chrome.exe", "Docs", ["API"])),
+    (360, _record("chrome.exe", "Docs", [])),
+    (480, _record("Code.exe", "main.py", ["Python"])),
+    # スリープ等による中断（max_gap_sec 超）
+    (3600, _record("Code.exe", "main.py", ["import"])),
+]
+
+
+def _build(
+    rows: list[tuple[int, dict[str, Any]]], capacity: int | None = None
+) -> SessionBuilder:
+    builder = SessionBuilder(max_gap_sec=300, capacity=capacity)
+    for epoch, record in rows:
+        builder.add(record, (epoch, JST_OFFSET))
+    return builder
+
+
+def _summary(builder: SessionBuilder) -> list[tuple[Any, ...]]:
+    return [
+        (
+            s.process_name,
+            s.window_title,
+            s.first_ts[0],
+            s.last_ts[0],
+            s.capture_count,
+            list(s.keywords),
+        )
+        for s in builder.sessions
+    ]
+
+
+class TestSessionBuilder:
+    """SessionBuilder のテスト."""
+
+    def test_merges_consecutive_captures(self) -> None:
+        """連続する同一 (window_title, process_name) を1セッションにまとめる."""
+        assert _summary(_build(ROWS)) == [
+            ("Code.exe", "main.py", 0, 120, 2, ["Python", "def", "class"]),
+            ("chrome.exe", "Docs", 240, 360, 2, ["API"]),
+            ("Code.exe", "main.py", 480, 480, 1, ["Python"]),
+            ("Code.exe", "main.py", 3600, 3600, 1, ["import"]),
+        ]
+
+    def test_window_change_starts_new_session(self) -> None:
+        """同じアプリでもウィンドウが変われば別セッション（空のタイトルはNone）."""
+        builder = _build(
+            [
+                (0, _record("Code.exe", "a.py", [])),
+                (60, _record("Code.exe", "b.py", [])),
+                (120, _record(None, "", [])),
+                (180, _record("Unknown", None, [])),
+            ]
+        )
+
+        assert [(s.key, s.capture_count) for s in builder.sessions] == [
+            (("Code.exe", "a.py"), 1),
+            (("Code.exe", "b.py"), 1),
+            (("Unknown", None), 2),
+        ]
+
+    def test_merge_joins_sessions_across_slices(self) -> None:
+        """分割して組み立てたセッションを結合すると一括の結果と一致する."""
+        expected = _summary(_build(ROWS))
+
+        for split in range(1, len(ROWS)):
+            first, second = _build(ROWS[:split]), _build(ROWS[split:])
+            before = _summary(second)
+            first.merge(second)
+
+            assert _summary(first) == expected
+            assert _summary(second) == before
+
+        reversed_order = _build(ROWS[3:])
+        reversed_order.merge(_build(ROWS[:3]))
+        assert _summary(reversed_order) == expected
+
+    def test_dict_round_trip(self) -> None:
+        """to_dict / from_dict で復元できる."""
+        builder = _build(ROWS)
+
+        restored = SessionBuilder.from_dict(builder.to_dict())
+
+        assert restored.max_gap_sec == 300
+        assert restored.capacity is None
+        assert _summary(restored) == _summary(builder)
+        assert all(isinstance(s, SessionState) for s in restored.sessions)
+
+    def test_capacity_bounds_sessions(self) -> None:
+        """capacity を超えないよう、キャプチャ数の少ないセッションから捨てる."""
+        rows = _switching_rows(1000)
+        unbounded = _build(rows)
+
+        bounded = _build(rows, capacity=50)
+
+        assert len(unbounded) == 1000
+        # 組み立て中も capacity の2倍までしか保持しない
+        assert len(bounded) <= 100
+        bounded.compact()
+        sessions = _summary(bounded)
+        assert len(sessions) == 50
+        assert sessions[0] == _summary(unbounded)[0]
+        assert sessions[-1] == _summary(unbounded)[-1]
+        assert [s[4] for s in sessions[1:-1]] == [3] * 48
+        assert sessions == sorted(sessions, key=lambda s: s[2])
+
+    def test_compact_matches_single_compaction(self) -> None:
+        """途中で compact() しても最後に1回だけ compact() した結果と一致する."""
+        rows = _switching_rows(300)
+        once = _build(rows)
+        once.capacity = 20
+        once.compact()
+
+        bounded = _build(rows, capacity=20)
+        bounded.compact()
+
+        assert _summary(bounded) == _summary(once)
+
+    def test_invalid_capacity(self) -> None:
+        """capacity が2未満ならValueError."""
+        with pytest.raises(ValueError):
+            SessionBuilder(capacity=1)
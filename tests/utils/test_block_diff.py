@@ -0,0 +1,169 @@
+"""Block Diff - ユニットテスト"""
+
+import random
+from typing import Any
+
+from src.domain.report import AppUsage
+from src.utils.block_builder import (
+    build_app_table,
+    bulleted_list_item,
+    divider,
+    heading_2,
+    paragraph,
+)
+from src.utils.block_diff import BlockDiff, block_signature, diff_blocks
+
+
+def _existing(blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """APIから取得した形式（ID付き、テーブルの行は含まない）に変換"""
+    result = []
+    for i, block in enumerate(blocks):
+        stored = {**block, "id": f"b{i}"}
+        if block["type"] == "table":
+            stored["table"] = {
+                key: value for key, value in block["table"].items() if key != "children"
+            }
+        result.append(stored)
+    return result
+
+
+def _apply(existing: list[dict[str, Any]], diff: BlockDiff) -> list[dict[str, Any]]:
+    """差分を適用したブロック列（Notion API の挙動を模擬）"""
+    blocks = [dict(block) for block in existing]
+    deleted = set(diff.deletes)
+    blocks = [block for block in blocks if block["id"] not in deleted]
+    for block_id, new in diff.updates:
+        index = [block["id"] for block in blocks].index(block_id)
+        blocks[index] = {**new, "id": block_id}
+    for n, (after, children) in enumerate(diff.inserts):
+        index = len(blocks)
+        if after is not None:
+            index = [block["id"] for block in blocks].index(after) + 1
+        blocks[index:index] = [
+            {**block, "id": f"new{n}-{i}"} for i, block in enumerate(children)
+        ]
+    return blocks
+
+
+def _signatures(blocks: list[dict[str, Any]]) -> list[str | None]:
+    return [block_signature(block) for block in blocks]
+
+
+BASE = [
+    heading_2("📊 基本情報"),
+    paragraph("生成日時: 2025-01-15 18:00:00"),
+    heading_2("📝 作業サマリー"),
+    paragraph("午前はレビュー"),
+    heading_2("📁 作業ファイル"),
+    bulleted_list_item("main.py"),
+    bulleted_list_item("README.md"),
+    divider(),
+    paragraph("🤖 Generated by Daily Report Bot"),
+]
+
+
+class TestBlockSignature:
+    """block_signature のテスト"""
+
+    def test_api_block_matches_generated(self):
+        """APIから取得したブロック（plain_text）と生成したブロックが一致"""
+        fetched = {
+            "id": "b0",
+            "type": "paragraph",
+            "has_children": False,
+            "paragraph": {
+                "rich_text": [
+                    {"type": "text", "plain_text": "午前は", "annotations": {}},
+                    {"type": "text", "plain_text": "レビュー", "annotations": {}},
+                ],
+                "color": "default",
+            },
+        }
+
+        assert block_signature(fetched) == block_signature(paragraph("午前はレビュー"))
+
+    def test_type_is_part_of_signature(self):
+        """同じテキストでも種別が違えば別のブロック"""
+        assert block_signature(paragraph("A")) != block_signature(heading_2("A"))
+
+    def test_fetched_table_is_not_comparable(self):
+        """行を含まない取得済みテーブルは比較できない"""
+        table = build_app_table([AppUsage(name="Chrome", duration_min=10, rank="high")])
+
+        assert block_signature(table) is not None
+        assert block_signature(_existing([table])[0]) is None
+
+
+class TestDiffBlocks:
+    """diff_blocks のテスト"""
+
+    def test_identical_blocks(self):
+        """変更がなければ操作なし"""
+        diff = diff_blocks(_existing(BASE), BASE)
+
+        assert not diff
+        assert diff.kept == len(BASE)
+
+    def test_changed_paragraph_is_updated(self):
+        """同じ種別のテキストブロックは内容を更新"""
+        new = list(BASE)
+        new[3] = paragraph("午前はレビュー、午後は実装")
+
+        diff = diff_blocks(_existing(BASE), new)
+
+        assert diff.updates == [("b3", new[3])]
+        assert diff.call_count == 1
+
+    def test_inserted_and_removed_items(self):
+        """追加・削除されたブロックだけを挿入・削除"""
+        new = BASE[:5] + [bulleted_list_item("test.py")] + BASE[6:]
+        new.insert(7, bulleted_list_item("setup.py"))
+
+        diff = diff_blocks(_existing(BASE), new)
+
+        assert diff.call_count <= 2
+        assert _signatures(_apply(_existing(BASE), diff)) == _signatures(new)
+
+    def test_table_is_replaced(self):
+        """テーブルは削除して挿入し直す"""
+        table = build_app_table([AppUsage(name="Chrome", duration_min=10, rank="high")])
+        old = BASE[:4] + [table] + BASE[4:]
+
+        diff = diff_blocks(_existing(old), old)
+
+        assert diff.deletes == ["b4"]
+        assert diff.inserts == [("b3", [table])]
+
+    def test_insert_at_head_replaces_all(self):
+        """先頭への挿入が必要な場合は全ブロックを置換"""
+        new = [paragraph("先頭")] + BASE
+
+        diff = diff_blocks(_existing(BASE), new)
+
+        assert diff.deletes == [f"b{i}" for i in range(len(BASE))]
+        assert diff.inserts == [(None, new)]
+
+    def test_random_edits_reproduce_new_blocks(self):
+        """任意の編集に対して、差分の適用結果が新しいブロック列と一致する"""
+        rng = random.Random(0)
+        makers = [paragraph, heading_2, bulleted_list_item]
+        for _ in range(200):
+            old = [rng.choice(makers)(str(rng.randrange(5))) for _ in range(8)]
+            new = list(old)
+            for _ in range(rng.randrange(4)):
+                op = rng.randrange(3)
+                if op == 0 and new:
+                    del new[rng.randrange(len(new))]
+                elif op == 1:
+                    new.insert(
+                        rng.randrange(len(new) + 1),
+                        rng.choice(makers)(str(rng.randrange(5))),
+                    )
+                elif new:
+                    index = rng.randrange(len(new))
+                    new[index] = rng.choice(makers)(str(rng.randrange(5)))
+
+            diff = diff_blocks(_existing(old), new)
+
+            assert _signatures(_apply(_existing(old), diff)) == _signatures(new)
+            assert diff.call_count <= len(old) + len(new)
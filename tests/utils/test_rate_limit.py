@@ -0,0 +1,141 @@
+"""Rate Limit - ユニットテスト"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils import rate_limit
+from src.utils.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """time.sleep で進む時刻"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "sleep", fake.sleep)
+    return fake
+
+
+class TestTokenBucket:
+    """TokenBucket のテスト"""
+
+    def test_burst_then_rate(self, clock):
+        """容量分は即時、それ以降は rate 件/秒"""
+        bucket = TokenBucket(rate=3, clock=clock)
+
+        waits = [bucket.acquire() for _ in range(6)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3:] == pytest.approx([1 / 3] * 3)
+
+    def test_sustained_throughput(self, clock):
+        """連続した取得は rate 件/秒に収まる"""
+        bucket = TokenBucket(rate=3, clock=clock)
+
+        for _ in range(33):
+            bucket.acquire()
+
+        assert clock.now == pytest.approx(10.0)
+
+    def test_refill_after_idle(self, clock):
+        """空いた時間の分だけ補充される（容量まで）"""
+        bucket = TokenBucket(rate=3, clock=clock)
+        for _ in range(3):
+            bucket.acquire()
+
+        clock.now += 100
+
+        assert [bucket.acquire() for _ in range(4)][:3] == [0.0, 0.0, 0.0]
+
+    def test_pause(self, clock):
+        """pause() の間は取得を止め、再開後は空のバケットから補充"""
+        bucket = TokenBucket(rate=2, clock=clock)
+
+        bucket.pause(5)
+
+        assert bucket.acquire() == pytest.approx(5.5)
+        assert bucket.acquire() == pytest.approx(0.5)
+
+    def test_waiters_spaced_after_pause(self):
+        """停止前から待機していたスレッドも再開後は rate の間隔で取得する"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+        start = time.monotonic()
+        acquired: list[float] = []
+
+        def worker() -> None:
+            bucket.acquire()
+            acquired.append(time.monotonic() - start)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.02)
+        bucket.pause(0.3)
+        for thread in threads:
+            thread.join()
+
+        acquired.sort()
+        assert acquired[0] >= 0.3
+        assert [b - a for a, b in zip(acquired, acquired[1:])] == pytest.approx(
+            [0.05] * 3, abs=0.02
+        )
+
+    def test_tasks_spaced_after_pause(self):
+        """停止前から待機していたタスクも再開後は rate の間隔で取得する"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+
+        async def main() -> list[float]:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+
+            async def worker() -> float:
+                await bucket.acquire_async()
+                return loop.time() - start
+
+            tasks = [asyncio.create_task(worker()) for _ in range(4)]
+            await asyncio.sleep(0.02)
+            bucket.pause(0.3)
+            return sorted(await asyncio.gather(*tasks))
+
+        acquired = asyncio.run(main())
+
+        assert acquired[0] >= 0.3
+        assert [b - a for a, b in zip(acquired, acquired[1:])] == pytest.approx(
+            [0.05] * 3, abs=0.02
+        )
+
+    def test_shared_between_tasks(self):
+        """並行するタスク間で共有される"""
+        bucket = TokenBucket(rate=1_000, capacity=1)
+
+        async def main() -> list[float]:
+            return await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+
+        waits = asyncio.run(main())
+
+        assert sorted(waits) == pytest.approx(
+            [0.0, 0.001, 0.002, 0.003, 0.004], abs=5e-4
+        )
+
+    def test_invalid_arguments(self):
+        """rate が0以下、capacity が1未満ならValueError"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=0.5)
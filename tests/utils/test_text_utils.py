@@ -7,6 +7,7 @@ import pytest
 
 from src.utils.text_utils import (
     PROCESS_TO_APP_NAME,
+    KeywordCounter,
     calculate_rank,
     merge_keywords,
     normalize_app_name,
@@ -99,6 +100,57 @@ class TestMergeKeywords:
         assert result[0].lower() == "docker"
         assert len(result) == 3
 
+    def test_capacity_keeps_top_keywords(self):
+        """capacity 指定時も上位キーワードは正確な集計と一致"""
+        records = [{"keywords": ["Python", f"ocr{i}"]} for i in range(50)]
+        records += [{"keywords": ["API", "Docker"]} for _ in range(10)]
+
+        result = merge_keywords(records, capacity=3)
+
+        assert result[:3] == merge_keywords(records)[:3] == ["Python", "API", "Docker"]
+        assert len(result) <= 6
+
+    def test_limit_matches_full_sort(self):
+        """limit 指定時は全件ソートの先頭と同じ（同数は初出順）"""
+        records = [
+            {"keywords": ["b", "A", "c"]},
+            {"keywords": ["a", "D", "C", "e"]},
+            {"keywords": ["B", "f"]},
+        ]
+
+        full = merge_keywords(records)
+
+        for limit in range(len(full) + 2):
+            assert merge_keywords(records, limit=limit) == full[:limit]
+
+
+class TestKeywordCounter:
+    """KeywordCounterクラスのテスト"""
+
+    def test_incremental_update_matches_merge_keywords(self):
+        """逐次取り込みの結果がmerge_keywordsと一致"""
+        records = [
+            {"keywords": ["Python", "API"]},
+            {"keywords": ["python", "Testing"]},
+            {"keywords": ["API", "python", "Docker"]},
+        ]
+
+        counter = KeywordCounter()
+        for record in records:
+            counter.update(record["keywords"])
+
+        assert counter.most_common() == merge_keywords(records)
+        assert len(counter) == 4
+
+    def test_ignores_non_list_and_empty(self):
+        """リスト以外と空文字列は無視"""
+        counter = KeywordCounter()
+        counter.update(None)
+        counter.update("Python")
+        counter.update(["", "Python"])
+
+        assert counter.most_common() == ["Python"]
+
 
 class TestCalculateRank:
     """calculate_rank関数のテスト"""
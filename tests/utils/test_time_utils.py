@@ -11,8 +11,11 @@ from src.utils.time_utils import (
     JST,
     calculate_duration_min,
     filter_recent_records,
+    format_time_of_day,
     get_time_block,
     parse_ts,
+    parse_ts_epoch,
+    parse_ts_epoch_offset,
 )
 
 
@@ -48,6 +51,68 @@ class TestParseTs:
             parse_ts("invalid-timestamp")
 
 
+class TestParseTsEpoch:
+    """parse_ts_epoch / parse_ts_epoch_offset関数のテスト"""
+
+    @pytest.mark.parametrize(
+        "ts_str",
+        [
+            "2024-01-15T09:30:45+09:00",
+            "2024-01-15T09:30:45.123+09:00",
+            "2024-01-15T09:30:45.123456+09:00",
+            "2024-01-15T09:30:45.000+09:00",
+            "2024-01-15T00:30:45+00:00",
+            "2024-01-15T00:30:45-05:30",
+            "2024-01-15T00:30:45Z",
+            "2024-01-15T09:30:45.1+09:00",
+        ],
+    )
+    def test_matches_parse_ts(self, ts_str):
+        """parse_ts().timestamp() と同じ値（2回目以降のキャッシュ経由も同じ）"""
+        expected = parse_ts(ts_str).timestamp()
+
+        assert parse_ts_epoch(ts_str) == expected
+        assert parse_ts_epoch(ts_str) == expected
+
+    def test_returns_offset(self):
+        """UTCオフセット秒も返す"""
+        assert parse_ts_epoch_offset("2024-01-15T09:30:45+09:00") == (
+            1705278645,
+            32400,
+        )
+        assert parse_ts_epoch_offset("2024-01-15T09:30:45-05:30") == (
+            1705330845,
+            -19800,
+        )
+
+    def test_int_without_fraction(self):
+        """小数秒がなければint"""
+        assert isinstance(parse_ts_epoch("2024-01-15T09:30:45+09:00"), int)
+        assert isinstance(parse_ts_epoch("2024-01-15T09:30:45.500+09:00"), float)
+
+    @pytest.mark.parametrize(
+        "ts_str",
+        [
+            "invalid",
+            "2024-01-15T09:30:45",  # タイムゾーンなし
+            "2024-01-15T09:30:99+09:00",
+            "2024-01-15T09:30:4x+09:00",
+            "2024-01-15T09:30:45+09:0x",
+        ],
+    )
+    def test_invalid(self, ts_str):
+        """無効な形式はキャッシュ済みでもValueError"""
+        parse_ts_epoch("2024-01-15T09:30:00+09:00")  # 同じ分をキャッシュに載せる
+
+        with pytest.raises(ValueError):
+            parse_ts_epoch(ts_str)
+
+    def test_format_time_of_day(self):
+        """ローカル時刻のHH:MM:SSに変換（小数秒は切り捨て）"""
+        assert format_time_of_day(1705278645.9, 32400) == "09:30:45"
+        assert format_time_of_day(1705278645, 0) == "00:30:45"
+
+
 class TestFilterRecentRecords:
     """filter_recent_records関数のテスト"""
 
@@ -150,6 +215,24 @@ class TestGetTimeBlock:
         assert start == "10:45"
         assert end == "11:00"
 
+    def test_time_block_epoch(self):
+        """UNIX時刻とUTCオフセットからもdatetimeと同じブロックを返す"""
+        for ts_str in [
+            "2024-01-15T09:30:45+09:00",
+            "2024-01-15T23:45:00+09:00",
+            "2024-01-15T10:47:59.999+09:00",
+            "2024-01-15T00:10:00+00:00",
+        ]:
+            epoch, offset = parse_ts_epoch_offset(ts_str)
+            for block_min in (15, 30, 60, 90):
+                assert get_time_block(epoch, block_min, offset) == get_time_block(
+                    parse_ts(ts_str), block_min
+                )
+
+    def test_time_block_wraps_midnight(self):
+        """日付をまたぐ終了時刻は00:00"""
+        assert get_time_block(datetime(2024, 1, 15, 23, 45), 30) == ("23:30", "00:00")
+
 
 class TestCalculateDurationMin:
     """calculate_duration_min関数のテスト"""
@@ -199,3 +282,12 @@ class TestCalculateDurationMin:
         result = calculate_duration_min("invalid", "invalid")
 
         assert result == 1  # フォールバック値
+
+    def test_duration_epoch(self):
+        """UNIX時刻でも文字列と同じ結果"""
+        first = "2024-01-15T09:00:00+09:00"
+        last = "2024-01-15T09:10:00+09:00"
+
+        assert calculate_duration_min(
+            parse_ts_epoch(first), parse_ts_epoch(last)
+        ) == calculate_duration_min(first, last)